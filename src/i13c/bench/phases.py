@@ -0,0 +1,121 @@
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from i13c.bench.programs import ProgramShape, generate_program
+from i13c.core.diagnostics import Diagnostic
+from i13c.core.graph import GraphGroup
+from i13c.core.profile import GraphProfiler
+from i13c.core.result import Result, unwrap
+from i13c.encoding import elf, encode
+from i13c.graph.nodes import run
+from i13c.llvm.build import configure_llvm_graph
+from i13c.semantic.graph import configure_semantic_graph
+from i13c.semantic.syntax import configure_syntax_graph
+from i13c.syntax.lexing import tokenize
+from i13c.syntax.parsing import parse
+from i13c.syntax.source import open_text
+
+
+class InvalidProgramError(Exception):
+    def __init__(self, diagnostics: list[Diagnostic]) -> None:
+        self.diagnostics = diagnostics
+        super().__init__(f"generated program is invalid: {diagnostics[0].message}")
+
+
+PHASES = ["tokenize", "parse", "syntax", "semantic", "llvm", "encode", "emit"]
+
+
+@dataclass(kw_only=True)
+class BenchmarkResult:
+    shape: ProgramShape
+    lines: int
+    size: int
+
+    # best wall time of every phase, none when the phase did not run
+    phases: dict[str, float | None]
+
+    def to_json(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def run_benchmark(shape: ProgramShape, repeat: int = 3) -> BenchmarkResult:
+    text = generate_program(shape)
+    best: dict[str, float | None] = {phase: None for phase in PHASES}
+
+    for _ in range(max(repeat, 1)):
+        for phase, wall in measure_phases(text).items():
+            if wall is not None and (previous := best[phase]) is not None:
+                best[phase] = min(wall, previous)
+            elif wall is not None:
+                best[phase] = wall
+
+    return BenchmarkResult(
+        shape=shape,
+        lines=text.count("\n"),
+        size=len(text),
+        phases=best,
+    )
+
+
+def measure_phases(text: str) -> dict[str, float | None]:
+    timings: dict[str, float | None] = {phase: None for phase in PHASES}
+
+    def timed[T](phase: str, callback: Callable[[], T]) -> T:
+        start = time.perf_counter()
+        value = callback()
+
+        timings[phase] = time.perf_counter() - start
+        return value
+
+    code = open_text(text)
+    tokens = expect(timed("tokenize", lambda: tokenize(code)))
+    program = expect(timed("parse", lambda: parse(code, tokens)))
+
+    # graph phases are attributed from the node samples of a single run
+    profiler = GraphProfiler(memory=False)
+    artifacts = run(program, profiler=profiler)
+
+    for phase, group in find_groups().items():
+        samples = [x for x in profiler.samples if x.produces[0] in group]
+        timings[phase] = sum(sample.wall for sample in samples)
+
+    # the llvm graph is not produced for every program
+    if llvm := artifacts.data.get("llvm/graph"):
+        binary = timed("encode", lambda: encode(list(llvm.instructions_all())))
+        timed("emit", lambda: elf.emit(binary))
+
+    return timings
+
+
+def expect[A](result: Result[A, list[Diagnostic]]) -> A:
+    def fail(diagnostics: list[Diagnostic]) -> A:
+        raise InvalidProgramError(diagnostics)
+
+    return unwrap(result, fail)
+
+
+def find_groups() -> dict[str, set[str]]:
+    groups: dict[str, GraphGroup] = {
+        "syntax": configure_syntax_graph(),
+        "semantic": configure_semantic_graph(),
+        "llvm": configure_llvm_graph(),
+    }
+
+    return {
+        phase: {product for node in group.flatten() for product in node.produces}
+        for phase, group in groups.items()
+    }
+
+
+def compare_results(
+    result: BenchmarkResult, baseline: dict[str, Any]
+) -> dict[str, float | None]:
+    ratios: dict[str, float | None] = {}
+
+    for phase, wall in result.phases.items():
+        previous = baseline.get("phases", {}).get(phase)
+        ratios[phase] = wall / previous if wall is not None and previous else None
+
+    return ratios
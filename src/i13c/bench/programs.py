@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+
+# registers available for snippet arguments, rax and rcx are scratch ones
+ARGUMENT_REGISTERS = [b"rdi", b"rsi", b"rdx", b"r8", b"r9", b"r10", b"r11"]
+
+
+@dataclass(kw_only=True, frozen=True)
+class ProgramShape:
+    functions: int = 16
+    snippets: int = 4
+    depth: int = 4
+    branching: int = 1
+    arguments: int = 2
+    labels: int = 2
+
+
+def generate_program(shape: ProgramShape) -> str:
+    arguments = min(shape.arguments, len(ARGUMENT_REGISTERS))
+    labels = max(shape.labels, 1)
+    snippets = max(shape.snippets, 1)
+    depth = max(shape.depth, 1)
+
+    lines: list[str] = []
+    lines.extend(generate_exit())
+
+    for idx in range(snippets):
+        lines.extend(generate_snippet(idx, arguments, labels, shape.branching))
+
+    # functions form chains, each link calls the next one and a snippet
+    heads: list[int] = []
+
+    for idx in range(shape.functions):
+        if idx % depth == 0:
+            heads.append(idx)
+
+        last = idx % depth == depth - 1 or idx == shape.functions - 1
+        lines.extend(generate_function(idx, arguments, snippets, last))
+
+    lines.extend(generate_main(heads, arguments))
+    return "\n".join(lines) + "\n"
+
+
+def generate_exit() -> list[str]:
+    return [
+        "asm exit(code@imm: u8) noreturn clobbers rdi, rax {",
+        "    mov rdi, @code;",
+        "    mov rax, 0x3c;",
+        "    syscall;",
+        "}",
+        "",
+    ]
+
+
+def generate_snippet(
+    idx: int, arguments: int, labels: int, branching: int
+) -> list[str]:
+    registers = ARGUMENT_REGISTERS[:arguments]
+    slots = ", ".join(f"a{no}@{reg.decode()}: u64" for no, reg in enumerate(registers))
+    clobbers = ", ".join(["rax", "rcx", *[reg.decode() for reg in registers]])
+
+    lines = [f"asm snippet{idx}({slots}) clobbers {clobbers} {{"]
+    lines.append("    mov rcx, 0x10;")
+
+    for label in range(labels):
+        lines.append(f"  .label{label}:")
+        lines.append("    mov rax, rcx;")
+
+        for reg in registers:
+            lines.append(f"    or rax, {reg.decode()};")
+
+    # every branch loops back to one of the labels
+    for branch in range(branching):
+        lines.append(f"    loop @label{branch % labels};")
+
+    lines.append("}")
+    lines.append("")
+
+    return lines
+
+
+def generate_function(idx: int, arguments: int, snippets: int, last: bool) -> list[str]:
+    params = [f"p{no}" for no in range(arguments)]
+    signature = ", ".join(f"{param}: u64" for param in params)
+    values = ", ".join(params)
+
+    lines = [f"fn function{idx}({signature}) {{"]
+    lines.append(f"  val v{idx}: u64 = 0x{idx:08x};")
+    lines.append(f"  snippet{idx % snippets}({values});")
+
+    if not last:
+        lines.append(f"  function{idx + 1}({values});")
+
+    lines.append("}")
+    lines.append("")
+
+    return lines
+
+
+def generate_main(heads: list[int], arguments: int) -> list[str]:
+    values = ", ".join(f"0x{no + 1:016x}" for no in range(arguments))
+
+    lines = ["fn main() noreturn {"]
+
+    for head in heads:
+        lines.append(f"  function{head}({values});")
+
+    lines.append("  exit(0x00);")
+    lines.append("}")
+
+    return lines
@@ -4,13 +4,26 @@ from dataclasses import asdict
 
 import click
 
-from i13c.cli.core import BytesAsTextEncoder, emit_and_exit, unwrap_result
+from i13c.bench.phases import compare_results, run_benchmark
+from i13c.bench.programs import ProgramShape
+from i13c.cli.core import (
+    BytesAsTextEncoder,
+    emit_and_exit,
+    open_cache,
+    open_executor,
+    open_profiler,
+    save_profile,
+    unwrap_result,
+)
 from i13c.core.table import draw_table
-from i13c.encoding import elf, encode
+from i13c.encoding import assemble, elf, encode
+from i13c.encoding.link import link
 from i13c.graph.nodes import run as run_graph
+from i13c.semantic.typing.analyses.allocations import Allocator
 from i13c.syntax.lexing import TOKEN_NAMES, tokenize
 from i13c.syntax.parsing import parse
-from i13c.syntax.source import open_text
+from i13c.syntax.source import open_file
+from i13c.syntax.units import find_sources, open_sources, parse_files
 
 
 @click.group()
@@ -21,76 +34,222 @@ def i13c():
 @i13c.command("lex")
 @click.argument("path", type=click.Path(exists=True))
 def lex_command(path: str) -> None:
-    with open(path, "r", encoding="utf-8") as f:
-        text = f.read()
+    with open_file(path) as code:
+        tokens = unwrap_result(tokenize(code), source=code)
 
-    code = open_text(text)
-    tokens = unwrap_result(tokenize(code), source=code)
+        for token in tokens:
+            key = f"{token.code:03}:{token.offset:04}:{token.length:02}"
+            name = f"{TOKEN_NAMES[token.code]:<15}"
+            value = code.extract(token)
 
-    for token in tokens:
-        key = f"{token.code:03}:{token.offset:04}:{token.length:02}"
-        name = f"{TOKEN_NAMES[token.code]:<15}"
-        value = code.extract(token)
-
-        click.echo(f"{key}:{name} -> {value!r}")
+            click.echo(f"{key}:{name} -> {value!r}")
 
 
 @i13c.command("ast")
 @click.argument("path", type=click.Path(exists=True))
 def ast_command(path: str) -> None:
-    with open(path, "r", encoding="utf-8") as f:
-        text = f.read()
-
-    code = open_text(text)
-    tokens = unwrap_result(tokenize(code), source=code)
-    program = unwrap_result(parse(code, tokens), source=code)
+    with open_file(path) as code:
+        tokens = unwrap_result(tokenize(code), source=code)
+        program = unwrap_result(parse(code, tokens), source=code)
 
     click.echo(json.dumps(asdict(program), cls=BytesAsTextEncoder))
 
 
 @i13c.command("model")
-@click.argument("path", type=click.Path(exists=True))
+@click.argument("paths", nargs=-1, required=True, type=click.Path(exists=True))
 @click.argument("view-name", type=str, required=True)
-def model_command(path: str, view_name: str) -> None:
-    with open(path, "r", encoding="utf-8") as f:
-        text = f.read()
-
-    code = open_text(text)
-    tokens = unwrap_result(tokenize(code), source=code)
-    program = unwrap_result(parse(code, tokens), source=code)
-    artifacts = run_graph(program, target=view_name)
-
-    if view := artifacts.list_view(view_name):
-        rows = [view.rows(*entry) for entry in view.extract()]
-        table = draw_table(view.headers(), list(rows))
-
-        for line in table.entries:
-            click.echo(line)
+@click.option("--jobs", type=int, default=1, help="Number of graph workers.")
+@click.option("--pool", type=click.Choice(["thread", "process"]), default="thread")
+@click.option("--cache", type=click.Path(file_okay=False), help="Artifact cache.")
+@click.option("--profile", type=click.Path(dir_okay=False), help="Profile output.")
+@click.option("--profile-format", type=click.Choice(["json", "chrome"]), default="json")
+@click.option(
+    "--allocator", type=click.Choice(["coloring", "linear"]), default="coloring"
+)
+def model_command(
+    paths: tuple[str, ...],
+    view_name: str,
+    jobs: int,
+    pool: str,
+    cache: str | None,
+    profile: str | None,
+    profile_format: str,
+    allocator: Allocator,
+) -> None:
+    with (
+        open_sources(find_sources(paths)) as sources,
+        open_executor(jobs, pool) as executor,
+    ):
+        program = unwrap_result(parse_files(sources, executor), source=sources)
+        profiler = open_profiler(profile, jobs, pool)
+
+        artifacts = run_graph(
+            program,
+            target=view_name,
+            executor=executor,
+            cache=open_cache(cache),
+            profiler=profiler,
+            allocator=allocator,
+        )
+
+        if profile is not None:
+            save_profile(profiler, profile, profile_format)
+
+        if view := artifacts.list_view(view_name):
+            rows = [view.rows(*entry) for entry in view.extract()]
+            table = draw_table(view.headers(), list(rows))
+
+            for line in table.entries:
+                click.echo(line)
 
 
 @i13c.command("elf")
-@click.argument("path", type=click.Path(exists=True))
-def elf_command(path: str) -> None:
-    with open(path, "r", encoding="utf-8") as f:
-        text = f.read()
-
-    code = open_text(text)
-    tokens = unwrap_result(tokenize(code), source=code)
-
-    program = unwrap_result(parse(code, tokens), source=code)
-    artifacts = run_graph(program)
-
-    if artifacts.rules().count() > 0:
-        emit_and_exit(artifacts.rules().enumerate(), source=code)
-
-    llg = artifacts.llvm_graph()
-    assert llg is not None
-
-    flow = llg.instructions_all()
-    binary = encode(list(flow))
-    executable = elf.emit(binary)
-
-    with open("a.out", "wb") as f:
+@click.argument("paths", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option("--jobs", type=int, default=1, help="Number of graph workers.")
+@click.option("--pool", type=click.Choice(["thread", "process"]), default="thread")
+@click.option("--cache", type=click.Path(file_okay=False), help="Artifact cache.")
+@click.option("--profile", type=click.Path(dir_okay=False), help="Profile output.")
+@click.option("--profile-format", type=click.Choice(["json", "chrome"]), default="json")
+@click.option(
+    "--allocator", type=click.Choice(["coloring", "linear"]), default="coloring"
+)
+@click.option("--object", "relocatable", is_flag=True, help="Emit an object file.")
+@click.option("-o", "--output", type=click.Path(dir_okay=False), help="Output file.")
+def elf_command(
+    paths: tuple[str, ...],
+    jobs: int,
+    pool: str,
+    cache: str | None,
+    profile: str | None,
+    profile_format: str,
+    allocator: Allocator,
+    relocatable: bool,
+    output: str | None,
+) -> None:
+    with (
+        open_sources(find_sources(paths)) as sources,
+        open_executor(jobs, pool) as executor,
+    ):
+        program = unwrap_result(parse_files(sources, executor), source=sources)
+        profiler = open_profiler(profile, jobs, pool)
+
+        artifacts = run_graph(
+            program,
+            executor=executor,
+            cache=open_cache(cache),
+            profiler=profiler,
+            allocator=allocator,
+        )
+
+        if profile is not None:
+            save_profile(profiler, profile, profile_format)
+
+        if artifacts.rules().count() > 0:
+            emit_and_exit(artifacts.rules().enumerate(), source=sources)
+
+        llg = artifacts.llvm_graph()
+        assert llg is not None
+
+        flow = llg.instructions_all()
+
+        if relocatable:
+            # only the entrypoint is exported, other functions stay local,
+            # references to functions of other objects cannot be expressed yet
+            module = assemble(list(flow))
+            symbols = llg.symbols_of(artifacts.semantic_graph())
+            exports = {llg.entry.value}
+
+            with open(output or "a.o", "wb") as f:
+                f.write(elf.emit_object(module, symbols, exports))
+
+            return
+
+        binary = encode(list(flow))
+        executable = elf.emit(binary)
+        path = output or "a.out"
+
+        with open(path, "wb") as f:
+            f.write(executable)
+
+        os.chmod(path, 0o755)
+
+
+@i13c.command(
+    "link",
+    help="Link objects into an executable. Calls between i13c modules "
+    "cannot be declared yet, so at most one object may come from i13c.",
+)
+@click.argument("paths", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option("--entry", default="main", help="Entrypoint symbol.")
+@click.option("-o", "--output", default="a.out", help="Output file.")
+def link_command(paths: tuple[str, ...], entry: str, output: str) -> None:
+    objects = []
+
+    for path in paths:
+        with open(path, "rb") as f:
+            objects.append(elf.read_object(f.read()))
+
+    image = link(objects, entry.encode())
+    executable = elf.emit(image.code, image.entry)
+
+    with open(output, "wb") as f:
         f.write(executable)
 
-    os.chmod("a.out", 0o755)
+    os.chmod(output, 0o755)
+
+
+@i13c.command("bench")
+@click.option("--functions", type=int, default=16, help="Number of functions.")
+@click.option("--snippets", type=int, default=4, help="Number of asm snippets.")
+@click.option("--depth", type=int, default=4, help="Length of call chains.")
+@click.option("--branching", type=int, default=1, help="Branches per snippet.")
+@click.option("--arguments", type=int, default=2, help="Arguments per call.")
+@click.option("--labels", type=int, default=2, help="Labels per snippet.")
+@click.option("--repeat", type=int, default=3, help="Number of measured runs.")
+@click.option("--output", type=click.Path(dir_okay=False), help="Results output.")
+@click.option("--baseline", type=click.Path(exists=True), help="Results to compare.")
+def bench_command(
+    functions: int,
+    snippets: int,
+    depth: int,
+    branching: int,
+    arguments: int,
+    labels: int,
+    repeat: int,
+    output: str | None,
+    baseline: str | None,
+) -> None:
+    shape = ProgramShape(
+        functions=functions,
+        snippets=snippets,
+        depth=depth,
+        branching=branching,
+        arguments=arguments,
+        labels=labels,
+    )
+
+    result = run_benchmark(shape, repeat=repeat)
+    ratios: dict[str, float | None] = {}
+
+    if baseline is not None:
+        with open(baseline, "r", encoding="utf-8") as f:
+            ratios = compare_results(result, json.load(f))
+
+    if output is not None:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(result.to_json(), f, indent=2)
+
+    rows = [
+        {
+            "phase": phase,
+            "wall": f"{wall:.6f}" if wall is not None else "-",
+            "ratio": f"{ratio:.3f}" if (ratio := ratios.get(phase)) else "-",
+        }
+        for phase, wall in result.phases.items()
+    ]
+
+    headers = {"phase": "Phase", "wall": "Seconds", "ratio": "Baseline"}
+    click.echo(f"{result.lines} lines, {result.size} bytes")
+
+    for line in draw_table(headers, rows).entries:
+        click.echo(line)
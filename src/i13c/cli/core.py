@@ -1,14 +1,20 @@
 import json
+import os
 import sys
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from functools import partial
 from typing import Any, NoReturn
 
 import click
 
+import i13c
+from i13c.core.cache import ArtifactCache, digest_sources
 from i13c.core.diagnostics import Diagnostic, show
+from i13c.core.profile import GraphProfiler
 from i13c.core.result import Result, unwrap
-from i13c.syntax.source import SourceCode
+from i13c.syntax.source import SourceCode, SourceMap, Span
 
 
 class BytesAsTextEncoder(json.JSONEncoder):
@@ -20,21 +26,79 @@ class BytesAsTextEncoder(json.JSONEncoder):
 
 
 def emit_and_exit(
-    messages: Iterable[Diagnostic], /, source: SourceCode
+    messages: Iterable[Diagnostic], /, source: SourceCode | SourceMap
 ) -> NoReturn:
     for message in messages:
+        if isinstance(source, SourceCode):
+            code, location = source, ""
+        else:
+            entry = source.locate(message.ref.offset)
+            code, location = entry.code, f" in {entry.path}"
+
+            # diagnostics of a unit are shown relative to their own file
+            message = Diagnostic(
+                ref=Span(
+                    offset=message.ref.offset - entry.base,
+                    length=message.ref.length,
+                ),
+                code=message.code,
+                message=message.message,
+            )
+
         click.echo(
-            f"Error {message.code} at offset {message.ref.offset}: {message.message}"
+            f"Error {message.code}{location} at offset {message.ref.offset}: {message.message}"
         )
 
         click.echo("\n")
-        click.echo(show(source, message))
+        click.echo(show(code, message))
         click.echo("\n")
 
     sys.exit(1)
 
 
 def unwrap_result[A](
-    result: Result[A, list[Diagnostic]], /, source: SourceCode
+    result: Result[A, list[Diagnostic]], /, source: SourceCode | SourceMap
 ) -> A:
     return unwrap(result, partial(emit_and_exit, source=source))
+
+
+@contextmanager
+def open_executor(jobs: int, pool: str) -> Iterator[Executor | None]:
+    if jobs <= 1:
+        yield None
+        return
+
+    if pool == "process":
+        executor: Executor = ProcessPoolExecutor(max_workers=jobs)
+    else:
+        executor = ThreadPoolExecutor(max_workers=jobs)
+
+    # workers are shut down with the command, even when it exits early
+    with executor:
+        yield executor
+
+
+def open_cache(path: str | None) -> ArtifactCache | None:
+    if path is None:
+        return None
+
+    root = os.path.dirname(i13c.__file__)
+    return ArtifactCache(path=path, salt=digest_sources(root))
+
+
+def open_profiler(path: str | None, jobs: int, pool: str) -> GraphProfiler | None:
+    if path is None:
+        return None
+
+    # concurrent threads share one allocation tracer, their peaks would mix
+    return GraphProfiler(memory=jobs <= 1 or pool == "process")
+
+
+def save_profile(profiler: GraphProfiler | None, path: str, format: str) -> None:
+    if profiler is None:
+        return
+
+    data = profiler.to_chrome() if format == "chrome" else profiler.to_json()
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
@@ -0,0 +1,46 @@
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+
+# bit positions set within each byte value
+TABLE_BYTE_BITS = [
+    tuple(index for index in range(8) if byte >> index & 1) for byte in range(256)
+]
+
+
+def encode_bits(items: Iterable[int]) -> int:
+    bits = 0
+
+    for item in items:
+        bits |= 1 << item
+
+    return bits
+
+
+def decode_bits(bits: int) -> set[int]:
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+
+    # walking bytes through a lookup table beats shifting out single bits
+    return {
+        (offset << 3) + index
+        for offset, byte in enumerate(data)
+        if byte
+        for index in TABLE_BYTE_BITS[byte]
+    }
+
+
+@dataclass(kw_only=True, eq=False)
+class BitSets(Mapping[int, set[int]]):
+    # dense index -> bit vector, decoded only when a set is requested
+    bits: list[int]
+
+    def __getitem__(self, key: int) -> set[int]:
+        if not 0 <= key < len(self.bits):
+            raise KeyError(key)
+
+        return decode_bits(self.bits[key])
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self.bits)))
+
+    def __len__(self) -> int:
+        return len(self.bits)
@@ -0,0 +1,160 @@
+import marshal
+import os
+import pickle
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from hashlib import sha256
+from io import BytesIO
+from tempfile import NamedTemporaryFile
+from typing import Any
+
+# immutable leaves never need identity restoration, so they are never referenced
+ATOMIC_TYPES = (type(None), bool, int, float, str, bytes)
+
+
+class MissingOwnerError(Exception):
+    def __init__(self, digest: str) -> None:
+        self.digest = digest
+        super().__init__(f"no payload found for digest {digest}")
+
+
+@dataclass(kw_only=True)
+class CacheEntry:
+    dataset: Any
+    states: dict[str, dict[str, Any]]
+
+
+@dataclass(kw_only=True)
+class ArtifactRegistry:
+    # payload digest -> memo index -> object
+    tables: dict[str, dict[int, Any]] = field(default_factory=dict)
+
+    # object id -> first payload digest and memo index owning the object
+    owners: dict[int, tuple[str, int]] = field(default_factory=dict)
+
+    def register(self, digest: str, memo: Iterable[tuple[int, Any]]) -> None:
+        table = self.tables.setdefault(digest, {})
+
+        # the table keeps objects alive, so their ids cannot be reused
+        for idx, obj in memo:
+            if not isinstance(obj, ATOMIC_TYPES):
+                table[idx] = obj
+                self.owners.setdefault(id(obj), (digest, idx))
+
+    def survey(self, value: Any) -> str:
+        buffer = BytesIO()
+        pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+        pickler.dump(value)
+
+        digest = sha256(buffer.getvalue()).hexdigest()
+        self.register(digest, pickler.memo.copy().values())
+
+        return digest
+
+
+class ReferencePickler(pickle.Pickler):
+    def __init__(self, file: BytesIO, registry: ArtifactRegistry) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.registry = registry
+
+    def persistent_id(self, obj: Any) -> Any:
+        # objects owned by other payloads are stored as references, not copies
+        if isinstance(obj, ATOMIC_TYPES):
+            return None
+
+        return self.registry.owners.get(id(obj))
+
+
+class ReferenceUnpickler(pickle.Unpickler):
+    def __init__(self, file: BytesIO, registry: ArtifactRegistry) -> None:
+        super().__init__(file)
+        self.registry = registry
+
+    def persistent_load(self, pid: Any) -> Any:
+        digest, idx = pid
+
+        if (table := self.registry.tables.get(digest)) is None:
+            raise MissingOwnerError(digest)
+
+        return table[idx]
+
+
+def digest_sources(root: str) -> str:
+    digest = sha256()
+
+    # any change of the compiler sources must invalidate all entries
+    for directory, _, files in sorted(os.walk(root)):
+        for name in sorted(files):
+            if name.endswith(".py"):
+                with open(os.path.join(directory, name), "rb") as f:
+                    digest.update(name.encode())
+                    digest.update(f.read())
+
+    return digest.hexdigest()
+
+
+def identify(builder: Callable[..., Any], produces: Iterable[str]) -> str:
+    digest = sha256()
+    digest.update(f"{builder.__module__}.{builder.__qualname__}".encode())
+
+    # editing the builder body changes its code object
+    if code := getattr(builder, "__code__", None):
+        digest.update(marshal.dumps(code))
+
+    for product in produces:
+        digest.update(product.encode())
+
+    return digest.hexdigest()
+
+
+@dataclass(kw_only=True)
+class ArtifactCache:
+    path: str
+    salt: str = ""
+
+    def key(self, identity: str, inputs: list[tuple[str, str]]) -> str:
+        digest = sha256(self.salt.encode())
+        digest.update(identity.encode())
+
+        for name, value in sorted(inputs):
+            digest.update(f"{name}={value};".encode())
+
+        return digest.hexdigest()
+
+    def locate(self, key: str) -> str:
+        return os.path.join(self.path, key[:2], key[2:])
+
+    def load(self, key: str, registry: ArtifactRegistry) -> CacheEntry | None:
+        try:
+            with open(self.locate(key), "rb") as f:
+                states, payload = pickle.load(f)
+
+            unpickler = ReferenceUnpickler(BytesIO(payload), registry)
+            dataset = unpickler.load()
+
+        # a referenced payload from a different run is as good as no entry
+        except OSError, EOFError, pickle.UnpicklingError, MissingOwnerError:
+            return None
+
+        digest = sha256(payload).hexdigest()
+        registry.register(digest, unpickler.memo.copy().items())
+
+        return CacheEntry(dataset=dataset, states=states)
+
+    def save(self, key: str, registry: ArtifactRegistry, entry: CacheEntry) -> None:
+        buffer = BytesIO()
+        pickler = ReferencePickler(buffer, registry)
+        pickler.dump(entry.dataset)
+
+        payload = buffer.getvalue()
+        location = self.locate(key)
+        os.makedirs(os.path.dirname(location), exist_ok=True)
+
+        # write atomically to never expose partial entries to other processes
+        with NamedTemporaryFile(dir=os.path.dirname(location), delete=False) as f:
+            pickle.dump((entry.states, payload), f)
+
+        os.replace(f.name, location)
+
+        digest = sha256(payload).hexdigest()
+        registry.register(digest, pickler.memo.copy().values())
@@ -0,0 +1,215 @@
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Literal
+
+type Direction = Literal["forward", "backward"]
+type Meet = Literal["union", "intersection"]
+
+
+@dataclass(kw_only=True)
+class DataflowGraph:
+    size: int
+
+    # nodes the traversal starts from, the rest is visited afterwards
+    roots: list[int]
+
+    # Node -> Nodes
+    forward: Mapping[int, Iterable[int]]
+    backward: Mapping[int, Iterable[int]]
+
+    @staticmethod
+    def instance(
+        size: int, roots: list[int], forward: Mapping[int, Iterable[int]]
+    ) -> DataflowGraph:
+        backward: dict[int, list[int]] = {node: [] for node in range(size)}
+
+        for node, successors in forward.items():
+            for successor in successors:
+                backward[successor].append(node)
+
+        return DataflowGraph(size=size, roots=roots, forward=forward, backward=backward)
+
+
+@dataclass(kw_only=True)
+class DataflowProblem:
+    direction: Direction
+    meet: Meet
+
+    # Node -> bit vector generated and killed by the node
+    gen: list[int]
+    kill: list[int]
+
+    # value flowing into nodes without incoming edges
+    boundary: int = 0
+
+    # top of the lattice, the optimistic start of an intersection
+    universe: int = 0
+
+
+@dataclass(kw_only=True)
+class DataflowResult:
+    # values before and after each node, following the direction of the problem
+    before: list[int]
+    after: list[int]
+
+
+def order_postorder(graph: DataflowGraph) -> list[int]:
+    visited = [False] * graph.size
+
+    # unreachable nodes still need their own fixpoint
+    return visit_postorder(graph, [*graph.roots, *range(graph.size)], visited)
+
+
+def order_reachable(graph: DataflowGraph) -> list[int]:
+    visited = [False] * graph.size
+
+    # only nodes reachable from the roots, in reverse postorder
+    return visit_postorder(graph, graph.roots, visited)[::-1]
+
+
+def visit_postorder(
+    graph: DataflowGraph, roots: Iterable[int], visited: list[bool]
+) -> list[int]:
+    order: list[int] = []
+
+    for root in roots:
+        if visited[root]:
+            continue
+
+        visited[root] = True
+        stack = [(root, iter(graph.forward.get(root, [])))]
+
+        while stack:
+            node, successors = stack[-1]
+
+            for successor in successors:
+                if not visited[successor]:
+                    visited[successor] = True
+                    stack.append((successor, iter(graph.forward.get(successor, []))))
+                    break
+
+            else:
+                stack.pop()
+                order.append(node)
+
+    return order
+
+
+def find_components[T](
+    nodes: Iterable[T], successors: Callable[[T], Iterable[T]]
+) -> list[list[T]]:
+    index: dict[T, int] = {}
+    lowlink: dict[T, int] = {}
+
+    stack: list[T] = []
+    onstack: set[T] = set()
+    components: list[list[T]] = []
+
+    # tarjan emits a component only after all components reachable from it
+    for root in nodes:
+        if root in index:
+            continue
+
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        onstack.add(root)
+        work = [(root, iter(successors(root)))]
+
+        while work:
+            node, iterator = work[-1]
+
+            for successor in iterator:
+                if successor not in index:
+                    index[successor] = lowlink[successor] = len(index)
+                    stack.append(successor)
+                    onstack.add(successor)
+                    work.append((successor, iter(successors(successor))))
+                    break
+
+                if successor in onstack:
+                    lowlink[node] = min(lowlink[node], index[successor])
+
+            else:
+                work.pop()
+
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                if lowlink[node] == index[node]:
+                    component: list[T] = []
+
+                    while True:
+                        member = stack.pop()
+                        onstack.discard(member)
+                        component.append(member)
+
+                        if member == node:
+                            break
+
+                    components.append(component)
+
+    return components
+
+
+def propagate[T](
+    order: Iterable[T],
+    dependents: Mapping[T, Iterable[T]],
+    update: Callable[[T], bool],
+) -> None:
+    worklist = deque(order)
+    pending = set(worklist)
+
+    # iterate until no changes occur
+    while worklist:
+        node = worklist.popleft()
+        pending.discard(node)
+
+        # only a changed node can change its dependents
+        if update(node):
+            for dependent in dependents.get(node, []):
+                if dependent not in pending:
+                    pending.add(dependent)
+                    worklist.append(dependent)
+
+
+def solve(graph: DataflowGraph, problem: DataflowProblem) -> DataflowResult:
+    if problem.direction == "backward":
+        sources, dependents = graph.forward, graph.backward
+        order = order_postorder(graph)
+    else:
+        sources, dependents = graph.backward, graph.forward
+        order = order_postorder(graph)[::-1]
+
+    # union grows from the bottom, intersection shrinks from the top
+    start = 0 if problem.meet == "union" else problem.universe
+    before = [start] * graph.size
+    after = [start] * graph.size
+
+    gen, kill = problem.gen, problem.kill
+    union = problem.meet == "union"
+
+    def update(node: int) -> bool:
+        incoming = None
+
+        for source in sources.get(node, []):
+            if incoming is None:
+                incoming = after[source]
+            elif union:
+                incoming |= after[source]
+            else:
+                incoming &= after[source]
+
+        before[node] = problem.boundary if incoming is None else incoming
+        outgoing = gen[node] | (before[node] & ~kill[node])
+
+        if outgoing == after[node]:
+            return False
+
+        after[node] = outgoing
+        return True
+
+    # successors settle first in a backward problem, predecessors in a forward one
+    propagate(order, dependents, update)
+    return DataflowResult(before=before, after=after)
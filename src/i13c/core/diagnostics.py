@@ -15,12 +15,7 @@ def show(source: SourceCode, diagnostic: Diagnostic) -> str:
     # sanity check to ensure diagnostics always have a message
     assert diagnostic.message, "Diagnostic message cannot be empty"
 
-    start = source.data.rfind(b"\n", 0, diagnostic.ref.offset)
-    end = source.data.find(b"\n", diagnostic.ref.offset)
-
-    start = 0 if start == -1 else start + 1
-    end = len(source.data) if end == -1 else end
-    line = source.data[start:end]
+    start, line = source.line(diagnostic.ref.offset)
 
     # respect zero-length spans by showing a single caret
     # and avoid drawing carets beyond the current line for multi-line spans
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from hashlib import blake2b
 
 
 @dataclass(kw_only=True)
@@ -8,3 +9,8 @@ class Generator:
     def next(self) -> int:
         self.id += 1
         return self.id
+
+    def scope(self, key: bytes) -> Generator:
+        # scoped ids derive from the key only, edits elsewhere keep them stable
+        digest = blake2b(key, digest_size=8).digest()
+        return Generator(id=(int.from_bytes(digest) + 1) << 32)
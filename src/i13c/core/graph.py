@@ -1,10 +1,16 @@
 from collections import defaultdict
 from collections.abc import Callable, Iterable
-from dataclasses import dataclass
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from functools import partial
+from hashlib import sha256
 from logging import Logger, getLogger
 from typing import Any
 
+from i13c.core.cache import ArtifactCache, ArtifactRegistry, CacheEntry, identify
 from i13c.core.extractors import AbstractListExtractor
+from i13c.core.mapping import OneToMany, OneToOne
+from i13c.core.profile import GraphProfiler, GraphSample, measure, tracing
 
 
 class CyclicDependencyError(Exception):
@@ -71,6 +77,9 @@ class GraphNode:
     requires: Requirement
     views: GraphViews | None = None
 
+    # argument whose keys the builder maps one by one, all maps share the keys
+    partition: str | None = None
+
 
 @dataclass(kw_only=True, eq=False)
 class GraphGroup:
@@ -88,6 +97,25 @@ class GraphGroup:
         return out
 
 
+@dataclass(kw_only=True)
+class GraphRecord:
+    inputs: dict[str, Any]
+    states: dict[str, dict[str, Any]]
+    dataset: Any
+
+
+@dataclass(kw_only=True)
+class GraphSession:
+    # last recorded build of every node keyed by its products
+    records: dict[tuple[str, ...], GraphRecord] = field(default_factory=dict)
+
+    def find(self, node: GraphNode) -> GraphRecord | None:
+        return self.records.get(node.produces)
+
+    def record(self, node: GraphNode, record: GraphRecord) -> None:
+        self.records[node.produces] = record
+
+
 def reorder_configurations(nodes: list[GraphNode]) -> list[GraphNode]:
     # build producer map
     producer: dict[str, GraphNode] = {}
@@ -146,19 +174,89 @@ def reorder_configurations(nodes: list[GraphNode]) -> list[GraphNode]:
     return out
 
 
+def find_requirements(req: str | Prefix, names: Iterable[str]) -> list[str]:
+    return list(req.find(names)) if isinstance(req, Prefix) else [req]
+
+
+def find_closure(nodes: list[GraphNode], targets: set[str]) -> list[GraphNode]:
+    producer: dict[str, GraphNode] = {}
+
+    for node in nodes:
+        for product in node.produces:
+            if product in producer:
+                raise DuplicateArtifactError(product, [producer[product], node])
+
+            producer[product] = node
+
+    # walk requirements backwards starting from target producers
+    worklist = [producer[target] for target in targets if target in producer]
+    visited: set[GraphNode] = set(worklist)
+
+    while worklist:
+        node = worklist.pop()
+
+        for _, req in node.requires:
+            for item in find_requirements(req, producer):
+                if (dep := producer.get(item)) and dep not in visited:
+                    visited.add(dep)
+                    worklist.append(dep)
+
+    # keep original order to preserve deterministic sorting
+    return [node for node in nodes if node in visited]
+
+
+def schedule_waves(
+    nodes: list[GraphNode], serial: frozenset[str] = frozenset()
+) -> list[list[GraphNode]]:
+    ordered = reorder_configurations(nodes)
+    producer = {product: node for node in ordered for product in node.produces}
+
+    levels: dict[GraphNode, int] = {}
+    waves: list[list[GraphNode]] = []
+
+    # serial nodes are chained to keep their sequential order
+    chained = -1
+
+    # topological order guarantees all dependencies are already leveled
+    for node in ordered:
+        level = 0
+
+        for _, req in node.requires:
+            for item in find_requirements(req, producer):
+                level = max(level, levels[producer[item]] + 1)
+
+        if is_serial(node, serial):
+            level = chained = max(level, chained + 1)
+
+        if level == len(waves):
+            waves.append([])
+
+        levels[node] = level
+        waves[level].append(node)
+
+    return waves
+
+
+def is_serial(node: GraphNode, serial: frozenset[str]) -> bool:
+    return any(isinstance(req, str) and req in serial for _, req in node.requires)
+
+
 def evaluate(
     nodes: list[GraphNode],
     initial: dict[str, Any],
     targets: set[str] | None = None,
+    executor: Executor | None = None,
+    serial: frozenset[str] = frozenset(),
+    cache: ArtifactCache | None = None,
+    session: GraphSession | None = None,
+    profiler: GraphProfiler | None = None,
 ) -> tuple[dict[str, GraphViews], dict[str, Any]]:
     artifacts: dict[str, Any] = {}
+    digests: dict[str, str] = {}
     views: dict[str, GraphViews] = {}
 
     logger: Logger = getLogger("dag")
 
-    def seed(value: Any) -> Callable[[], Any]:
-        return lambda: value
-
     # make copy to avoid mutating input list`
     nodes = list(nodes)
 
@@ -166,50 +264,351 @@ def evaluate(
     for key, value in initial.items():
         nodes.append(
             GraphNode(
-                builder=seed(value),
+                builder=partial(seed, value),
                 constraint=None,
                 produces=(key,),
                 requires=frozenset(),
             )
         )
 
-    def expand(req: str | Prefix) -> Any | None:
+    # pull only nodes the targets transitively depend on
+    if targets:
+        nodes = find_closure(nodes, targets)
+
+    registry = ArtifactRegistry()
+
+    # seeds are identified by content, produced artifacts by their node keys
+    if cache is not None:
+        for key, value in initial.items():
+            digests[key] = registry.survey(value)
+
+    # without executor every node forms its own wave
+    if executor is None:
+        waves = [[node] for node in reorder_configurations(nodes)]
+    else:
+        waves = schedule_waves(nodes, serial)
+
+    # allocations are traced only while the nodes are being built
+    with tracing(profiler):
+        for wave in waves:
+            pending: list[tuple[GraphNode, Callable[[], Any]]] = []
+
+            for node in wave:
+                for target in node.produces:
+                    logger.info(f"producing {target} ...")
+
+                if node.views is not None:
+                    views[node.produces[0]] = node.views
+
+                # prepare arguments
+                args = {name: expand(req, artifacts) for name, req in node.requires}
+                ready = all(arg is not None for arg in args.values())
+
+                # optionally build dataset
+                if not ready or (node.constraint and not node.constraint(**args)):
+                    continue
+
+                inputs: dict[str, Any] = {}
+                record: GraphRecord | None = None
+                patch: tuple[set[Any], list[Any]] | None = None
+                builder: Callable[[], Any] | None = None
+
+                # seeds are never tracked, they are compared by their consumers
+                if session is not None and node.requires:
+                    inputs = {
+                        item: snapshot(item, artifacts, serial)
+                        for _, req in node.requires
+                        for item in find_requirements(req, artifacts.keys())
+                    }
+
+                    if (record := session.find(node)) is not None:
+                        if is_same(inputs, record.inputs):
+                            restore(record.states, artifacts)
+                            builder = partial(seed, record.dataset)
+
+                        # only changed keys are rebuilt by partitioned nodes
+                        elif node.partition and not is_serial(node, serial):
+                            if narrowed := narrow(node, record, args):
+                                partitioned = args[node.partition]
+                                assert partitioned is not None
+
+                                order = list(partitioned.keys())
+                                patch, args = (narrowed[0], order), narrowed[1]
+
+                key: str | None = None
+
+                # seeds are never cached, they are already the inputs
+                if cache is not None and node.requires:
+                    names = {
+                        item
+                        for _, req in node.requires
+                        for item in find_requirements(req, artifacts.keys())
+                    }
+
+                    identity = identify(node.builder, node.produces)
+                    fingerprints = [
+                        (name, fingerprint(name, artifacts, digests, serial, registry))
+                        for name in names
+                    ]
+                    key = cache.key(identity, fingerprints)
+
+                    for product in node.produces:
+                        digest = sha256(f"{key}/{product}".encode())
+                        digests[product] = digest.hexdigest()
+
+                    if builder is None and (entry := cache.load(key, registry)):
+                        restore(entry.states, artifacts)
+                        builder, patch = partial(seed, entry.dataset), None
+
+                if builder is None:
+                    target = node.builder
+
+                    # measured builders return the sample next to the dataset
+                    if profiler is not None and node.requires:
+                        target = partial(
+                            measure, node.produces, profiler.memory, node.builder
+                        )
+
+                    # seeds and nodes sharing mutable artifacts stay on the caller
+                    if (
+                        executor is not None
+                        and len(wave) > 1
+                        and node.requires
+                        and not is_serial(node, serial)
+                    ):
+                        builder = executor.submit(target, **args).result
+                    else:
+                        builder = partial(target, **args)
+
+                    if profiler is not None and node.requires:
+                        builder = partial(collect, profiler, logger, builder)
+
+                    if patch is not None and record is not None:
+                        builder = partial(complete, patch, record.dataset, builder)
+
+                    if cache is not None and key is not None:
+                        builder = partial(
+                            remember,
+                            cache,
+                            registry,
+                            key,
+                            node,
+                            builder,
+                            artifacts,
+                            serial,
+                        )
+
+                if session is not None and node.requires:
+                    builder = partial(
+                        track, session, node, inputs, record, builder, artifacts, serial
+                    )
+
+                pending.append((node, builder))
+
+            # merge results in the wave order to stay deterministic
+            for node, dataset in pending:
+                store(node, dataset(), artifacts)
+
+            if targets and all(target in artifacts for target in targets):
+                break
+
+    return views, artifacts
+
+
+def seed(value: Any) -> Any:
+    return value
+
+
+def expand(req: str | Prefix, artifacts: dict[str, Any]) -> Any | None:
+    if isinstance(req, Prefix):
+        return {key: artifacts[key] for key in req.find(artifacts.keys())} or None
+    else:
+        return artifacts.get(req, None)
+
+
+def fingerprint(
+    name: str,
+    artifacts: dict[str, Any],
+    digests: dict[str, str],
+    serial: frozenset[str],
+    registry: ArtifactRegistry,
+) -> str:
+    # mutable artifacts change between nodes and cannot be memoized
+    if name in serial:
+        return registry.survey(artifacts[name])
+
+    return digests[name]
+
+
+def snapshot(name: str, artifacts: dict[str, Any], serial: frozenset[str]) -> Any:
+    # mutable artifacts are compared by their state before the node
+    if name in serial:
+        return dict(vars(artifacts[name]))
+
+    return artifacts[name]
+
+
+def capture(
+    node: GraphNode, artifacts: dict[str, Any], serial: frozenset[str]
+) -> dict[str, dict[str, Any]]:
+    # state of mutable artifacts left behind by the node
+    return {
+        req: dict(vars(artifacts[req]))
+        for _, req in node.requires
+        if isinstance(req, str) and req in serial
+    }
+
+
+def restore(states: dict[str, dict[str, Any]], artifacts: dict[str, Any]) -> None:
+    for name, state in states.items():
+        vars(artifacts[name]).update(state)
+
+
+def narrow(
+    node: GraphNode, record: GraphRecord, args: dict[str, Any]
+) -> tuple[set[Any], dict[str, Any]] | None:
+    assert node.partition is not None
+    changed: set[Any] = set()
+
+    for name, req in node.requires:
+        # prefixed requirements are never narrowed
         if isinstance(req, Prefix):
-            return {key: artifacts[key] for key in req.find(artifacts.keys())} or None
-        else:
-            return artifacts.get(req, None)
+            return None
 
-    for node in reorder_configurations(nodes):
-        for target in node.produces:
-            logger.info(f"producing {target} ...")
+        arg, previous = args[name], record.inputs.get(req)
 
-        if node.views is not None:
-            views[node.produces[0]] = node.views
+        # only maps can be split, anything else must stay the same
+        if isinstance(arg, OneToOne | OneToMany):
+            if previous is None or type(arg) is not type(previous):
+                return None
 
-        # prepare arguments
-        args = {name: expand(req) for name, req in node.requires}
-        ready = all(arg is not None for arg in args.values())
+            changed.update(arg.delta(previous))
 
-        # optionally build dataset
-        if ready and (not node.constraint or node.constraint(**args)):
-            dataset = node.builder(**args)
+        elif not is_same(arg, previous):
+            return None
 
-            if not isinstance(dataset, tuple):
-                dataset = (dataset,)
-            else:
-                dataset = tuple(dataset)  # type: ignore
+    narrowed = {
+        name: arg.subset(changed) if isinstance(arg, OneToOne | OneToMany) else arg
+        for name, arg in args.items()
+    }
 
-            if len(dataset) != len(node.produces):
-                raise InvalidDatasetArityError(
-                    node=node,
-                    expected=len(node.produces),
-                    actual=len(dataset),
-                )
+    return changed, narrowed
 
-            for idx, producer in enumerate(node.produces):
-                artifacts[producer] = dataset[idx]
 
-        if targets and all(target in artifacts for target in targets):
-            break
+def collect(
+    profiler: GraphProfiler,
+    logger: Logger,
+    builder: Callable[[], tuple[Any, GraphSample]],
+) -> Any:
+    dataset, sample = builder()
+    profiler.record(sample, dataset)
 
-    return views, artifacts
+    for target in sample.produces:
+        logger.info(f"produced {target} in {sample.wall:.6f}s")
+
+    return dataset
+
+
+def complete(
+    patch: tuple[set[Any], list[Any]],
+    previous: Any,
+    builder: Callable[[], Any],
+) -> Any:
+    # entries of unchanged keys are taken from the previous build
+    return merge(patch[1], patch[0], builder(), previous)
+
+
+def remember(
+    cache: ArtifactCache,
+    registry: ArtifactRegistry,
+    key: str,
+    node: GraphNode,
+    builder: Callable[[], Any],
+    artifacts: dict[str, Any],
+    serial: frozenset[str],
+) -> Any:
+    dataset = builder()
+    states = capture(node, artifacts, serial)
+
+    cache.save(key, registry, CacheEntry(dataset=dataset, states=states))
+    return dataset
+
+
+def track(
+    session: GraphSession,
+    node: GraphNode,
+    inputs: dict[str, Any],
+    record: GraphRecord | None,
+    builder: Callable[[], Any],
+    artifacts: dict[str, Any],
+    serial: frozenset[str],
+) -> Any:
+    dataset = builder()
+
+    # equal results are replaced to let downstream nodes cut off early
+    if record is not None:
+        dataset = share(node, dataset, record.dataset)
+
+    states = capture(node, artifacts, serial)
+    session.record(node, GraphRecord(inputs=inputs, states=states, dataset=dataset))
+
+    return dataset
+
+
+def is_same(left: Any, right: Any) -> bool:
+    return left is right or left == right
+
+
+def merge(order: list[Any], changed: set[Any], dataset: Any, previous: Any) -> Any:
+    data = {
+        key: dataset.data[key] if key in changed else previous.data[key]
+        for key in order
+        if key in (dataset.data if key in changed else previous.data)
+    }
+
+    return type(dataset)(data=data)
+
+
+def share(node: GraphNode, dataset: Any, previous: Any) -> Any:
+    if len(node.produces) == 1:
+        return share_artifact(dataset, previous)
+
+    # multi-artifact datasets are shared one by one
+    if (
+        isinstance(dataset, tuple)
+        and isinstance(previous, tuple)
+        and len(dataset) == len(previous)
+    ):
+        return tuple(map(share_artifact, dataset, previous))
+
+    return dataset
+
+
+def share_artifact(value: Any, previous: Any) -> Any:
+    if is_same(value, previous):
+        return previous
+
+    # maps share their unchanged entries to keep per-key comparisons cheap
+    if isinstance(value, OneToOne | OneToMany) and type(value) is type(previous):
+        for key, entry in value.data.items():
+            if key in previous.data and is_same(entry, previous.data[key]):
+                value.data[key] = previous.data[key]
+
+    return value
+
+
+def store(node: GraphNode, dataset: Any, artifacts: dict[str, Any]) -> None:
+    if not isinstance(dataset, tuple):
+        dataset = (dataset,)
+    else:
+        dataset = tuple(dataset)  # type: ignore
+
+    if len(dataset) != len(node.produces):
+        raise InvalidDatasetArityError(
+            node=node,
+            expected=len(node.produces),
+            actual=len(dataset),
+        )
+
+    for idx, producer in enumerate(node.produces):
+        artifacts[producer] = dataset[idx]
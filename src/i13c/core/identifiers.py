@@ -0,0 +1,85 @@
+from collections.abc import Callable
+from typing import Any, Self
+
+
+class Identifier(int):
+    __slots__ = ()
+
+    def __new__(cls, *, value: int) -> Self:
+        return int.__new__(cls, value)
+
+    @property
+    def value(self) -> int:
+        return int(self)
+
+    # unpickled and copied identifiers are built with the keyword value too
+    def __getnewargs_ex__(self) -> tuple[tuple[()], dict[str, int]]:
+        return (), {"value": int(self)}
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
+        # equal values of different kinds never identify the same node
+        return type(self) is type(other) and int.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self.__eq__(other)
+
+    __hash__ = int.__hash__
+
+    # identifiers are ordered only among their own kind
+    def __lt__(self, other: object) -> bool:
+        if type(self) is not type(other):
+            return NotImplemented
+
+        return int.__lt__(self, other)  # type: ignore
+
+    def __le__(self, other: object) -> bool:
+        if type(self) is not type(other):
+            return NotImplemented
+
+        return int.__le__(self, other)  # type: ignore
+
+    def __gt__(self, other: object) -> bool:
+        if type(self) is not type(other):
+            return NotImplemented
+
+        return int.__gt__(self, other)  # type: ignore
+
+    def __ge__(self, other: object) -> bool:
+        if type(self) is not type(other):
+            return NotImplemented
+
+        return int.__ge__(self, other)  # type: ignore
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(value={int(self)})"
+
+    __str__ = __repr__
+
+
+def guard(operator: Callable[[int, Any], Any]) -> Callable[[Identifier, Any], Any]:
+    def method(self: Identifier, other: Any) -> Any:
+        # arithmetic never mixes identifiers of different kinds
+        if isinstance(other, Identifier) and type(self) is not type(other):
+            return NotImplemented
+
+        return operator(self, other)
+
+    return method
+
+
+# fmt: off
+ARITHMETIC = (
+    "add", "sub", "mul", "floordiv", "truediv", "mod", "divmod", "pow",
+    "and", "or", "xor", "lshift", "rshift",
+)
+# fmt: on
+
+for name in ARITHMETIC:
+    for dunder in (f"__{name}__", f"__r{name}__"):
+        setattr(Identifier, dunder, guard(getattr(int, dunder)))
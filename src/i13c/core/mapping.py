@@ -42,6 +42,12 @@ class OneToOne[SemanticId, SemanticNode]:
     def items(self) -> Iterable[tuple[SemanticId, SemanticNode]]:
         return self.data.items()
 
+    def subset(self, keys: Iterable[SemanticId]) -> OneToOne[SemanticId, SemanticNode]:
+        return OneToOne(data={key: self.data[key] for key in keys if key in self.data})
+
+    def delta(self, other: OneToOne[SemanticId, SemanticNode]) -> set[SemanticId]:
+        return find_delta(self.data, other.data)
+
 
 @dataclass(kw_only=True)
 class OneToMany[SemanticId, SemanticNode]:
@@ -76,3 +82,20 @@ class OneToMany[SemanticId, SemanticNode]:
 
     def items(self) -> Iterable[tuple[SemanticId, list[SemanticNode]]]:
         return self.data.items()
+
+    def subset(self, keys: Iterable[SemanticId]) -> OneToMany[SemanticId, SemanticNode]:
+        return OneToMany(data={key: self.data[key] for key in keys if key in self.data})
+
+    def delta(self, other: OneToMany[SemanticId, SemanticNode]) -> set[SemanticId]:
+        return find_delta(self.data, other.data)
+
+
+def find_delta[K, V](left: dict[K, V], right: dict[K, V]) -> set[K]:
+    # keys present only on one side or holding entries which are not equal
+    delta = left.keys() ^ right.keys()
+
+    for key, value in left.items():
+        if key in right and not (value is right[key] or value == right[key]):
+            delta.add(key)
+
+    return delta
@@ -0,0 +1,122 @@
+import os
+import pickle
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+
+@dataclass(kw_only=True)
+class GraphSample:
+    produces: tuple[str, ...]
+
+    # perf counter is monotonic across processes, so starts can be compared
+    start: float
+    wall: float
+    cpu: float
+
+    # peak traced allocation and pickled size of the dataset, in bytes,
+    # or -1 when they could not be measured
+    peak: int
+    size: int = 0
+
+    pid: int
+    tid: int
+
+
+@dataclass(kw_only=True)
+class GraphProfiler:
+    samples: list[GraphSample] = field(default_factory=list)
+
+    # allocation tracing slows builders down, timings may prefer it disabled;
+    # the tracer is global to a process, so it only suits nodes built serially
+    # or in separate processes, threads would see each other's allocations
+    memory: bool = True
+
+    def record(self, sample: GraphSample, dataset: Any) -> None:
+        sample.size = measure_size(dataset)
+        self.samples.append(sample)
+
+    def to_json(self) -> dict[str, Any]:
+        return {"nodes": [asdict(sample) for sample in self.samples]}
+
+    def to_chrome(self) -> dict[str, Any]:
+        origin = min((sample.start for sample in self.samples), default=0.0)
+
+        # complete events of the chrome trace event format, in microseconds
+        events = [
+            {
+                "name": ", ".join(sample.produces),
+                "cat": "graph",
+                "ph": "X",
+                "ts": (sample.start - origin) * 1e6,
+                "dur": sample.wall * 1e6,
+                "pid": sample.pid,
+                "tid": sample.tid,
+                "args": {
+                    "cpu": sample.cpu,
+                    "peak": sample.peak,
+                    "size": sample.size,
+                },
+            }
+            for sample in self.samples
+        ]
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def measure(
+    produces: tuple[str, ...],
+    memory: bool,
+    builder: Callable[..., Any],
+    /,
+    **kwargs: Any,
+) -> tuple[Any, GraphSample]:
+    # workers of a process pool start without tracing
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    start, cpu = time.perf_counter(), time.thread_time()
+    dataset = builder(**kwargs)
+    wall, cpu = time.perf_counter() - start, time.thread_time() - cpu
+
+    sample = GraphSample(
+        produces=produces,
+        start=start,
+        wall=wall,
+        cpu=cpu,
+        peak=max(0, tracemalloc.get_traced_memory()[1] - baseline) if memory else -1,
+        pid=os.getpid(),
+        tid=threading.get_ident(),
+    )
+
+    return dataset, sample
+
+
+@contextmanager
+def tracing(profiler: GraphProfiler | None) -> Iterator[None]:
+    if profiler is None or not profiler.memory or tracemalloc.is_tracing():
+        yield
+        return
+
+    tracemalloc.start()
+
+    try:
+        yield
+    finally:
+        tracemalloc.stop()
+
+
+def measure_size(dataset: Any) -> int:
+    try:
+        return len(pickle.dumps(dataset, protocol=pickle.HIGHEST_PROTOCOL))
+
+    # some datasets may hold objects which cannot be serialized
+    except pickle.PicklingError, TypeError, AttributeError, RecursionError:
+        return -1
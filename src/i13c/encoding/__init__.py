@@ -1,7 +1,15 @@
+from bisect import bisect_right
+from collections.abc import Hashable
+from itertools import accumulate
 from typing import Protocol
 
 from i13c.encoding import addr, bits, ctrl, math, move, stack
-from i13c.encoding.core import LabelArtifact, RelocationArtifact
+from i13c.encoding.core import (
+    EncodedModule,
+    LabelArtifact,
+    RelocationArtifact,
+    normalize,
+)
 from i13c.llvm.typing import instructions as llvm
 from i13c.llvm.typing.instructions import Instruction
 
@@ -19,11 +27,33 @@ class DuplicateLabelError(Exception):
 
 
 def encode(instructions: list[Instruction]) -> bytes:
+    module = assemble(instructions)
+
+    # an executable image has nothing to resolve the remaining relocations
+    if module.relocations:
+        raise MissingLabelError(module.relocations[0].target)
+
+    return module.code
+
+
+def assemble(instructions: list[Instruction]) -> EncodedModule:
     bytecode = bytearray()
     labels: dict[int, LabelArtifact] = {}
     relocations: list[RelocationArtifact] = []
 
+    # same instruction shapes repeat a lot, their bytes are encoded only once
+    cache: dict[Hashable, bytes] = {}
+
     for instruction in instructions:
+        if type(instruction) not in POSITIONAL_TYPES:
+            key = normalize(instruction)
+
+            if (code := cache.get(key)) is None:
+                code = cache[key] = encode_bytes(instruction)
+
+            bytecode += code
+            continue
+
         if artifact := DISPATCH_TABLE[type(instruction)](instruction, bytecode):
             if isinstance(artifact, LabelArtifact):
                 # check for duplicate labels
@@ -34,16 +64,99 @@ def encode(instructions: list[Instruction]) -> bytes:
             else:
                 relocations.append(artifact)
 
+    return relax(bytecode, labels, relocations)
+
+
+def encode_bytes(instruction: Instruction) -> bytes:
+    bytecode = bytearray()
+    DISPATCH_TABLE[type(instruction)](instruction, bytecode)
+
+    return bytes(bytecode)
+
+
+def relax(
+    bytecode: bytearray,
+    labels: dict[int, LabelArtifact],
+    relocations: list[RelocationArtifact],
+) -> EncodedModule:
+    branches = [entry for entry in relocations if entry.short is not None]
+    ends = [entry.offset + 4 for entry in branches]
+
+    # bytes saved by each branch when encoded in its short form
+    savings = [
+        entry.offset + 4 - (entry.start or 0) - len(entry.short or b"") - 1
+        for entry in branches
+    ]
+
+    # branches start short and only ever grow, so the layout converges
+    short = [entry.target in labels for entry in branches]
+    shrinks = [0] * (len(branches) + 1)
+
+    def locate(offset: int) -> int:
+        return offset - shrinks[bisect_right(ends, offset)]
+
+    changed = True
+    while changed:
+        changed = False
+        shrinks = list(
+            accumulate(
+                (saving if flag else 0 for saving, flag in zip(savings, short)),
+                initial=0,
+            )
+        )
+
+        for idx, entry in enumerate(branches):
+            if short[idx]:
+                target = locate(labels[entry.target].offset) - locate(ends[idx])
+
+                if not -128 <= target <= 127:
+                    short[idx] = False
+                    changed = True
+
+    output = bytearray()
+    cursor, idx = 0, 0
+    unresolved: list[RelocationArtifact] = []
+
     for relocation in relocations:
+        end = relocation.offset + 4
+
         if relocation.target not in labels:
-            raise MissingLabelError(relocation.target)
+            output += bytecode[cursor:end]
+            offset = locate(relocation.offset)
 
-        target = labels[relocation.target].offset - (relocation.offset + 4)
-        low, high = relocation.offset, relocation.offset + 4
+            # other modules or the linker fill the displacement in
+            unresolved.append(
+                RelocationArtifact(target=relocation.target, offset=offset)
+            )
 
-        bytecode[low:high] = target.to_bytes(4, byteorder="little", signed=True)
+        elif relocation.short is not None and short[idx]:
+            target = locate(labels[relocation.target].offset) - locate(end)
 
-    return bytes(bytecode)
+            output += bytecode[cursor : relocation.start]
+            output += relocation.short
+            output += target.to_bytes(1, byteorder="little", signed=True)
+
+        else:
+            target = locate(labels[relocation.target].offset) - locate(end)
+
+            output += bytecode[cursor : relocation.offset]
+            output += target.to_bytes(4, byteorder="little", signed=True)
+
+        if relocation.short is not None:
+            idx += 1
+
+        cursor = end
+
+    output += bytecode[cursor:]
+
+    return EncodedModule(
+        code=bytes(output),
+        labels={
+            key: LabelArtifact(target=key, offset=locate(label.offset))
+            for key, label in labels.items()
+        },
+        relocations=unresolved,
+    )
 
 
 class Encoder(Protocol):
@@ -73,3 +186,10 @@ DISPATCH_TABLE: dict[type[Instruction], Encoder] = {
     llvm.stack.PopOff: stack.encode_pop_off,
     llvm.stack.PushOff: stack.encode_push_off,
 }  # pyright: ignore[reportAssignmentType]
+
+# encoders returning labels or relocations depend on the offset they emit at
+POSITIONAL_TYPES: set[type[Instruction]] = {
+    llvm.ctrl.Call,
+    llvm.ctrl.Jump,
+    llvm.ctrl.Label,
+}
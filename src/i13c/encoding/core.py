@@ -1,4 +1,6 @@
+from collections.abc import Hashable
 from dataclasses import dataclass
+from typing import Any
 
 from i13c.llvm.typing.instructions.core import ComputedAddress, RelativeAddress
 
@@ -14,11 +16,41 @@ class RelocationArtifact:
     target: int
     offset: int
 
+    # branches with a rel8 form replace the whole instruction from start
+    start: int | None = None
+    short: bytes | None = None
+
+
+@dataclass(kw_only=True)
+class EncodedModule:
+    code: bytes
+
+    # label target -> label, with offsets of the final layout
+    labels: dict[int, LabelArtifact]
+
+    # relocations whose targets are not defined within the module
+    relocations: list[RelocationArtifact]
+
 
 class UnreachableEncodingError(Exception):
     pass
 
 
+# operand leaves which are hashable as they are
+ATOMIC_TYPES = {int, str, bytes, bool}
+
+
+def normalize(value: Any) -> Hashable:
+    # instructions and operands are flat dataclasses, their fields make the key
+    return (
+        type(value),
+        *[
+            entry if type(entry) in ATOMIC_TYPES else normalize(entry)
+            for entry in vars(value).values()
+        ],
+    )
+
+
 class Address:
     @staticmethod
     def index_uses_rsp(addr: ComputedAddress | RelativeAddress) -> bool:
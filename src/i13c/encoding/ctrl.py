@@ -1,4 +1,3 @@
-
 from i13c.encoding.core import LabelArtifact, RelocationArtifact
 from i13c.llvm.typing.instructions.ctrl import Call, Jump, Label, Nop, Return, SysCall
 
@@ -45,14 +44,17 @@ def encode_jump(
     instruction: Jump, bytecode: bytearray
 ) -> LabelArtifact | RelocationArtifact | None:
     # emit E9 cd --- where cd is a signed 32-bit offset
+    start = len(bytecode)
     bytecode.extend([0xE9, 0x00, 0x00, 0x00, 0x00])
 
     # record relocation info
     offset = len(bytecode) - 4
     target = instruction.target.value
 
-    # record relocation to be fixed up later
-    return RelocationArtifact(target=target, offset=offset)
+    # EB cb is used instead whenever the offset fits into 8 bits
+    return RelocationArtifact(
+        target=target, offset=offset, start=start, short=bytes([0xEB])
+    )
 
 
 def encode_nop(
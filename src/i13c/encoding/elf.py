@@ -1,45 +1,177 @@
+from dataclasses import dataclass
+
+from i13c.encoding.core import EncodedModule, LabelArtifact, RelocationArtifact
+
 # fmt: off
 ELFCLASS64 = 0x02     # 64-bit objects
 ELFDATA2LSB = 0x01    # little-endian
 EV_CURRENT = 0x01     # current version
 ELFOSABI_SYSV = 0x00  # System V ABI
+ET_REL = 0x01         # relocatable file
 ET_EXEC = 0x02        # executable file
 EM_X86_64 = 0x3E      # AMD x86-64 architecture
 
-TEXT_ALIGN = 0x0001  # no alignment
+PAGE_SIZE = 0x1000   # segments are mapped at page granularity
 PT_LOAD = 0x01       # loadable program segment
 PF_X = 0x1           # execute
+PF_W = 0x2           # write
 PF_R = 0x4           # read
 
+SHT_NULL = 0x00      # inactive section header
+SHT_PROGBITS = 0x01  # program defined bytes
+SHT_SYMTAB = 0x02    # symbol table
+SHT_STRTAB = 0x03    # string table
+SHT_RELA = 0x04      # relocations with addends
+SHF_ALLOC = 0x02     # occupies memory during execution
+SHF_EXECINSTR = 0x04 # contains executable instructions
+SHF_INFO_LINK = 0x40 # sh_info holds a section index
+
+STB_LOCAL = 0x0      # local symbol
+STB_GLOBAL = 0x1     # global symbol
+STT_NOTYPE = 0x0     # unspecified symbol type
+STT_SECTION = 0x3    # symbol of a section
+SHN_UNDEF = 0x0      # undefined section index
+R_X86_64_PC32 = 0x2  # 32-bit displacement to the symbol
+R_X86_64_PLT32 = 0x4 # 32-bit displacement to the symbol or its PLT entry
+
 ELF_HEADER_SIZE = 64
 PROGRAM_HEADER_SIZE = 56
+SECTION_HEADER_SIZE = 64
+SYMBOL_SIZE = 24
+RELOCATION_SIZE = 24
+SECTION_ALIGN = 16
 ELF_BASE_ADDR = 0x400000
-ENTRY_POINT = ELF_BASE_ADDR + ELF_HEADER_SIZE + PROGRAM_HEADER_SIZE
 # fmt: on
 
 
+class MissingSymbolError(Exception):
+    def __init__(self, target: int) -> None:
+        self.target = target
+        super().__init__(f"missing symbol name for relocation {target}")
+
+
+class UnsupportedObjectError(Exception):
+    def __init__(self, reason: str) -> None:
+        self.reason = reason
+        super().__init__(f"unsupported object file: {reason}")
+
+
+@dataclass(kw_only=True)
+class ElfSegment:
+    flags: int
+    data: bytes
+
+    # zero filled memory beyond the data, like bss
+    extra: int = 0
+
+
+@dataclass(kw_only=True)
+class ElfPlacement:
+    offset: int
+    address: int
+
+
+@dataclass(kw_only=True)
+class ElfSection:
+    name: bytes
+    type: int
+    flags: int
+    data: bytes
+    align: int
+
+    link: int = 0
+    info: int = 0
+    entsize: int = 0
+
+
 def as_bytes(value: int, length: int) -> bytes:
     return value.to_bytes(length, byteorder="little")
 
 
-def emit(code: bytes) -> bytes:
+def as_signed(value: int, length: int) -> bytes:
+    return value.to_bytes(length, byteorder="little", signed=True)
+
+
+def as_int(value: bytes, signed: bool = False) -> int:
+    return int.from_bytes(value, byteorder="little", signed=signed)
+
+
+def emit(
+    code: bytes,
+    entry: int = 0,
+    /,
+    rodata: bytes = b"",
+    data: bytes = b"",
+    bss: int = 0,
+) -> bytes:
+    return emit_segments(build_segments(code, rodata, data, bss), entry)
+
+
+def build_segments(
+    code: bytes, rodata: bytes, data: bytes, bss: int
+) -> list[ElfSegment]:
+    segments = [ElfSegment(flags=PF_R | PF_X, data=code)]
+
+    # empty segments are left out, a plain program keeps a single one
+    if rodata:
+        segments.append(ElfSegment(flags=PF_R, data=rodata))
+
+    if data or bss:
+        segments.append(ElfSegment(flags=PF_R | PF_W, data=data, extra=bss))
+
+    return segments
+
+
+def place_segments(segments: list[ElfSegment]) -> list[ElfPlacement]:
+    headers = ELF_HEADER_SIZE + PROGRAM_HEADER_SIZE * len(segments)
+    placements: list[ElfPlacement] = []
+
+    # the first segment starts right after the headers, which it maps too
+    offset = headers
+
+    for segment in segments:
+        placements.append(ElfPlacement(offset=offset, address=ELF_BASE_ADDR + offset))
+
+        # each following segment gets its own pages and protection
+        offset += len(segment.data)
+        offset += -offset % PAGE_SIZE
+
+    return placements
+
+
+def emit_segments(segments: list[ElfSegment], entry: int) -> bytes:
     content = bytearray()
-    code_size = len(code)
+    placements = place_segments(segments)
 
-    # layout: [ehdr][phdr][code]
-    file_off_code = ELF_HEADER_SIZE + PROGRAM_HEADER_SIZE
-    entry_point = ELF_BASE_ADDR + file_off_code
-    file_size = file_off_code + code_size
+    # layout: [ehdr][phdrs][code] [rodata] [data], each from a new page
+    entry_point = placements[0].address + entry
 
-    emit_ehdr(content, entry_point)
-    emit_phdr(content, file_size)
-    content.extend(code)
+    emit_ehdr(content, ET_EXEC, entry_point, phnum=len(segments))
 
-    return bytes(content)
+    for idx, (segment, placement) in enumerate(zip(segments, placements)):
+        # the text segment maps the headers preceding the code as well
+        start = 0 if idx == 0 else placement.offset
+        file_size = placement.offset + len(segment.data) - start
 
+        emit_phdr(content, segment.flags, start, file_size, file_size + segment.extra)
 
-def emit_ehdr(content: bytearray, entry_point: int) -> None:
+    for segment, placement in zip(segments, placements):
+        content.extend(bytes(placement.offset - len(content)))
+        content.extend(segment.data)
 
+    return bytes(content)
+
+
+def emit_ehdr(
+    content: bytearray,
+    type: int,
+    entry_point: int,
+    /,
+    phnum: int = 0,
+    shoff: int = 0,
+    shnum: int = 0,
+    shstrndx: int = 0,
+) -> None:
     # fmt: off
     eident = bytes(
         [0x7F, 0x45, 0x4C, 0x46,
@@ -47,31 +179,310 @@ def emit_ehdr(content: bytearray, entry_point: int) -> None:
         0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00],
     )
 
+    phoff = ELF_HEADER_SIZE if phnum else 0
+    shentsize = SECTION_HEADER_SIZE if shnum else 0
+
     content.extend(eident)                           # e_ident[16]
-    content.extend(as_bytes(ET_EXEC, 2))             # e_type
+    content.extend(as_bytes(type, 2))                # e_type
     content.extend(as_bytes(EM_X86_64, 2))           # e_machine
     content.extend(as_bytes(EV_CURRENT, 4))          # e_version
     content.extend(as_bytes(entry_point, 8))         # e_entry
-    content.extend(as_bytes(ELF_HEADER_SIZE, 8))     # e_phoff (phdr right after ehdr)
-    content.extend(as_bytes(0, 8))                   # e_shoff (no sections)
+    content.extend(as_bytes(phoff, 8))               # e_phoff (phdr right after ehdr)
+    content.extend(as_bytes(shoff, 8))               # e_shoff
     content.extend(as_bytes(0, 4))                   # e_flags
     content.extend(as_bytes(ELF_HEADER_SIZE, 2))     # e_ehsize
     content.extend(as_bytes(PROGRAM_HEADER_SIZE, 2)) # e_phentsize
-    content.extend(as_bytes(1, 2))                   # e_phnum
-    content.extend(as_bytes(0, 2))                   # e_shentsize
-    content.extend(as_bytes(0, 2))                   # e_shnum
-    content.extend(as_bytes(0, 2))                   # e_shstrndx
+    content.extend(as_bytes(phnum, 2))               # e_phnum
+    content.extend(as_bytes(shentsize, 2))           # e_shentsize
+    content.extend(as_bytes(shnum, 2))               # e_shnum
+    content.extend(as_bytes(shstrndx, 2))            # e_shstrndx
     # fmt: on
 
 
-def emit_phdr(content: bytearray, file_size: int) -> None:
+def emit_phdr(
+    content: bytearray, flags: int, offset: int, file_size: int, memory_size: int
+) -> None:
     # fmt: off
-    content.extend(as_bytes(PT_LOAD, 4))             # p_type
-    content.extend(as_bytes(PF_R | PF_X, 4))         # p_flags
-    content.extend(as_bytes(0, 8))                   # p_offset (from file start)
-    content.extend(as_bytes(ELF_BASE_ADDR, 8))       # p_vaddr
-    content.extend(as_bytes(ELF_BASE_ADDR, 8))       # p_paddr
-    content.extend(as_bytes(file_size, 8))           # p_filesz (map whole file)
-    content.extend(as_bytes(file_size, 8))           # p_memsz  (no bss)
-    content.extend(as_bytes(TEXT_ALIGN, 8))          # p_align  (1 for simplest)
+    content.extend(as_bytes(PT_LOAD, 4))                 # p_type
+    content.extend(as_bytes(flags, 4))                   # p_flags
+    content.extend(as_bytes(offset, 8))                  # p_offset (from file start)
+    content.extend(as_bytes(ELF_BASE_ADDR + offset, 8))  # p_vaddr
+    content.extend(as_bytes(ELF_BASE_ADDR + offset, 8))  # p_paddr
+    content.extend(as_bytes(file_size, 8))               # p_filesz
+    content.extend(as_bytes(memory_size, 8))             # p_memsz  (zero filled tail)
+    content.extend(as_bytes(PAGE_SIZE, 8))               # p_align  (offset = vaddr mod page)
     # fmt: on
+
+
+def emit_object(
+    module: EncodedModule,
+    symbols: dict[int, bytes],
+    exports: set[int] | None = None,
+) -> bytes:
+    strtab = StringTable()
+    symtab = bytearray()
+    indices: dict[int, int] = {}
+
+    # null symbol followed by the text section itself
+    emit_symbol(symtab, 0, STB_LOCAL, STT_NOTYPE, SHN_UNDEF, 0)
+    emit_symbol(symtab, 0, STB_LOCAL, STT_SECTION, 1, 0)
+
+    # named labels are exported unless limited, named missing targets are imported
+    exported = {
+        target
+        for target in symbols
+        if exports is None or target in exports or target not in module.labels
+    }
+
+    # the symbol table lists all local symbols before the global ones
+    ordered = sorted(symbols.items(), key=lambda item: item[0] in exported)
+    private = len(symbols) - len(exported)
+
+    for target, name in ordered:
+        label = module.labels.get(target)
+        section, value = (1, label.offset) if label else (SHN_UNDEF, 0)
+        bind = STB_GLOBAL if target in exported else STB_LOCAL
+
+        indices[target] = len(symtab) // SYMBOL_SIZE
+        emit_symbol(symtab, strtab.add(name), bind, STT_NOTYPE, section, value)
+
+    rela = bytearray()
+
+    for relocation in module.relocations:
+        if relocation.target not in indices:
+            raise MissingSymbolError(relocation.target)
+
+        emit_relocation(rela, relocation.offset, indices[relocation.target])
+
+    sections = [
+        ElfSection(
+            name=b".text",
+            type=SHT_PROGBITS,
+            flags=SHF_ALLOC | SHF_EXECINSTR,
+            data=module.code,
+            align=SECTION_ALIGN,
+        ),
+        ElfSection(
+            name=b".symtab",
+            type=SHT_SYMTAB,
+            flags=0,
+            data=bytes(symtab),
+            align=8,
+            link=3,
+            info=2 + private,
+            entsize=SYMBOL_SIZE,
+        ),
+        ElfSection(
+            name=b".strtab",
+            type=SHT_STRTAB,
+            flags=0,
+            data=strtab.to_bytes(),
+            align=1,
+        ),
+        ElfSection(
+            name=b".rela.text",
+            type=SHT_RELA,
+            flags=SHF_INFO_LINK,
+            data=bytes(rela),
+            align=8,
+            link=2,
+            info=1,
+            entsize=RELOCATION_SIZE,
+        ),
+    ]
+
+    return emit_sections(sections)
+
+
+def emit_sections(sections: list[ElfSection]) -> bytes:
+    shstrtab = StringTable()
+    names = [shstrtab.add(section.name) for section in sections]
+
+    # section names come last, so their table holds all names already
+    shstrndx = len(sections) + 1
+    names.append(shstrtab.add(b".shstrtab"))
+    sections.append(
+        ElfSection(
+            name=b".shstrtab",
+            type=SHT_STRTAB,
+            flags=0,
+            data=shstrtab.to_bytes(),
+            align=1,
+        )
+    )
+
+    # layout: [ehdr][sections...][shdrs]
+    body = bytearray()
+    offsets: list[int] = []
+
+    for section in sections:
+        body.extend(bytes(-(ELF_HEADER_SIZE + len(body)) % section.align))
+        offsets.append(ELF_HEADER_SIZE + len(body))
+        body.extend(section.data)
+
+    body.extend(bytes(-(ELF_HEADER_SIZE + len(body)) % 8))
+    shoff = ELF_HEADER_SIZE + len(body)
+
+    content = bytearray()
+    emit_ehdr(
+        content,
+        ET_REL,
+        0,
+        shoff=shoff,
+        shnum=len(sections) + 1,
+        shstrndx=shstrndx,
+    )
+
+    content.extend(body)
+    content.extend(bytes(SECTION_HEADER_SIZE))
+
+    for name, offset, section in zip(names, offsets, sections):
+        emit_shdr(content, name, offset, section)
+
+    return bytes(content)
+
+
+def emit_shdr(content: bytearray, name: int, offset: int, section: ElfSection) -> None:
+    # fmt: off
+    content.extend(as_bytes(name, 4))                # sh_name
+    content.extend(as_bytes(section.type, 4))        # sh_type
+    content.extend(as_bytes(section.flags, 8))       # sh_flags
+    content.extend(as_bytes(0, 8))                   # sh_addr (not loaded yet)
+    content.extend(as_bytes(offset, 8))              # sh_offset
+    content.extend(as_bytes(len(section.data), 8))   # sh_size
+    content.extend(as_bytes(section.link, 4))        # sh_link
+    content.extend(as_bytes(section.info, 4))        # sh_info
+    content.extend(as_bytes(section.align, 8))       # sh_addralign
+    content.extend(as_bytes(section.entsize, 8))     # sh_entsize
+    # fmt: on
+
+
+def emit_symbol(
+    content: bytearray, name: int, bind: int, type: int, section: int, value: int
+) -> None:
+    # fmt: off
+    content.extend(as_bytes(name, 4))                # st_name
+    content.extend(as_bytes(bind << 4 | type, 1))    # st_info
+    content.extend(as_bytes(0, 1))                   # st_other (default visibility)
+    content.extend(as_bytes(section, 2))             # st_shndx
+    content.extend(as_bytes(value, 8))               # st_value
+    content.extend(as_bytes(0, 8))                   # st_size (unknown)
+    # fmt: on
+
+
+def emit_relocation(content: bytearray, offset: int, symbol: int) -> None:
+    # fmt: off
+    content.extend(as_bytes(offset, 8))                          # r_offset
+    content.extend(as_bytes(symbol << 32 | R_X86_64_PLT32, 8))   # r_info
+    content.extend(as_signed(-4, 8))                             # r_addend (rel32 ends 4 bytes later)
+    # fmt: on
+
+
+def read_object(binary: bytes) -> tuple[EncodedModule, dict[int, bytes]]:
+    if binary[0:4] != b"\x7fELF" or as_int(binary[16:18]) != ET_REL:
+        raise UnsupportedObjectError("not a relocatable file")
+
+    sections = read_sections(binary)
+    text = find_section(sections, b".text")
+    symtab = find_section(sections, b".symtab")
+    rela = find_section(sections, b".rela.text") or ElfSection(
+        name=b".rela.text", type=SHT_RELA, flags=0, data=b"", align=8
+    )
+
+    if text is None or symtab is None:
+        raise UnsupportedObjectError("missing .text or .symtab section")
+
+    strtab = sections[symtab.link].data
+    labels: dict[int, LabelArtifact] = {}
+    symbols: dict[int, bytes] = {}
+
+    # only global symbols are visible to other modules, locals are skipped
+    for idx in range(symtab.info, len(symtab.data) // SYMBOL_SIZE):
+        entry = symtab.data[idx * SYMBOL_SIZE : (idx + 1) * SYMBOL_SIZE]
+        name = read_string(strtab, as_int(entry[0:4]))
+        section = as_int(entry[6:8])
+
+        if section == sections.index(text):
+            labels[idx] = LabelArtifact(target=idx, offset=as_int(entry[8:16]))
+        elif section != SHN_UNDEF:
+            raise UnsupportedObjectError(f"symbol {name.decode()} outside .text")
+
+        symbols[idx] = name
+
+    relocations: list[RelocationArtifact] = []
+
+    for start in range(0, len(rela.data), RELOCATION_SIZE):
+        entry = rela.data[start : start + RELOCATION_SIZE]
+        offset, info = as_int(entry[0:8]), as_int(entry[8:16])
+
+        # only displacements ending with the relocated field are understood
+        if info & 0xFFFFFFFF not in (R_X86_64_PC32, R_X86_64_PLT32):
+            raise UnsupportedObjectError(f"relocation type at {offset}")
+
+        if as_int(entry[16:24], signed=True) != -4 or info >> 32 not in symbols:
+            raise UnsupportedObjectError(f"relocation target at {offset}")
+
+        relocations.append(RelocationArtifact(target=info >> 32, offset=offset))
+
+    module = EncodedModule(code=text.data, labels=labels, relocations=relocations)
+    return module, symbols
+
+
+def read_sections(binary: bytes) -> list[ElfSection]:
+    shoff = as_int(binary[40:48])
+    shnum = as_int(binary[60:62])
+    shstrndx = as_int(binary[62:64])
+
+    headers = [
+        binary[shoff + idx * SECTION_HEADER_SIZE :][:SECTION_HEADER_SIZE]
+        for idx in range(shnum)
+    ]
+
+    # names are resolved once the section holding them is known
+    names = [as_int(header[0:4]) for header in headers]
+    sections = [
+        ElfSection(
+            name=b"",
+            type=as_int(header[4:8]),
+            flags=as_int(header[8:16]),
+            data=binary[as_int(header[24:32]) :][: as_int(header[32:40])],
+            align=as_int(header[48:56]),
+            link=as_int(header[40:44]),
+            info=as_int(header[44:48]),
+            entsize=as_int(header[56:64]),
+        )
+        for header in headers
+    ]
+
+    for name, section in zip(names, sections):
+        section.name = read_string(sections[shstrndx].data, name)
+
+    return sections
+
+
+def find_section(sections: list[ElfSection], name: bytes) -> ElfSection | None:
+    for section in sections:
+        if section.name == name:
+            return section
+
+    return None
+
+
+def read_string(table: bytes, offset: int) -> bytes:
+    return table[offset : table.index(b"\x00", offset)]
+
+
+class StringTable:
+    def __init__(self) -> None:
+        self.data = bytearray(b"\x00")
+        self.offsets: dict[bytes, int] = {b"": 0}
+
+    def add(self, name: bytes) -> int:
+        if (offset := self.offsets.get(name)) is None:
+            offset = self.offsets[name] = len(self.data)
+            self.data.extend(name + b"\x00")
+
+        return offset
+
+    def to_bytes(self) -> bytes:
+        return bytes(self.data)
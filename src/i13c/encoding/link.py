@@ -0,0 +1,75 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from i13c.encoding.core import EncodedModule
+from i13c.encoding.elf import SECTION_ALIGN, MissingSymbolError
+
+# int3 between modules, falling off the end of one module traps
+PADDING = b"\xcc"
+
+
+class UndefinedSymbolError(Exception):
+    def __init__(self, name: bytes) -> None:
+        self.name = name
+        super().__init__(f"undefined symbol {name.decode()}")
+
+
+class DuplicateSymbolError(Exception):
+    def __init__(self, name: bytes) -> None:
+        self.name = name
+        super().__init__(f"duplicate symbol {name.decode()}")
+
+
+@dataclass(kw_only=True)
+class LinkedImage:
+    code: bytes
+    entry: int
+
+
+def link(
+    objects: Iterable[tuple[EncodedModule, dict[int, bytes]]], entry: bytes
+) -> LinkedImage:
+    # i13c has no extern declarations yet and every module defines main,
+    # so only one object may come from i13c, the others must be hand-made
+    code = bytearray()
+    addresses: dict[bytes, int] = {}
+
+    # absolute offset of the displacement -> symbol it refers to
+    pending: list[tuple[int, bytes]] = []
+
+    for module, symbols in objects:
+        # every module starts aligned, as its text section did in the object
+        code += PADDING * (-len(code) % SECTION_ALIGN)
+        base = len(code)
+        code += module.code
+
+        for target, label in module.labels.items():
+            # unnamed labels are private to their module
+            if (name := symbols.get(target)) is None:
+                continue
+
+            if name in addresses:
+                raise DuplicateSymbolError(name)
+
+            addresses[name] = base + label.offset
+
+        for relocation in module.relocations:
+            if (name := symbols.get(relocation.target)) is None:
+                raise MissingSymbolError(relocation.target)
+
+            pending.append((base + relocation.offset, name))
+
+    # displacements are relative to the end of the 4-byte field
+    for offset, name in pending:
+        if (address := addresses.get(name)) is None:
+            raise UndefinedSymbolError(name)
+
+        displacement = address - offset - 4
+        code[offset : offset + 4] = displacement.to_bytes(
+            4, byteorder="little", signed=True
+        )
+
+    if entry not in addresses:
+        raise UndefinedSymbolError(entry)
+
+    return LinkedImage(code=bytes(code), entry=addresses[entry])
@@ -1,14 +1,27 @@
 
+from concurrent.futures import Executor
+
+from i13c.core.cache import ArtifactCache
 from i13c.core.generator import Generator
-from i13c.core.graph import GraphGroup, evaluate
+from i13c.core.graph import GraphGroup, GraphSession, evaluate
+from i13c.core.profile import GraphProfiler
 from i13c.graph.artifacts import GraphArtifacts
 from i13c.llvm.build import configure_llvm_graph
 from i13c.semantic.graph import configure_semantic_graph
 from i13c.semantic.syntax import configure_syntax_graph
+from i13c.semantic.typing.analyses.allocations import Allocator
 from i13c.syntax.tree import Program
 
 
-def run(program: Program, target: str | None = None) -> GraphArtifacts:
+def run(
+    program: Program,
+    target: str | None = None,
+    executor: Executor | None = None,
+    cache: ArtifactCache | None = None,
+    session: GraphSession | None = None,
+    profiler: GraphProfiler | None = None,
+    allocator: Allocator = "coloring",
+) -> GraphArtifacts:
     nodes = GraphGroup(
         nodes=[
             configure_syntax_graph(),
@@ -21,9 +34,15 @@ def run(program: Program, target: str | None = None) -> GraphArtifacts:
         nodes.flatten(),
         initial={
             "core/generator": Generator(),
+            "core/allocator": allocator,
             "ast/program": program,
         },
         targets={target} if target else set(),
+        executor=executor,
+        serial=frozenset({"core/generator"}),
+        cache=cache,
+        session=session,
+        profiler=profiler,
     )
 
     return GraphArtifacts(data=artifacts, views=views)
@@ -16,6 +16,7 @@ from i13c.llvm.typing.instructions import Instruction, InstructionEntry
 from i13c.llvm.typing.intervals import IntervalPressure, RegisterInterval
 from i13c.llvm.typing.registers import VirtualRegister
 from i13c.llvm.typing.stacks import StackFrame
+from i13c.semantic.model import SemanticGraph
 from i13c.semantic.typing.entities.functions import FunctionId
 
 
@@ -95,3 +96,15 @@ class LowLevelGraph:
                 return bid
 
         return None
+
+    def symbols_of(self, graph: SemanticGraph) -> dict[int, bytes]:
+        symbols: dict[int, bytes] = {}
+
+        # function entries are labeled with their signature names, main included
+        for fid, bid in self.functions.entries.items():
+            function = graph.entities.functions.get(fid)
+            signature = graph.entities.signatures.get(function.signature)
+
+            symbols[bid.value] = signature.name
+
+        return symbols
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import Protocol
 
+from i13c.core.bitsets import decode_bits, encode_bits
+from i13c.core.dataflow import DataflowGraph, DataflowProblem, solve
 from i13c.core.graph import GraphNode, Prefix
 from i13c.core.mapping import OneToMany, OneToOne
 from i13c.llvm.typing.abstracts import (
@@ -555,43 +557,44 @@ def find_in_and_out_registers_for_blocks(
     buse: OneToOne[BlockId, Registers],
 ) -> tuple[OneToOne[BlockId, Registers], OneToOne[BlockId, Registers]]:
 
-    iin: dict[BlockId, Registers] = {}
-    iout: dict[BlockId, Registers] = {}
+    blocks = list(buse)
+    index = {bid: idx for idx, bid in enumerate(blocks)}
 
-    for bid in buse:
-        iin[bid] = Registers.empty()
-        iout[bid] = Registers.empty()
-
-    regout: set[int]
-    changed = True
-
-    while changed:
-        changed = False
-
-        for bid in buse:
-            regin = set(buse.get(bid).items)  # start with used-registers
-            regin.update(iout[bid].items)  # add out-registers from previous iteration
+    # registers flow from predecessors, their numbers are the bit positions
+    predecessors = {
+        idx: [index[pred] for pred in backward.find(bid)]
+        for idx, bid in enumerate(blocks)
+    }
+    successors: dict[int, list[int]] = {idx: [] for idx in range(len(blocks))}
 
-            if predecessors := backward.get(bid):
-                regout = set(
-                    iin[predecessors[0]].items
-                )  # start with in-registers of first predecessor
+    for idx, preds in predecessors.items():
+        for pred in preds:
+            successors[pred].append(idx)
 
-                for pred in predecessors[1:]:
-                    regout.update(
-                        iin[pred].items
-                    )  # add in-registers of other predecessors
+    graph = DataflowGraph(
+        size=len(blocks),
+        roots=[],
+        forward=successors,
+        backward=predecessors,
+    )
 
-            else:
-                regout = set()
+    problem = DataflowProblem(
+        direction="forward",
+        meet="union",
+        gen=[encode_bits(buse.get(bid).items) for bid in blocks],
+        kill=[0] * len(blocks),
+    )
 
-            if regin != iin[bid].items:
-                iin[bid] = Registers(items=regin)
-                changed = True
+    result = solve(graph, problem)
 
-            if regout != iout[bid].items:
-                iout[bid] = Registers(items=regout)
-                changed = True
+    iin = {
+        bid: Registers(items=decode_bits(result.after[idx]))
+        for bid, idx in index.items()
+    }
+    iout = {
+        bid: Registers(items=decode_bits(result.before[idx]))
+        for bid, idx in index.items()
+    }
 
     return (
         OneToOne[BlockId, Registers].instance(iin),
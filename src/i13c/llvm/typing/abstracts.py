@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+from i13c.core.identifiers import Identifier
+
 
 @dataclass(kw_only=True)
 class EnterFrame:
@@ -38,9 +40,8 @@ class Restore:
 Abstracts = EnterFrame | ExitFrame | Preserve | Restore
 
 
-@dataclass(kw_only=True, frozen=True)
-class AbstractId:
-    value: int
+class AbstractId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("abstract", f"{self.value:<{length}}"))
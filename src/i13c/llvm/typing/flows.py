@@ -1,12 +1,12 @@
 from dataclasses import dataclass
 
+from i13c.core.identifiers import Identifier
 from i13c.llvm.typing.registers import reg64_to_name
 from i13c.semantic.typing.entities.functions import FunctionId
 
 
-@dataclass(kw_only=True, frozen=True)
-class BlockId:
-    value: int
+class BlockId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("block", f"{self.value:<{length}}"))
@@ -92,9 +92,8 @@ Flow = (
 )
 
 
-@dataclass(kw_only=True, frozen=True)
-class FlowId:
-    value: int
+class FlowId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("flow", f"{self.value:<{length}}"))
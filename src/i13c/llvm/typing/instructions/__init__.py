@@ -1,6 +1,4 @@
-
-from dataclasses import dataclass
-
+from i13c.core.identifiers import Identifier
 from i13c.llvm.typing.instructions import addr, bits, ctrl, math, move, stack
 
 Instruction = (
@@ -26,9 +24,8 @@ Instruction = (
 )
 
 
-@dataclass(kw_only=True, frozen=True)
-class InstructionId:
-    value: int
+class InstructionId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("instruction", f"{self.value:<{length}}"))
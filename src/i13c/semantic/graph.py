@@ -10,17 +10,18 @@ from i13c.semantic.nodes.resolutions import parse_resolutions
 
 
 def configure_e3xxx() -> GraphNode:
-    def build(rules: dict[str, list[Diagnostic]]) -> SemanticRules:
-        return SemanticRules(data=rules)
-
     return GraphNode(
-        builder=build,
+        builder=build_rules,
         constraint=None,
         produces=("rules/semantic",),
         requires=frozenset({("rules", Prefix(value="rules/e3"))}),
     )
 
 
+def build_rules(rules: dict[str, list[Diagnostic]]) -> SemanticRules:
+    return SemanticRules(data=rules)
+
+
 def configure_semantic_graph() -> GraphGroup:
     return GraphGroup(
         nodes=[
@@ -1,12 +1,30 @@
+import heapq
 from collections.abc import Iterable
 
+from i13c.core.bitsets import decode_bits, encode_bits
 from i13c.core.graph import GraphNode, GraphViews
 from i13c.core.mapping import OneToOne
-from i13c.semantic.typing.analyses.allocations import Allocation
+from i13c.semantic.typing.analyses.allocations import (
+    Allocation,
+    AllocationInterval,
+    Allocator,
+)
 from i13c.semantic.typing.analyses.callings import CallingClobber
+from i13c.semantic.typing.analyses.dflows import DataFlows
 from i13c.semantic.typing.analyses.liveness import Liveness
 from i13c.semantic.typing.entities.functions import FunctionId
 
+# fmt: off
+SYSTEM_V: dict[bytes, int] = {
+    b"rdi": 0, b"rsi": 1, b"rdx": 2, b"rcx": 3, b"r8": 4, b"r9": 5, b"r10": 6, b"r11": 7,
+    b"rax": 8, b"rbx": 9, b"rbp": 10, b"r12": 11, b"r13": 12, b"r14": 13, b"r15": 14,
+}
+# fmt: on
+
+# r11 is kept aside as the scratch register of spills and assigns
+SCRATCH = 7
+PALETTE = [color for color in range(len(SYSTEM_V)) if color != SCRATCH]
+
 
 def configure_allocations() -> GraphNode:
     return GraphNode(
@@ -15,164 +33,283 @@ def configure_allocations() -> GraphNode:
         produces=("analyses/allocations",),
         requires=frozenset(
             {
+                ("allocator", "core/allocator"),
                 ("liveness", "analyses/liveness"),
+                ("dflows", "analyses/dflows"),
             }
         ),
         views=GraphViews(list=ListExtractor),
+        partition="liveness",
     )
 
 
 def build_allocations(
+    allocator: Allocator,
     liveness: OneToOne[FunctionId, Liveness],
+    dflows: OneToOne[FunctionId, DataFlows],
 ) -> OneToOne[FunctionId, Allocation]:
     allocations: dict[FunctionId, Allocation] = {}
 
-    # fmt: off
-    system_v: dict[bytes, int] = {
-        b"rdi": 0, b"rsi": 1, b"rdx": 2, b"rcx": 3, b"r8": 4, b"r9": 5, b"r10": 6, b"r11": 7,
-        b"rax": 8, b"rbx": 9, b"rbp": 10, b"r12": 11, b"r13": 12, b"r14": 13, b"r15": 14,
-    }
-    # fmt: on
-
     for fid, live in liveness.items():
-        graph: dict[int, set[int]] = {}
-        worklist: list[int] = []
-        targets: set[int] = set()
+        if allocator == "linear":
+            allocations[fid] = allocate_linear(live)
+        else:
+            allocations[fid] = allocate_coloring(live, dflows.get(fid))
+
+    return OneToOne[FunctionId, Allocation].instance(allocations)
+
+
+def allocate_coloring(live: Liveness, dflow: DataFlows) -> Allocation:
+    graph = build_interference(live)
+
+    # clobbers are precolored with the register they destroy
+    colors: dict[int, int] = {}
+    for idx in graph:
+        if isinstance(value := live.values[idx], CallingClobber):
+            colors[idx] = SYSTEM_V[value.name]
+
+    costs = count_references(dflow)
+    stack, candidates = simplify_graph(graph, colors, costs)
+
+    spilled = select_registers(graph, colors, stack, candidates)
+    spills = select_slots(graph, spilled)
+
+    for idx in graph:
+        if isinstance(live.values[idx], CallingClobber):
+            del colors[idx]
+
+    return Allocation(
+        ref=live.ref,
+        target=live.target,
+        values=live.values,
+        colors=colors,
+        spills=spills,
+        scratch=SCRATCH,
+    )
+
+
+def allocate_linear(live: Liveness) -> Allocation:
+    intervals = build_intervals(live)
+
+    colors: dict[int, int] = {}
+    spilled: list[AllocationInterval] = []
+    fixed: list[tuple[AllocationInterval, int]] = []
+
+    # clobbers pin their register for the whole interval
+    for interval in intervals:
+        if isinstance(value := live.values[interval.value], CallingClobber):
+            fixed.append((interval, SYSTEM_V[value.name]))
+
+    free = list(PALETTE)
+    active: list[AllocationInterval] = []
+
+    for interval in intervals:
+        if isinstance(live.values[interval.value], CallingClobber):
+            continue
 
-        for idx in range(len(live.values)):
-            graph[idx] = set()
+        # intervals ending before this one give their registers back
+        for expired in [entry for entry in active if entry.end < interval.start]:
+            active.remove(expired)
+            free.append(colors[expired.value])
+
+        blocked = {
+            color
+            for entry, color in fixed
+            if entry.start <= interval.end and interval.start <= entry.end
+        }
+
+        if available := [color for color in free if color not in blocked]:
+            colors[interval.value] = min(available)
+            free.remove(colors[interval.value])
+            active.append(interval)
+            continue
+
+        # the active interval ending last is the cheapest one to evict
+        victims = [entry for entry in active if colors[entry.value] not in blocked]
+        victim = max(victims, key=lambda entry: entry.end, default=None)
+
+        if victim is None or victim.end <= interval.end:
+            spilled.append(interval)
+            continue
+
+        colors[interval.value] = colors.pop(victim.value)
+        active.remove(victim)
+        active.append(interval)
+        spilled.append(victim)
+
+    return Allocation(
+        ref=live.ref,
+        target=live.target,
+        values=live.values,
+        colors=colors,
+        spills=select_linear_slots(spilled),
+        scratch=SCRATCH,
+    )
+
+
+def build_intervals(live: Liveness) -> list[AllocationInterval]:
+    starts: dict[int, int] = {}
+    ends: dict[int, int] = {}
+
+    # CFG Nodes are numbered in program order, which serves as linear order
+    for idx in range(len(live.nodes)):
+        clobbers = encode_bits(live.clobbers[idx])
+        values = live.live_in.bits[idx] | live.live_out.bits[idx] | clobbers
+
+        for value in decode_bits(values):
+            starts.setdefault(value, idx)
+            ends[value] = idx
+
+    intervals = [
+        AllocationInterval(value=value, start=start, end=ends[value])
+        for value, start in starts.items()
+    ]
+
+    intervals.sort(key=lambda entry: (entry.start, entry.value))
+    return intervals
 
-        for idx in range(len(live.nodes)):
-            clobbers = live.clobbers[idx]
 
-            values = live.live_in[idx].union(live.live_out[idx]).union(clobbers)
-            pairs = [(a, b) for a in values for b in values if a != b]
+def select_linear_slots(spilled: list[AllocationInterval]) -> dict[int, int]:
+    slots: dict[int, int] = {}
+    active: list[AllocationInterval] = []
 
-            targets.update(values)
+    # stack slots are scanned the same way, just without any limit
+    for interval in sorted(spilled, key=lambda entry: (entry.start, entry.value)):
+        active = [entry for entry in active if entry.end >= interval.start]
+        used = {slots[entry.value] for entry in active}
 
-            for a, b in pairs:
-                graph[a].add(b)
-                graph[b].add(a)
+        slots[interval.value] = next(
+            slot for slot in range(len(spilled)) if slot not in used
+        )
+
+        active.append(interval)
+
+    return slots
 
-        for idx in graph.keys() - targets:
-            del graph[idx]
 
-        count = 0
-        spills: dict[int, int] = {}
-        colors: dict[int, int] = {}
-        copy = {k: set(v) for k, v in graph.items()}
+def build_interference(live: Liveness) -> dict[int, int]:
+    graph: dict[int, int] = {}
+    seen: set[int] = set()
 
-        for clobbers in live.clobbers.values():
-            for idx in clobbers:
-                if idx in graph:
-                    value = live.values[idx]
-                    count = count + 1
+    for idx in range(len(live.nodes)):
+        clobbers = encode_bits(live.clobbers[idx])
+        values = live.live_in.bits[idx] | live.live_out.bits[idx] | clobbers
 
-                    assert isinstance(value, CallingClobber)
-                    colors[idx] = system_v[value.name]
+        # neighbouring nodes mostly share their values, which adds no new edge
+        if values in seen:
+            continue
 
-        while len(graph) > count:
-            broken = False
+        seen.add(values)
 
-            for idx, edges in list(graph.items()):
-                if isinstance(live.values[idx], CallingClobber):
-                    continue
+        for value in decode_bits(values):
+            graph[value] = graph.get(value, 0) | values
 
-                if len(edges) < len(system_v) - 1:
-                    worklist.append(idx)
+    # DFG Value -> bit vector of interfering DFG Values
+    return {value: edges & ~(1 << value) for value, edges in graph.items()}
 
-                    for neighbor in graph[idx]:
-                        graph[neighbor].remove(idx)
 
-                    del graph[idx]
-                    broken = True
-                    break
+def count_references(dflow: DataFlows) -> dict[int, int]:
+    costs: dict[int, int] = {}
 
-            if not broken:
-                for idx in list(graph.keys()):
-                    if isinstance(live.values[idx], CallingClobber):
-                        continue
+    # every definition and use turns into a memory access once spilled
+    for node in range(len(dflow.nodes)):
+        for value in (*dflow.defs[node], *dflow.uses[node]):
+            costs[value] = costs.get(value, 0) + 1
 
-                    spills[idx] = 0
+    return costs
 
-                    for neighbor in graph[idx]:
-                        graph[neighbor].remove(idx)
 
-                    del graph[idx]
-                    break
+def simplify_graph(
+    graph: dict[int, int], colors: dict[int, int], costs: dict[int, int]
+) -> tuple[list[int], list[int]]:
+    limit = len(PALETTE)
+    degrees = {idx: edges.bit_count() for idx, edges in graph.items()}
 
-        while worklist:
-            node = worklist.pop()
+    stack: list[int] = []
+    candidates: list[int] = []
 
-            palette = set(range(len(system_v))) - {7}
-            used = {colors[neighbor] for neighbor in copy[node] if neighbor in colors}
+    # precolored values stay in the graph until the very end
+    remaining = set(graph) - colors.keys()
+    simplify = [idx for idx in remaining if degrees[idx] < limit]
+    spill = {idx for idx in remaining if degrees[idx] >= limit}
 
-            available = palette - used
-            colors[node] = min(available)
+    # lowest values are simplified first, which keeps results stable
+    heapq.heapify(simplify)
 
-        for idx in reversed(list(spills.keys())):
-            palette = set(range(len(system_v))) - {7}
-            used = {colors[neighbor] for neighbor in copy[idx] if neighbor in colors}
+    while remaining:
+        if simplify:
+            idx = heapq.heappop(simplify)
+            stack.append(idx)
 
-            # determine available colors
-            available = palette - used
+        else:
+            # cheapest value per interference it removes
+            idx = min(spill, key=lambda idx: (costs.get(idx, 0) / degrees[idx], idx))
 
-            if len(available) > 0:
-                colors[idx] = min(available)
-                del spills[idx]
+            spill.remove(idx)
+            candidates.append(idx)
 
-        for idx in list(copy.keys()):
-            if isinstance(live.values[idx], CallingClobber):
+        remaining.remove(idx)
+
+        for neighbor in decode_bits(graph[idx]):
+            if neighbor not in remaining:
                 continue
 
-            if idx not in spills:
-                for neighbor in copy[idx]:
-                    if idx != neighbor:
-                        copy[neighbor].remove(idx)
+            degrees[neighbor] -= 1
+
+            # crossing below the limit makes the neighbor trivially colorable
+            if degrees[neighbor] == limit - 1:
+                spill.remove(neighbor)
+                heapq.heappush(simplify, neighbor)
 
-                del copy[idx]
+    return stack, candidates
 
-        graph = copy
-        copy = {k: set(v) for k, v in graph.items()}
-        spills.clear()
 
-        for idx, value in enumerate(live.values):
-            if isinstance(value, CallingClobber):  # noqa: SIM102
-                if idx in graph:
-                    del colors[idx]
+def select_registers(
+    graph: dict[int, int],
+    colors: dict[int, int],
+    stack: list[int],
+    candidates: list[int],
+) -> list[int]:
+    spilled: list[int] = []
 
-        while len(graph) > count:
-            for idx, edges in list(graph.items()):
-                if isinstance(live.values[idx], CallingClobber):
-                    continue
+    # simplified values had fewer neighbors than registers, one is always free
+    for idx in reversed(stack):
+        color = pick_color(graph, colors, idx)
+        assert color is not None
 
-                worklist.append(idx)
+        colors[idx] = color
 
-                for neighbor in graph[idx]:
-                    graph[neighbor].remove(idx)
+    # spill candidates may still find a free register
+    for idx in reversed(candidates):
+        if (color := pick_color(graph, colors, idx)) is not None:
+            colors[idx] = color
+        else:
+            spilled.append(idx)
 
-                del graph[idx]
-                break
+    return spilled
 
-        while worklist:
-            node = worklist.pop()
 
-            palette = set(range(len(live.values)))
-            used = {spills[neighbor] for neighbor in copy[node] if neighbor in spills}
+def pick_color(graph: dict[int, int], colors: dict[int, int], idx: int) -> int | None:
+    used = {
+        colors[neighbor] for neighbor in decode_bits(graph[idx]) if neighbor in colors
+    }
+    return next((color for color in PALETTE if color not in used), None)
 
-            available = palette - used
-            spills[node] = min(available)
 
-        allocations[fid] = Allocation(
-            ref=live.ref,
-            target=fid,
-            values=live.values,
-            colors=colors,
-            spills=spills,
-            scratch=7,
-        )
+def select_slots(graph: dict[int, int], spilled: list[int]) -> dict[int, int]:
+    slots: dict[int, int] = {}
+    mask = encode_bits(spilled)
 
-    return OneToOne[FunctionId, Allocation].instance(allocations)
+    # only spilled values compete for the same stack slots
+    for idx in sorted(spilled, reverse=True):
+        used = {
+            slots[neighbor]
+            for neighbor in decode_bits(graph[idx] & mask)
+            if neighbor in slots
+        }
+        slots[idx] = next(slot for slot in range(len(spilled)) if slot not in used)
+
+    return slots
 
 
 class ListExtractor:
@@ -54,6 +54,9 @@ def build_asmlets(
     asmlets: dict[AsmletId, Asmlet] = {}
 
     for sid, snippet in snippets.items():
+        # asmlet ids depend only on the snippet they are derived from
+        scope = generator.scope(b"asmlets/" + str(sid.value).encode())
+
         removed: list[bytes] = []
         positions: list[bool] = [False] * len(snippet.binding.binds)
         index: dict[frozenset[tuple[bytes, Hex]], list[CallSiteAcceptance]] = {}
@@ -107,7 +110,7 @@ def build_asmlets(
             ]
 
             # generate new identifier for the asmlet
-            aid = AsmletId(value=generator.next())
+            aid = AsmletId(value=scope.next())
 
             asmlets[aid] = Asmlet(
                 ref=snippet.ref,
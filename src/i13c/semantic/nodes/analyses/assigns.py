@@ -61,7 +61,7 @@ def emit(
     # fmt: on
 
     # lookup for destination
-    idx = allocation.values.index(entry.destination)
+    idx = allocation.values.get(entry.destination.id)
 
     if idx in allocation.colors:
         dst = Register(name=system_v[allocation.colors[idx]])
@@ -72,7 +72,7 @@ def emit(
     if isinstance(entry.expression, LiteralAcceptance):
         src = Immediate(value=entry.expression.target)
     else:
-        idx = allocation.values.index(entry.expression.target)
+        idx = allocation.values.get(entry.expression.target.id)
 
         if idx in allocation.colors:
             src = Register(name=system_v[allocation.colors[idx]])
@@ -75,7 +75,7 @@ def emit(
     # before any call we need to pass the arguments
     if shuffle := shuffles.find(entry.target.callsite):
 
-        # first direct register moves
+        # moves are already ordered, loads and immediates come last
         for move in shuffle.moves:
             if isinstance(move, ShuffleMove):
                 instructions.append(
@@ -87,9 +87,7 @@ def emit(
                     )
                 )
 
-        # then register exchanges
-        for move in shuffle.moves:
-            if isinstance(move, ShuffleExchange):
+            elif isinstance(move, ShuffleExchange):
                 instructions.append(
                     XCHG(
                         operands=(
@@ -99,9 +97,7 @@ def emit(
                     )
                 )
 
-        # then register loads from memory
-        for move in shuffle.moves:
-            if isinstance(move, ShuffleLoad):
+            elif isinstance(move, ShuffleLoad):
                 instructions.append(
                     MOV(
                         operands=(
@@ -114,9 +110,7 @@ def emit(
                     )
                 )
 
-        # finally direct immediate moves
-        for move in shuffle.moves:
-            if isinstance(move, ShuffleImmediate):
+            elif isinstance(move, ShuffleImmediate):
                 instructions.append(
                     MOV(
                         operands=(
@@ -40,8 +40,11 @@ def build_control_flows(
         # derive function ID from globally unique node ID
         function_id = FunctionId(value=nid.value)
 
-        entry = FlowEntry(value=generator.next())
-        exit = FlowExit(value=generator.next())
+        # entry and exit ids depend only on the function they belong to
+        scope = generator.scope(b"cflows/" + str(function_id.value).encode())
+
+        entry = FlowEntry(value=scope.next())
+        exit = FlowExit(value=scope.next())
 
         nodes: list[FlowMember] = [entry]
         forward: dict[int, list[int]] = {}
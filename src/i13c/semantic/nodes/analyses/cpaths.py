@@ -2,7 +2,7 @@ from collections.abc import Iterable
 
 from i13c.core.graph import GraphNode, GraphViews
 from i13c.core.mapping import OneToOne
-from i13c.semantic.typing.analyses.cpaths import ControlPaths
+from i13c.semantic.typing.analyses.cpaths import ControlPaths, ControlPathView
 from i13c.semantic.typing.entities.functions import FunctionId
 from i13c.semantic.typing.resolutions.cflows import ControlFlowAcceptance
 
@@ -18,6 +18,7 @@ def configure_control_paths() -> GraphNode:
             }
         ),
         views=GraphViews(list=ListExtractor),
+        partition="cflows",
     )
 
 
@@ -26,40 +27,16 @@ def build_control_paths(
 ) -> OneToOne[FunctionId, ControlPaths]:
     cpaths: dict[FunctionId, ControlPaths] = {}
 
+    # paths are only listed on demand, analyses walk the flows instead
     for fid, entry in cflows.items():
         cpaths[fid] = ControlPaths(
             flows=entry,
-            paths=analyze_flows(entry),
+            paths=ControlPathView(flows=entry.source),
         )
 
     return OneToOne[FunctionId, ControlPaths].instance(cpaths)
 
 
-def analyze_flows(flows: ControlFlowAcceptance) -> list[list[int]]:
-    stack: list[list[int]] = [[flows.source.entry]]
-    paths: list[list[int]] = []
-
-    while stack:
-        path = stack.pop()
-        node = path[-1]
-
-        while True:
-            if forward := flows.source.forward.get(node, []):
-                if len(forward) > 1:
-                    for target in forward[1:]:
-                        stack.append(path + [target])
-
-                # dispatch next iteration
-                path.append(forward[0])
-                node = forward[0]
-
-            if len(forward) == 0 or node == flows.source.exit:
-                paths.append(path)
-                break
-
-    return paths
-
-
 class ListExtractor:
     def __init__(self, data: OneToOne[FunctionId, ControlPaths]):
         self.data = data
@@ -80,5 +57,9 @@ class ListExtractor:
         return {
             "ref": str(entry.flows.ref),
             "fn": key.identify(1),
-            "paths": str(len(entry.paths)),
+            "paths": (
+                f"{len(entry.paths)}+"
+                if entry.paths.truncated()
+                else str(len(entry.paths))
+            ),
         }
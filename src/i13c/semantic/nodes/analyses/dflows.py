@@ -3,7 +3,7 @@ from collections.abc import Iterable
 from i13c.core.graph import GraphNode, GraphViews
 from i13c.core.mapping import OneToOne
 from i13c.semantic.typing.analyses.cflows import ControlFlows, FlowNode
-from i13c.semantic.typing.analyses.dflows import DataFlows
+from i13c.semantic.typing.analyses.dflows import DataFlows, FlowValues
 from i13c.semantic.typing.entities.functions import FunctionId
 from i13c.semantic.typing.entities.statements import StatementId
 from i13c.semantic.typing.resolutions.assigns import AssignAcceptance
@@ -44,7 +44,7 @@ def build_data_flows(
             ref=entry.ref,
             target=fid,
             nodes=entry.nodes,
-            values=[],
+            values=FlowValues(),
             forward={},
             backward={},
             defs={},
@@ -73,8 +73,7 @@ def handle_entry(dflow: DataFlows, nid: int, target: FunctionAcceptance):
     dflow.uses[nid] = []
 
     for param in target.signature.parameters:
-        idx = len(dflow.values)
-        dflow.values.append(param)
+        idx = dflow.values.append(param)
         dflow.defs[nid].append(idx)
         dflow.forward[idx] = []
         dflow.backward[idx] = []
@@ -82,8 +81,7 @@ def handle_entry(dflow: DataFlows, nid: int, target: FunctionAcceptance):
 
 def handle_node(dflow: DataFlows, nid: int, stmt: StatementAcceptance):
     if isinstance(stmt.target, CallAcceptance):
-        idx = len(dflow.values)
-        dflow.values.append(stmt.target.target)
+        idx = dflow.values.append(stmt.target.target)
         dflow.defs[nid] = []
         dflow.uses[nid] = []
         dflow.forward[idx] = []
@@ -97,42 +95,32 @@ def handle_node(dflow: DataFlows, nid: int, stmt: StatementAcceptance):
             dflow.values.append(clobber)
 
         for arg in stmt.target.target.arguments:
-            if isinstance(arg, ParameterAcceptance):
-                for nix, node in enumerate(dflow.values):
-                    if isinstance(node, ParameterAcceptance):  # noqa: SIM102
-                        if node.id == arg.id:
-                            dflow.forward[nix].append(idx)
-                            dflow.backward[idx].append(nix)
-                            dflow.uses[nid].append(nix)
-
-            elif isinstance(arg, ValueAcceptance):
-                for nix, node in enumerate(dflow.values):
-                    if isinstance(node, ValueAcceptance):  # noqa: SIM102
-                        if node.id == arg.id:
-                            dflow.forward[nix].append(idx)
-                            dflow.backward[idx].append(nix)
-                            dflow.uses[nid].append(nix)
+            if isinstance(arg, (ParameterAcceptance, ValueAcceptance)):
+                nix = dflow.values.find(arg.id)
+
+                if nix is not None:
+                    dflow.forward[nix].append(idx)
+                    dflow.backward[idx].append(nix)
+                    dflow.uses[nid].append(nix)
 
     if isinstance(stmt.target, AssignAcceptance):
-        idx = len(dflow.values)
-        dflow.values.append(stmt.target.destination)
+        idx = dflow.values.append(stmt.target.destination)
         dflow.defs[nid] = [idx]
         dflow.uses[nid] = []
         dflow.forward[idx] = []
         dflow.backward[idx] = []
 
         if isinstance(stmt.target.expression, ExpressionAcceptance):
-            for nix, node in enumerate(dflow.values):
-                if isinstance(node, (ParameterAcceptance, ValueAcceptance)): # noqa: SIM102
-                    if node.id == stmt.target.expression.target.id:
-                        dflow.forward[nix].append(idx)
-                        dflow.backward[idx].append(nix)
-                        dflow.uses[nid].append(nix)
+            nix = dflow.values.find(stmt.target.expression.target.id)
+
+            if nix is not None:
+                dflow.forward[nix].append(idx)
+                dflow.backward[idx].append(nix)
+                dflow.uses[nid].append(nix)
 
         # an assignment with literal makes short-lived inline edge
         if isinstance(stmt.target.expression, LiteralAcceptance):
-            off = len(dflow.values)
-            dflow.values.append(stmt.target.expression)
+            off = dflow.values.append(stmt.target.expression)
             dflow.forward[off] = [idx]
             dflow.backward[off] = []
             dflow.backward[idx].append(off)
@@ -25,6 +25,7 @@ def configure_frames() -> GraphNode:
             }
         ),
         views=GraphViews(list=ListExtractor),
+        partition="allocations",
     )
 
 
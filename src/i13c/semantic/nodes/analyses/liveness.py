@@ -1,5 +1,7 @@
 from collections.abc import Iterable
 
+from i13c.core.bitsets import BitSets, encode_bits
+from i13c.core.dataflow import DataflowGraph, DataflowProblem, solve
 from i13c.core.graph import GraphNode, GraphViews
 from i13c.core.mapping import OneToOne
 from i13c.semantic.typing.analyses.cflows import ControlFlows
@@ -20,6 +22,7 @@ def configure_liveness() -> GraphNode:
             }
         ),
         views=GraphViews(list=ListExtractor),
+        partition="dflows",
     )
 
 
@@ -30,29 +33,27 @@ def build_liveness(
     liveness: dict[FunctionId, Liveness] = {}
 
     for dflow in dflows.values():
-        worklist = list(range(len(dflow.nodes)))
         cflow = cflows.get(dflow.target)
+        size = len(dflow.nodes)
 
-        clobbers: dict[int, set[int]] = {node: set() for node in worklist}
-        live_in: dict[int, set[int]] = {node: set() for node in worklist}
-        live_out: dict[int, set[int]] = {node: set() for node in worklist}
+        # bit N of a vector stands for the N-th DFG value
+        gen = [encode_bits(dflow.uses[node]) for node in range(size)]
+        kill = [encode_bits(dflow.defs[node]) for node in range(size)]
 
-        # iterate until no changes occur
-        while worklist:
-            node = worklist.pop()
-
-            # compute live_out as union of live_in of successors
-            for successor in cflow.forward.get(node, []):
-                live_out[node].update(live_in[successor])
+        graph = DataflowGraph(
+            size=size,
+            roots=[cflow.entry],
+            forward=cflow.forward,
+            backward=cflow.backward,
+        )
 
-            # compute live_in as union of uses and live_out minus defs
-            defined = live_out[node] - set(dflow.defs[node])
-            new_live_in = set(dflow.uses[node]).union(defined)
+        # live_out is what flows into a node from its successors
+        problem = DataflowProblem(
+            direction="backward", meet="union", gen=gen, kill=kill
+        )
+        result = solve(graph, problem)
 
-            # if live_in[node] has changed
-            if new_live_in != live_in[node]:
-                live_in[node] = new_live_in
-                worklist.extend(cflow.backward.get(node, []))
+        clobbers: dict[int, set[int]] = {node: set() for node in range(size)}
 
         for node, items in dflow.clobbers.items():
             clobbers[node].update(items)
@@ -62,8 +63,8 @@ def build_liveness(
             target=dflow.target,
             nodes=cflow.nodes,
             values=dflow.values,
-            live_in=live_in,
-            live_out=live_out,
+            live_in=BitSets(bits=result.after),
+            live_out=BitSets(bits=result.before),
             clobbers=clobbers,
         )
 
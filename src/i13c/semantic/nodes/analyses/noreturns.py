@@ -1,9 +1,11 @@
 from collections.abc import Iterable
 from typing import Literal
 
+from i13c.core.dataflow import find_components, propagate
 from i13c.core.graph import GraphNode, GraphViews
 from i13c.core.mapping import OneToMany, OneToOne
-from i13c.semantic.typing.analyses.cflows import FlowEntry, FlowExit, FlowMember
+from i13c.semantic.typing.analyses.cflows import FlowExit, FlowNode
+from i13c.semantic.typing.analyses.cgraphs import CallGraph
 from i13c.semantic.typing.analyses.cpaths import ControlPaths
 from i13c.semantic.typing.analyses.noreturns import NoReturn
 from i13c.semantic.typing.entities.flags import FlagsId
@@ -27,6 +29,7 @@ def configure_noreturns() -> GraphNode:
                 ("cpaths", "indices/cpaths/signatures"),
                 ("signatures", "resolutions/signatures/accepted"),
                 ("callsites", "indices/callsites/statements"),
+                ("cgraphs", "analyses/cgraphs"),
             }
         ),
         views=GraphViews(list=ListExtractor),
@@ -39,6 +42,7 @@ def build_noreturns(
     cpaths: OneToOne[SignatureId, ControlPaths],
     signatures: OneToOne[SignatureId, SignatureAcceptance],
     callsites: OneToMany[StatementId, CallSiteAcceptance],
+    cgraphs: OneToOne[SignatureId, CallGraph],
 ) -> OneToOne[SignatureId, NoReturn]:
     noreturns: dict[SignatureId, NoReturn] = {}
 
@@ -55,28 +59,47 @@ def build_noreturns(
             outcome=noreturn,
         )
 
-    changed = True
-    while changed:
-        changed = False
+    def update(sig: SignatureId) -> bool:
+        # skip already processed signatures and snippets
+        if sig in noreturns or not cpaths.contains(sig):
+            return False
 
-        for sig, entry in cpaths.items():
+        noreturn = is_function_noreturn(noreturns, callsites, cpaths.get(sig))
 
-            # skip already processed signatures
-            if sig in noreturns:
-                continue
+        if noreturn is None:
+            return False
 
-            noreturn = is_function_noreturn(noreturns, callsites, entry)
-            changed = changed or noreturn is not None
+        signature = signatures.get(sig)
+        outcome = isinstance(noreturn, NoReturn)
+
+        noreturns[sig] = NoReturn(
+            signature=signature,
+            path=(
+                [noreturn.signature] + noreturn.path
+                if isinstance(noreturn, NoReturn)
+                else []
+            ),
+            outcome=outcome,
+        )
+
+        return True
 
-            if noreturn is not None:
-                signature = signatures.get(sig)
-                outcome = isinstance(noreturn, NoReturn)
+    def callees(sig: SignatureId) -> list[SignatureId]:
+        return [entry.id for entry in cgraphs.get(sig).forward]
 
-                noreturns[sig] = NoReturn(
-                    signature=signature,
-                    path=[noreturn.signature] + noreturn.path if isinstance(noreturn, NoReturn) else [],
-                    outcome=outcome,
-                )
+    # callees are decided before their callers, so each component is visited once
+    for component in find_components(cgraphs.keys(), callees):
+        members = set(component)
+
+        # only recursive components iterate, a resolved member revisits its callers
+        callers = {
+            sig: [
+                entry.id for entry in cgraphs.get(sig).backward if entry.id in members
+            ]
+            for sig in component
+        }
+
+        propagate(component, callers, update)
 
     return OneToOne[SignatureId, NoReturn].instance(noreturns)
 
@@ -86,55 +109,70 @@ def is_function_noreturn(
     callsites: OneToMany[StatementId, CallSiteAcceptance],
     target: ControlPaths,
 ) -> NoReturn | None | Literal[False]:
-    noreturn: NoReturn | None | Literal[False] = None
-
-    # if any path is returning, the function is returning
-    for idx in range(len(target.paths)):
-        noreturn = is_path_noreturn(
-            noreturns,
-            callsites,
-            target.paths[idx],
-            target.flows.source.nodes,
-        )
+    flows = target.flows.source
+
+    witness: NoReturn | None = None
+    undecided = False
+
+    # walk the flows from the entry, never past a node which does not return
+    visited: set[int] = {flows.entry}
+    worklist: list[int] = [flows.entry]
 
-        if noreturn is False:
+    while worklist:
+        idx = worklist.pop()
+        node = flows.nodes[idx]
+
+        # if we reach a flow exit, the function is returning
+        if isinstance(node, FlowExit):
             return False
 
-        if noreturn is None:
-            return None
+        if isinstance(node, FlowNode):
+            noreturn = is_node_noreturn(noreturns, callsites, node)
 
-    assert isinstance(noreturn, NoReturn)
-    return noreturn
+            if noreturn is None:
+                undecided = True
+                continue
 
+            if noreturn is not False:
+                witness = witness or noreturn
+                continue
 
-def is_path_noreturn(
-    noreturns: dict[SignatureId, NoReturn],
-    callsites: OneToMany[StatementId, CallSiteAcceptance],
-    paths: list[int],
-    nodes: list[FlowMember],
-) -> NoReturn | None | Literal[False]:
-    for node in paths:
-        node = nodes[node]
+        successors = flows.forward.get(idx, [])
 
-        # if we encounter a flow exit, the path is returning
-        if isinstance(node, FlowExit):
+        # a dead end is returning as well
+        if not successors:
             return False
 
-        if isinstance(node, FlowEntry):
-            continue
+        for successor in successors:
+            if successor not in visited:
+                visited.add(successor)
+                worklist.append(successor)
 
-        for callsite in callsites.find(node.target):
-            noreturn = noreturns.get(callsite.signature.id)
+    # no returning path found, but some callees are not recognized yet
+    if undecided:
+        return None
 
-            # if the callee is already known to be not returning, we can report the path as not returning
-            if noreturn is not None and noreturn.outcome:
-                return noreturn
+    assert witness is not None
+    return witness
 
-            # if the callee is not recognized yet, we cannot make a decision about the path
-            elif noreturn is None:
-                return None
 
-    # all paths are returning, so we can report the path as returning
+def is_node_noreturn(
+    noreturns: dict[SignatureId, NoReturn],
+    callsites: OneToMany[StatementId, CallSiteAcceptance],
+    node: FlowNode,
+) -> NoReturn | None | Literal[False]:
+    for callsite in callsites.find(node.target):
+        noreturn = noreturns.get(callsite.signature.id)
+
+        # if the callee is already known to be not returning, the node is not returning
+        if noreturn is not None and noreturn.outcome:
+            return noreturn
+
+        # if the callee is not recognized yet, we cannot make a decision about the node
+        elif noreturn is None:
+            return None
+
+    # all callees are returning, so the node is returning
     return False
 
 
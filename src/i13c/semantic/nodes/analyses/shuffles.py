@@ -1,9 +1,10 @@
+from collections import deque
 from collections.abc import Iterable
 
 from i13c.core.graph import GraphNode, GraphViews
 from i13c.core.mapping import OneToOne
 from i13c.semantic.core import Hex
-from i13c.semantic.typing.analyses.allocations import Allocation, AllocationValue
+from i13c.semantic.typing.analyses.allocations import Allocation, AllocationValues
 from i13c.semantic.typing.analyses.callings import Calling, CallingArgument
 from i13c.semantic.typing.analyses.shuffles import (
     Shuffle,
@@ -31,6 +32,7 @@ def configure_shuffles() -> GraphNode:
             }
         ),
         views=GraphViews(list=ListExtractor),
+        partition="allocations",
     )
 
 
@@ -60,12 +62,12 @@ def build_shuffles(
                     for arg, bind in zip(calling.arguments, calling.bindings)
                 }
 
-                moves = build_moves(
-                    build_mapping(
-                        allocation.values, colors, allocation.spills, arguments
-                    )
+                mapping = build_mapping(
+                    allocation.values, colors, allocation.spills, arguments
                 )
 
+                moves = build_moves(mapping, system_v[allocation.scratch])
+
                 callsites.append(
                     ShuffleCallSite(
                         calling=calling,
@@ -87,7 +89,7 @@ ShuffleMapping = list[tuple[bytes | Hex | int, bytes]]
 
 
 def build_mapping(
-    values: list[AllocationValue],
+    values: AllocationValues,
     colors: dict[int, bytes],
     spills: dict[int, int],
     arguments: dict[bytes, CallingArgument],
@@ -101,7 +103,7 @@ def build_mapping(
             mapping.append((argument.target, dst))
 
         if isinstance(argument, (ParameterAcceptance, ValueAcceptance)):
-            idx = values.index(argument)
+            idx = values.get(argument.id)
 
             # param/value may be colored
             if idx in colors:
@@ -114,56 +116,80 @@ def build_mapping(
     return mapping
 
 
-def build_moves(mapping: ShuffleMapping) -> list[ShuffleMoves]:
+def build_moves(
+    mapping: ShuffleMapping, scratch: bytes | None = None
+) -> list[ShuffleMoves]:
     moves: list[ShuffleMoves] = []
+    loads: list[ShuffleMoves] = []
+    immediates: list[ShuffleMoves] = []
+
+    # Register -> Register whose value it receives
+    pending: dict[bytes, bytes] = {}
+
+    for src, dst in mapping:
+        # literal values can be moved directly to the destination
+        if isinstance(src, Hex):
+            immediates.append(ShuffleImmediate(src=src, dst=dst))
+
+        # spilled values can be loaded directly to the destination
+        elif isinstance(src, int):
+            loads.append(ShuffleLoad(src=src, dst=dst))
+
+        # nothing to move if the source and destination are the same
+        elif src != dst:
+            pending[dst] = src
+
+    # Register -> Register currently holding its original value
+    location = {src: src for src in pending.values()}
+
+    # the scratch register may be used only if no move touches it
+    if scratch in pending or scratch in location:
+        scratch = None
 
-    while mapping:
-        changed = False
-
-        for src, dst in list(mapping):
-            # literal values can be moved directly to the destination
-            if isinstance(src, Hex):
-                moves.append(ShuffleImmediate(src=src, dst=dst))
-                mapping.remove((src, dst))
-                changed = True
-
-            # spilled values can be loaded directly to the destination
-            elif isinstance(src, int):
-                moves.append(ShuffleLoad(src=src, dst=dst))
-                mapping.remove((src, dst))
-                changed = True
-
-            # nothing to move if the source and destination are the same
-            elif src == dst:
-                mapping.remove((src, dst))
-                changed = True
-
-            # if the destination is not a source, we can move it directly
-            elif not any(dst == src for src, _ in mapping):
-                moves.append(ShuffleMove(src=src, dst=dst))
-                mapping.remove((src, dst))
-                changed = True
-
-        # if we can't find a direct move, we need to exchange
-        if not changed:
-            break
-
-    while mapping:
-        src, dst = mapping.pop(0)
-        assert isinstance(src, bytes)
-
-        # xchg may caused a no-op
-        if src == dst:
+    # destinations which are not a source can be written right away
+    ready = deque(dst for dst in pending if dst not in location)
+
+    def drain() -> None:
+        while ready:
+            dst = ready.popleft()
+            src = pending[dst]
+
+            moves.append(ShuffleMove(src=location[src], dst=dst))
+
+            # the first copy frees a source which is a destination as well
+            if location[src] == src and src in pending:
+                location[src] = dst
+                ready.append(src)
+
+    drain()
+
+    # only registers of a cycle still hold their original value
+    for dst in pending:
+        if location.get(dst) != dst:
             continue
 
-        moves.append(ShuffleExchange(src=src, dst=dst))
+        # one spare move breaks the whole cycle
+        if scratch is not None:
+            moves.append(ShuffleMove(src=dst, dst=scratch))
+            location[dst] = scratch
+            ready.append(dst)
+            drain()
+
+        # otherwise each exchange settles one register along the cycle
+        else:
+            node = dst
+
+            while pending[node] != dst:
+                src = pending[node]
+                moves.append(ShuffleExchange(src=src, dst=node))
+
+                location[src] = node
+                node = src
 
-        # update the mapping to reflect the exchange
-        for idx, (a, b) in enumerate(list(mapping)):
-            if a == dst:
-                mapping[idx] = (src, b)
+            location[dst] = node
 
-    return moves
+    # loads and immediates never overwrite a pending source
+    return moves + loads + immediates
 
 
 class ListExtractor:
@@ -1,5 +1,6 @@
 from collections.abc import Iterable
 
+from i13c.core.dataflow import DataflowGraph, order_reachable
 from i13c.core.graph import GraphNode, GraphViews
 from i13c.core.mapping import OneToOne
 from i13c.semantic.typing.analyses.allocations import Allocation
@@ -23,6 +24,7 @@ def configure_spills() -> GraphNode:
             }
         ),
         views=GraphViews(list=ListExtractor),
+        partition="allocations",
     )
 
 
@@ -45,21 +47,17 @@ def build_spills(
         cflow = cflows.get(fid)
         dflow = dflows.get(fid)
 
-        worklist: list[int] = [cflow.entry]
-        visited: set[int] = set()
-
-        while worklist:
-            idx = worklist.pop()
-            visited.add(idx)
+        graph = DataflowGraph(
+            size=len(cflow.nodes),
+            roots=[cflow.entry],
+            forward=cflow.forward,
+            backward=cflow.backward,
+        )
 
-            # prepare node
+        # each node reachable from the entry is visited exactly once
+        for idx in order_reachable(graph):
             entries[idx] = []
 
-            # schedule successors
-            for successor in cflow.forward.get(idx, []):
-                if successor not in visited:
-                    worklist.append(successor)
-
             for value in dflow.defs[idx]:
                 if value in allocation.spills:  # noqa: SIM102
                     if isinstance(dflow.values[value], ValueAcceptance):
@@ -4,6 +4,7 @@ from typing import TypeVar
 
 from i13c.core.generator import Generator
 from i13c.core.graph import GraphGroup, GraphNode
+from i13c.core.identifiers import Identifier
 from i13c.syntax import tree
 from i13c.syntax.tree.core import Path
 
@@ -11,9 +12,8 @@ AstNode = TypeVar("AstNode")
 AstCtx = TypeVar("AstCtx")
 
 
-@dataclass(kw_only=True, frozen=True)
-class NodeId:
-    value: int
+class NodeId(Identifier):
+    __slots__ = ()
 
 
 @dataclass(kw_only=True)
@@ -51,15 +51,28 @@ class Bidirectional[AstNode, AstCtx]:
 class NodesVisitor:
     def __init__(self, generator: Generator) -> None:
         self.generator = generator
+        self.scope = generator
         self.graph = SyntaxGraph.empty()
 
+        # occurrences of every declaration name to keep their scopes apart
+        self.declarations: dict[bytes, int] = {}
+
     def next(self) -> NodeId:
-        return NodeId(value=self.generator.next())
+        return NodeId(value=self.scope.next())
+
+    def enter(self, kind: bytes, name: bytes) -> None:
+        # nodes of a declaration keep their ids when other declarations change
+        key = kind + b"/" + name
+        occurrence = self.declarations.get(key, 0)
+
+        self.declarations[key] = occurrence + 1
+        self.scope = self.generator.scope(key + b"/" + str(occurrence).encode())
 
     def on_program(self, program: tree.Program, path: Path) -> None:
         pass
 
     def on_snippet(self, snippet: tree.snippet.Snippet, path: Path) -> None:
+        self.enter(b"snippet", snippet.signature.name)
         self.graph.snippet.snippets.append(self.next(), snippet)
 
     def on_flags(self, flags: tree.Flags, path: Path) -> None:
@@ -129,6 +142,7 @@ class NodesVisitor:
         self.graph.snippet.addresses.append(self.next(), address)
 
     def on_function(self, function: tree.function.Function, path: Path) -> None:
+        self.enter(b"function", function.signature.name)
         self.graph.function.functions.append(self.next(), function)
 
     def on_parameter(self, parameter: tree.function.Parameter, path: Path) -> None:
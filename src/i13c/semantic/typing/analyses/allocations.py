@@ -1,10 +1,24 @@
 from dataclasses import dataclass
+from typing import Literal
 
-from i13c.semantic.typing.analyses.dflows import FlowValue
+from i13c.semantic.typing.analyses.dflows import FlowValue, FlowValues
 from i13c.semantic.typing.entities.functions import FunctionId
 from i13c.syntax.source import Span
 
 AllocationValue = FlowValue
+AllocationValues = FlowValues
+
+# graph coloring allocates better, linear scan allocates faster
+Allocator = Literal["coloring", "linear"]
+
+
+@dataclass(kw_only=True)
+class AllocationInterval:
+    value: int
+
+    # first and last CFG Node where the value is live
+    start: int
+    end: int
 
 
 @dataclass(kw_only=True, repr=False)
@@ -12,7 +26,7 @@ class Allocation:
     ref: Span
     target: FunctionId
 
-    values: list[AllocationValue]
+    values: AllocationValues
     scratch: int
 
     # DGF Node -> Register
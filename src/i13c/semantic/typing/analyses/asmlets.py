@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from i13c.core.identifiers import Identifier
 from i13c.semantic.core import Hex
 from i13c.semantic.typing.entities.instructions import InstructionId
 from i13c.semantic.typing.entities.snippets import SnippetId
@@ -11,9 +12,8 @@ from i13c.semantic.typing.resolutions.signatures import SignatureAcceptance
 from i13c.syntax.source import Span
 
 
-@dataclass(kw_only=True, frozen=True)
-class AsmletId:
-    value: int
+class AsmletId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("asmlet", f"{self.value:<{length}}"))
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from i13c.core.identifiers import Identifier
 from i13c.semantic.typing.analyses.asmlets import AsmletId
 from i13c.semantic.typing.analyses.fnlets import FnletInstruction
 from i13c.semantic.typing.analyses.llvm import (
@@ -28,9 +29,8 @@ BlockletTarget = FunctionId | AsmletId
 BlockletInstruction = FnletInstruction | AsmletInstruction
 
 
-@dataclass(kw_only=True, frozen=True)
-class BlockletId:
-    value: int
+class BlockletId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("blocklet", f"{self.value:<{length}}"))
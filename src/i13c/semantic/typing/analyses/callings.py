@@ -13,17 +13,17 @@ from i13c.syntax.source import Span
 CallingTarget = Asmlet | CallSiteAcceptance
 CallingArgument = CallSiteArgument
 
-@dataclass(kw_only=True, eq=False, repr=False)
+@dataclass(kw_only=True, repr=False)
 class CallingBinding:
     name: bytes
 
 
-@dataclass(kw_only=True, eq=False, repr=False)
+@dataclass(kw_only=True, repr=False)
 class CallingClobber:
     name: bytes
 
 
-@dataclass(kw_only=True, eq=False, repr=False)
+@dataclass(kw_only=True, repr=False)
 class CallingUnbound:
     name: bytes
 
@@ -1,9 +1,71 @@
-from dataclasses import dataclass
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import overload
 
+from i13c.semantic.typing.analyses.cflows import ControlFlows
 from i13c.semantic.typing.resolutions.cflows import ControlFlowAcceptance
 
+# path count grows exponentially with branching, so only a prefix is listed
+PATHS_LIMIT = 256
+
+
+@dataclass(kw_only=True)
+class ControlPathView(Sequence[list[int]]):
+    flows: ControlFlows
+    limit: int = PATHS_LIMIT
+
+    # paths are enumerated on the first access only
+    cache: list[list[int]] | None = field(default=None, compare=False, repr=False)
+
+    def enumerate(self) -> list[list[int]]:
+        if self.cache is None:
+            self.cache = list(islice(generate_paths(self.flows), self.limit + 1))
+
+        return self.cache[: self.limit]
+
+    def truncated(self) -> bool:
+        self.enumerate()
+
+        assert self.cache is not None
+        return len(self.cache) > self.limit
+
+    @overload
+    def __getitem__(self, idx: int) -> list[int]: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[list[int]]: ...
+
+    def __getitem__(self, idx: int | slice) -> list[int] | list[list[int]]:
+        return self.enumerate()[idx]
+
+    def __len__(self) -> int:
+        return len(self.enumerate())
+
 
 @dataclass(kw_only=True)
 class ControlPaths:
     flows: ControlFlowAcceptance
-    paths: list[list[int]]
+    paths: ControlPathView
+
+
+def generate_paths(flows: ControlFlows) -> Iterator[list[int]]:
+    stack: list[list[int]] = [[flows.entry]]
+
+    while stack:
+        path = stack.pop()
+        node = path[-1]
+
+        while True:
+            if forward := flows.forward.get(node, []):
+                if len(forward) > 1:
+                    for target in forward[1:]:
+                        stack.append(path + [target])
+
+                # dispatch next iteration
+                path.append(forward[0])
+                node = forward[0]
+
+            if len(forward) == 0 or node == flows.exit:
+                yield path
+                break
@@ -1,8 +1,12 @@
-from dataclasses import dataclass
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import overload
 
 from i13c.semantic.typing.analyses.callings import Calling, CallingClobber
 from i13c.semantic.typing.analyses.cflows import FlowMember
 from i13c.semantic.typing.entities.functions import FunctionId
+from i13c.semantic.typing.entities.parameters import ParameterId
+from i13c.semantic.typing.entities.values import ValueId
 from i13c.semantic.typing.resolutions.literals import LiteralAcceptance
 from i13c.semantic.typing.resolutions.parameters import ParameterAcceptance
 from i13c.semantic.typing.resolutions.values import ValueAcceptance
@@ -12,6 +16,47 @@ FlowValue = (
     ParameterAcceptance | ValueAcceptance | LiteralAcceptance | Calling | CallingClobber
 )
 
+FlowValueId = ParameterId | ValueId
+
+
+@dataclass(kw_only=True)
+class FlowValues(Sequence[FlowValue]):
+    items: list[FlowValue] = field(default_factory=list)
+
+    # Parameter / Value ID -> DFG Node
+    indices: dict[FlowValueId, int] = field(default_factory=dict, repr=False)
+
+    def append(self, value: FlowValue) -> int:
+        idx = len(self.items)
+        self.items.append(value)
+
+        # parameters and values are defined once, so the first index wins
+        if isinstance(value, (ParameterAcceptance, ValueAcceptance)):
+            self.indices.setdefault(value.id, idx)
+
+        return idx
+
+    def get(self, id: FlowValueId) -> int:
+        return self.indices[id]
+
+    def find(self, id: FlowValueId) -> int | None:
+        return self.indices.get(id)
+
+    @overload
+    def __getitem__(self, idx: int) -> FlowValue: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[FlowValue]: ...
+
+    def __getitem__(self, idx: int | slice) -> FlowValue | list[FlowValue]:
+        return self.items[idx]
+
+    def __iter__(self) -> Iterator[FlowValue]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
 
 @dataclass(kw_only=True)
 class DataFlows:
@@ -19,7 +64,7 @@ class DataFlows:
     target: FunctionId
 
     nodes: list[FlowMember]
-    values: list[FlowValue]
+    values: FlowValues
 
     # DFG Node -> DFG Nodes
     forward: dict[int, list[int]]
@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 
+from i13c.core.bitsets import BitSets
 from i13c.semantic.typing.analyses.cflows import FlowMember
-from i13c.semantic.typing.analyses.dflows import FlowValue
+from i13c.semantic.typing.analyses.dflows import FlowValues
 from i13c.semantic.typing.entities.functions import FunctionId
 from i13c.syntax.source import Span
 
@@ -12,11 +13,11 @@ class Liveness:
     target: FunctionId
 
     nodes: list[FlowMember]
-    values: list[FlowValue]
+    values: FlowValues
 
     # CFG Node -> DFG Values
-    live_in: dict[int, set[int]]
-    live_out: dict[int, set[int]]
+    live_in: BitSets
+    live_out: BitSets
 
     # CFG Node -> DFG Nodes
     clobbers: dict[int, set[int]]
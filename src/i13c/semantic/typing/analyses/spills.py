@@ -1,12 +1,13 @@
 from dataclasses import dataclass
 
 from i13c.semantic.typing.analyses.cflows import FlowMember
-from i13c.semantic.typing.analyses.dflows import FlowValue
+from i13c.semantic.typing.analyses.dflows import FlowValue, FlowValues
 from i13c.semantic.typing.entities.functions import FunctionId
 from i13c.syntax.source import Span
 
 SpillNode = FlowMember
 SpillValue = FlowValue
+SpillValues = FlowValues
 
 
 @dataclass(kw_only=True)
@@ -33,7 +34,7 @@ class Spill:
     exit: int
 
     nodes: list[SpillNode]
-    values: list[SpillValue]
+    values: SpillValues
 
     # CFG Node -> CFG Nodes
     forward: dict[int, list[int]]
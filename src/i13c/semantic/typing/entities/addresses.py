@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Literal as Kind
 
+from i13c.core.identifiers import Identifier
 from i13c.semantic.typing.entities.immediates import ImmediateId
 from i13c.semantic.typing.entities.references import ReferenceId
 from i13c.semantic.typing.entities.registers import RegisterId
@@ -10,9 +11,8 @@ OffsetKind = Kind["forward", "backward"]
 BaseRegister = RegisterId | ReferenceId
 
 
-@dataclass(kw_only=True, frozen=True)
-class AddressId:
-    value: int
+class AddressId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("address", f"{self.value:<{length}}"))
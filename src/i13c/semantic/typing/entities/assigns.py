@@ -2,6 +2,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Protocol, TypeVar
 
+from i13c.core.identifiers import Identifier
 from i13c.semantic.syntax import NodeId
 from i13c.semantic.typing.entities.expressions import ExpressionId
 from i13c.semantic.typing.entities.literals import LiteralId
@@ -11,9 +12,8 @@ from i13c.syntax.source import Span
 AssignExpression = LiteralId | ExpressionId
 
 
-@dataclass(kw_only=True, frozen=True)
-class AssignId:
-    value: int
+class AssignId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("assign", f"{self.value:<{length}}"))
@@ -1,12 +1,12 @@
 from dataclasses import dataclass
 
+from i13c.core.identifiers import Identifier
 from i13c.semantic.typing.entities.parameters import ParameterId
 from i13c.syntax.source import Span
 
 
-@dataclass(kw_only=True, frozen=True)
-class BindId:
-    value: int
+class BindId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("bind", f"{self.value:<{length}}"))
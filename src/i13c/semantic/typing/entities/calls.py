@@ -2,14 +2,14 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Protocol, TypeVar
 
+from i13c.core.identifiers import Identifier
 from i13c.semantic.syntax import NodeId
 from i13c.semantic.typing.entities.callsites import CallSiteId
 from i13c.syntax.source import Span
 
 
-@dataclass(kw_only=True, frozen=True)
-class CallId:
-    value: int
+class CallId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("call", f"{self.value:<{length}}"))
@@ -2,6 +2,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Protocol, TypeVar
 
+from i13c.core.identifiers import Identifier
 from i13c.semantic.syntax import NodeId
 from i13c.semantic.typing.entities.expressions import ExpressionId
 from i13c.semantic.typing.entities.literals import LiteralId
@@ -10,9 +11,8 @@ from i13c.syntax.source import Span
 CallSiteTarget = LiteralId | ExpressionId
 
 
-@dataclass(kw_only=True, frozen=True)
-class CallSiteId:
-    value: int
+class CallSiteId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("callsite", f"{self.value:<{length}}"))
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Literal as Kind
 
+from i13c.core.identifiers import Identifier
 from i13c.semantic.typing.entities.labels import LabelId
 from i13c.semantic.typing.entities.signatures import SignatureId
 from i13c.semantic.typing.entities.snippets import SnippetId
@@ -10,9 +11,8 @@ EnvironmentKind = Kind["snippet"]
 EnvironmentTarget = SignatureId | LabelId
 
 
-@dataclass(kw_only=True, frozen=True)
-class EnvironmentId:
-    value: int
+class EnvironmentId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("environment", f"{self.value:<{length}}"))
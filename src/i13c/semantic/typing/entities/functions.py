@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from i13c.core.identifiers import Identifier
 from i13c.semantic.syntax import NodeId
 from i13c.semantic.typing.entities.flags import FlagsId
 from i13c.semantic.typing.entities.signatures import SignatureId
@@ -7,9 +8,8 @@ from i13c.semantic.typing.entities.statements import StatementId
 from i13c.syntax.source import Span
 
 
-@dataclass(kw_only=True, frozen=True)
-class FunctionId:
-    value: int
+class FunctionId(Identifier):
+    __slots__ = ()
 
     @staticmethod
     def from_context(nid: NodeId) -> FunctionId:
@@ -1,12 +1,12 @@
 from dataclasses import dataclass
 
+from i13c.core.identifiers import Identifier
 from i13c.semantic.core import Hex
 from i13c.syntax.source import Span
 
 
-@dataclass(kw_only=True, frozen=True)
-class ImmediateId:
-    value: int
+class ImmediateId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("immediate", f"{self.value:<{length}}"))
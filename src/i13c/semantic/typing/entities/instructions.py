@@ -2,15 +2,15 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Protocol, TypeVar
 
+from i13c.core.identifiers import Identifier
 from i13c.semantic.syntax import NodeId
 from i13c.semantic.typing.entities.mnemonics import MnemonicId
 from i13c.semantic.typing.entities.operands import OperandId
 from i13c.syntax.source import Span
 
 
-@dataclass(kw_only=True, frozen=True)
-class InstructionId:
-    value: int
+class InstructionId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("instruction", f"{self.value:<{length}}"))
@@ -2,6 +2,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import TypeVar
 
+from i13c.core.identifiers import Identifier
 from i13c.semantic.syntax import NodeId
 from i13c.semantic.typing.entities.instructions import InstructionId
 from i13c.syntax.source import Span
@@ -16,9 +17,8 @@ class EndOfSnippet:
 LabelTarget = InstructionId | EndOfSnippet
 
 
-@dataclass(kw_only=True, frozen=True)
-class LabelId:
-    value: int
+class LabelId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("label", f"{self.value:<{length}}"))
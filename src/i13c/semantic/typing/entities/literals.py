@@ -1,12 +1,12 @@
 from dataclasses import dataclass
 
+from i13c.core.identifiers import Identifier
 from i13c.semantic.core import Hex, Type
 from i13c.syntax.source import Span
 
 
-@dataclass(kw_only=True, frozen=True)
-class LiteralId:
-    value: int
+class LiteralId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("literal", f"{self.value:<{length}}"))
@@ -1,11 +1,11 @@
 from dataclasses import dataclass
 
+from i13c.core.identifiers import Identifier
 from i13c.syntax.source import Span
 
 
-@dataclass(kw_only=True, frozen=True)
-class MnemonicId:
-    value: int
+class MnemonicId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("mnemonic", f"{self.value:<{length}}"))
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Literal as Kind
 
+from i13c.core.identifiers import Identifier
 from i13c.semantic.typing.entities.addresses import AddressId
 from i13c.semantic.typing.entities.immediates import ImmediateId
 from i13c.semantic.typing.entities.references import ReferenceId
@@ -11,9 +12,8 @@ OperandKind = Kind["register", "immediate", "reference", "address"]
 OperandTarget = RegisterId | ImmediateId | ReferenceId | AddressId
 
 
-@dataclass(kw_only=True, frozen=True)
-class OperandId:
-    value: int
+class OperandId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("operand", f"{self.value:<{length}}"))
@@ -1,12 +1,12 @@
 from dataclasses import dataclass
 
+from i13c.core.identifiers import Identifier
 from i13c.semantic.typing.entities.types import TypeId
 from i13c.syntax.source import Span
 
 
-@dataclass(kw_only=True, frozen=True)
-class ParameterId:
-    value: int
+class ParameterId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("parameter", f"{self.value:<{length}}"))
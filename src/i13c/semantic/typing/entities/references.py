@@ -2,13 +2,13 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import TypeVar
 
+from i13c.core.identifiers import Identifier
 from i13c.semantic.syntax import NodeId
 from i13c.syntax.source import Span
 
 
-@dataclass(kw_only=True, frozen=True)
-class ReferenceId:
-    value: int
+class ReferenceId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("reference", f"{self.value:<{length}}"))
@@ -1,11 +1,11 @@
 from dataclasses import dataclass
 
+from i13c.core.identifiers import Identifier
 from i13c.syntax.source import Span
 
 
-@dataclass(kw_only=True, frozen=True)
-class RegisterId:
-    value: int
+class RegisterId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("register", f"{self.value:<{length}}"))
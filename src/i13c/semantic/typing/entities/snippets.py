@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from i13c.core.identifiers import Identifier
 from i13c.semantic.syntax import NodeId
 from i13c.semantic.typing.entities.flags import FlagsId
 from i13c.semantic.typing.entities.instructions import InstructionId
@@ -10,9 +11,8 @@ from i13c.syntax.source import Span
 InstructionOrLabel = InstructionId | LabelId
 
 
-@dataclass(kw_only=True, frozen=True)
-class SnippetId:
-    value: int
+class SnippetId(Identifier):
+    __slots__ = ()
 
     @staticmethod
     def from_context(nid: NodeId) -> SnippetId:
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from i13c.core.identifiers import Identifier
 from i13c.semantic.syntax import NodeId
 from i13c.semantic.typing.entities.assigns import AssignId
 from i13c.semantic.typing.entities.calls import CallId
@@ -8,9 +9,8 @@ from i13c.syntax.source import Span
 StatementTarget = AssignId | CallId
 
 
-@dataclass(kw_only=True, frozen=True)
-class StatementId:
-    value: int
+class StatementId(Identifier):
+    __slots__ = ()
 
     @staticmethod
     def from_context(nid: NodeId) -> StatementId:
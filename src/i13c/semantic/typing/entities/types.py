@@ -1,12 +1,12 @@
 from dataclasses import dataclass
 
+from i13c.core.identifiers import Identifier
 from i13c.semantic.typing.entities.ranges import RangeId
 from i13c.syntax.source import Span
 
 
-@dataclass(kw_only=True, frozen=True)
-class TypeId:
-    value: int
+class TypeId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("type", f"{self.value:<{length}}"))
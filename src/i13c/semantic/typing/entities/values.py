@@ -2,6 +2,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import TypeVar
 
+from i13c.core.identifiers import Identifier
 from i13c.semantic.syntax import NodeId
 from i13c.semantic.typing.entities.types import TypeId
 from i13c.syntax.source import Span
@@ -9,9 +10,8 @@ from i13c.syntax.source import Span
 ValueContext = TypeVar("ValueContext")
 
 
-@dataclass(kw_only=True, frozen=True)
-class ValueId:
-    value: int
+class ValueId(Identifier):
+    __slots__ = ()
 
     def identify(self, length: int) -> str:
         return "#".join(("value", f"{self.value:<{length}}"))
@@ -1,8 +1,11 @@
+import re
+from array import array
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 
 from i13c.core import result
 from i13c.core.diagnostics import Diagnostic
-from i13c.syntax.source import SourceCode, Span
+from i13c.syntax.source import SourceBuffer, SourceCode, Span
 
 # - tabulators and other whitespace characters are
 #   on purpose excluded to enforce only spaces and newlines
@@ -92,6 +95,67 @@ TOKEN_NAMES: dict[int, str] = {
 }
 # fmt: on
 
+# actions of the byte-class table, anything else is unrecognized
+ACTION_INVALID = 0
+ACTION_SINGLE = 1
+ACTION_DOT = 2
+ACTION_ZERO = 3
+ACTION_LETTER = 4
+
+SINGLE_TOKENS: dict[bytes, int] = {
+    CLASS_SEMICOLON: Tokens.SEMICOLON,
+    CLASS_COMMA: Tokens.COMMA,
+    CLASS_ROUND_OPEN: Tokens.ROUND_OPEN,
+    CLASS_ROUND_CLOSE: Tokens.ROUND_CLOSE,
+    CLASS_CURLY_OPEN: Tokens.CURLY_OPEN,
+    CLASS_CURLY_CLOSE: Tokens.CURLY_CLOSE,
+    CLASS_SQUARE_OPEN: Tokens.SQUARE_OPEN,
+    CLASS_SQUARE_CLOSE: Tokens.SQUARE_CLOSE,
+    CLASS_AT: Tokens.AT,
+    CLASS_COLON: Tokens.COLON,
+    CLASS_EQUALS: Tokens.EQUALS,
+    CLASS_PLUS: Tokens.PLUS,
+    CLASS_MINUS: Tokens.MINUS,
+}
+
+
+def build_actions() -> list[int]:
+    table = [ACTION_INVALID] * 256
+
+    for chars in SINGLE_TOKENS:
+        table[chars[0]] = ACTION_SINGLE
+
+    for char in CLASS_LETTER:
+        table[char] = ACTION_LETTER
+
+    table[CLASS_DOT[0]] = ACTION_DOT
+    table[CLASS_ZERO[0]] = ACTION_ZERO
+
+    return table
+
+
+def build_singles() -> list[int]:
+    table = [0] * 256
+
+    for chars, code in SINGLE_TOKENS.items():
+        table[chars[0]] = code
+
+    return table
+
+
+def build_membership(chars: bytes) -> list[bool]:
+    return [value in chars for value in range(256)]
+
+
+TABLE_ACTIONS = build_actions()
+TABLE_SINGLES = build_singles()
+TABLE_SEPARATORS = build_membership(SEPARATORS)
+
+# runs of bytes are consumed by the regex engine in a single call
+PATTERN_WHITESPACE = re.compile(b"[" + re.escape(CLASS_WHITESPACE) + b"]*")
+PATTERN_HEX = re.compile(b"[" + CLASS_HEX + b"]*")
+PATTERN_IDENT = re.compile(b"[" + CLASS_ALPHANUM + CLASS_UNDERSCORE + b"]*")
+
 
 class TooLargeHex(Exception):
     def __init__(self, offset: int, length: int) -> None:
@@ -110,175 +174,93 @@ class UnexpectedEndOfFile(Exception):
         self.offset = offset
 
 
-@dataclass(kw_only=True)
-class Lexer:
-    code: SourceCode
-    offset: int
-
-    def is_eof(self) -> bool:
-        return self.code.is_eof(self.offset)
-
-    def is_in(self, *n: bytes) -> bool:
-        if self.is_eof():
-            return False
-
-        return any(self.code.at(self.offset) in chars for chars in n)
-
-    def extract(self, token: Token) -> bytes:
-        return self.code.extract(token)
-
-    def advance(self, n: int) -> None:
-        self.offset += n
-
-    def expect(self, n: bytes) -> None:
-        if self.is_eof():
-            raise UnexpectedEndOfFile(self.offset)
-
-        if not self.is_in(n):
-            raise UnexpectedValue(self.offset, n)
-
-
 @dataclass(kw_only=True)
 class Reference:
     offset: int
     length: int
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Token:
     code: int
     offset: int
     length: int
 
-    @staticmethod
-    def semicolon_token(offset: int) -> Token:
-        return Token(code=Tokens.SEMICOLON, offset=offset, length=1)
-
-    @staticmethod
-    def comma_token(offset: int) -> Token:
-        return Token(code=Tokens.COMMA, offset=offset, length=1)
-
-    @staticmethod
-    def eof_token(offset: int) -> Token:
-        return Token(code=Tokens.EOF, offset=offset, length=0)
-
-    @staticmethod
-    def hex_token(offset: int, length: int) -> Token:
-        return Token(code=Tokens.HEX, offset=offset, length=length)
-
-    @staticmethod
-    def ident_token(offset: int, length: int) -> Token:
-        return Token(code=Tokens.IDENT, offset=offset, length=length)
 
-    @staticmethod
-    def dot_token(offset: int) -> Token:
-        return Token(code=Tokens.DOT, offset=offset, length=1)
+@dataclass(kw_only=True)
+class TokenStream:
+    # one column per token field, tokens are only materialized on access
+    codes: array[int]
+    offsets: array[int]
+    lengths: array[int]
 
     @staticmethod
-    def range_token(offset: int, length: int) -> Token:
-        return Token(code=Tokens.RANGE, offset=offset, length=length)
+    def empty() -> TokenStream:
+        return TokenStream(codes=array("B"), offsets=array("I"), lengths=array("I"))
 
     @staticmethod
-    def keyword_token(offset: int, length: int) -> Token:
-        return Token(code=Tokens.KEYWORD, offset=offset, length=length)
+    def of(tokens: Iterable[Token]) -> TokenStream:
+        stream = TokenStream.empty()
 
-    @staticmethod
-    def round_open_token(offset: int) -> Token:
-        return Token(code=Tokens.ROUND_OPEN, offset=offset, length=1)
+        for token in tokens:
+            stream.append(token.code, token.offset, token.length)
 
-    @staticmethod
-    def round_close_token(offset: int) -> Token:
-        return Token(code=Tokens.ROUND_CLOSE, offset=offset, length=1)
+        return stream
 
-    @staticmethod
-    def curly_open_token(offset: int) -> Token:
-        return Token(code=Tokens.CURLY_OPEN, offset=offset, length=1)
+    def append(self, code: int, offset: int, length: int) -> None:
+        self.codes.append(code)
+        self.offsets.append(offset)
+        self.lengths.append(length)
 
-    @staticmethod
-    def curly_close_token(offset: int) -> Token:
-        return Token(code=Tokens.CURLY_CLOSE, offset=offset, length=1)
+    def __len__(self) -> int:
+        return len(self.codes)
 
-    @staticmethod
-    def square_open_token(offset: int) -> Token:
-        return Token(code=Tokens.SQUARE_OPEN, offset=offset, length=1)
+    def __getitem__(self, idx: int) -> Token:
+        return Token(
+            code=self.codes[idx],
+            offset=self.offsets[idx],
+            length=self.lengths[idx],
+        )
 
-    @staticmethod
-    def square_close_token(offset: int) -> Token:
-        return Token(code=Tokens.SQUARE_CLOSE, offset=offset, length=1)
+    def __iter__(self) -> Iterator[Token]:
+        for idx in range(len(self.codes)):
+            yield self[idx]
 
-    @staticmethod
-    def at_token(offset: int) -> Token:
-        return Token(code=Tokens.AT, offset=offset, length=1)
 
-    @staticmethod
-    def colon_token(offset: int) -> Token:
-        return Token(code=Tokens.COLON, offset=offset, length=1)
+def tokenize(code: SourceCode) -> result.Result[TokenStream, list[Diagnostic]]:
+    data = code.data
+    size = len(data)
 
-    @staticmethod
-    def equals_token(offset: int) -> Token:
-        return Token(code=Tokens.EQUALS, offset=offset, length=1)
-
-
-def tokenize(code: SourceCode) -> result.Result[list[Token], list[Diagnostic]]:
-    tokens: list[Token] = []
+    offset = 0
+    tokens = TokenStream.empty()
     diagnostics: list[Diagnostic] = []
-    lexer = Lexer(code=code, offset=0)
 
     try:
-        while not lexer.is_eof():
-            skip_whitespace(lexer)
-
-            if lexer.is_in(CLASS_SEMICOLON):
-                emit_semicolon(lexer, tokens)
-
-            elif lexer.is_in(CLASS_COMMA):
-                emit_comma(lexer, tokens)
-
-            elif lexer.is_in(CLASS_ROUND_OPEN):
-                emit_round_open(lexer, tokens)
-
-            elif lexer.is_in(CLASS_ROUND_CLOSE):
-                emit_round_close(lexer, tokens)
-
-            elif lexer.is_in(CLASS_CURLY_OPEN):
-                emit_curly_open(lexer, tokens)
-
-            elif lexer.is_in(CLASS_CURLY_CLOSE):
-                emit_curly_close(lexer, tokens)
-
-            elif lexer.is_in(CLASS_SQUARE_OPEN):
-                emit_square_open(lexer, tokens)
-
-            elif lexer.is_in(CLASS_SQUARE_CLOSE):
-                emit_square_close(lexer, tokens)
-
-            elif lexer.is_in(CLASS_AT):
-                emit_at(lexer, tokens)
+        while True:
+            offset = PATTERN_WHITESPACE.match(data, offset).end()  # type: ignore
 
-            elif lexer.is_in(CLASS_COLON):
-                emit_colon(lexer, tokens)
-
-            elif lexer.is_in(CLASS_EQUALS):
-                emit_equals(lexer, tokens)
+            if offset >= size:
+                break
 
-            elif lexer.is_in(CLASS_PLUS):
-                emit_plus(lexer, tokens)
+            # a single lookup decides how to continue with the current byte
+            action = TABLE_ACTIONS[data[offset]]
 
-            elif lexer.is_in(CLASS_MINUS):
-                emit_minus(lexer, tokens)
+            if action == ACTION_SINGLE:
+                tokens.append(TABLE_SINGLES[data[offset]], offset, 1)
+                offset += 1
 
-            elif lexer.is_in(CLASS_DOT):
-                read_dot(lexer, tokens)
+            elif action == ACTION_LETTER:
+                offset = read_ident(data, offset, tokens)
 
-            elif lexer.is_in(CLASS_ZERO):
-                read_hex(lexer, tokens)
+            elif action == ACTION_ZERO:
+                offset = read_hex(data, offset, tokens)
 
-            elif lexer.is_in(CLASS_LETTER):
-                read_ident(lexer, tokens)
+            elif action == ACTION_DOT:
+                offset = read_dot(data, offset, tokens)
 
             # unrecognized token
-            elif not lexer.is_eof():
-                diagnostics.append(report_e1000_unrecognized_token(lexer.offset))
+            else:
+                diagnostics.append(report_e1000_unrecognized_token(offset))
                 break
 
     except TooLargeHex as e:
@@ -295,150 +277,69 @@ def tokenize(code: SourceCode) -> result.Result[list[Token], list[Diagnostic]]:
         return result.Err(diagnostics)
 
     # append last EOF token
-    tokens.append(Token.eof_token(offset=lexer.offset))
+    tokens.append(Tokens.EOF, offset, 0)
 
     return result.Ok(tokens)
 
 
-def skip_whitespace(lexer: Lexer) -> None:
-    while not lexer.is_eof() and lexer.is_in(CLASS_WHITESPACE):
-        lexer.advance(1)
-
-
-def read_dot(lexer: Lexer, tokens: list[Token]) -> None:
-    start_offset = lexer.offset
-    lexer.advance(1)  # consume the '.'
-
+def read_dot(data: SourceBuffer, offset: int, tokens: TokenStream) -> int:
     # perhaps it's a single dot token
-    if not lexer.is_in(CLASS_DOT):
-        token = Token.dot_token(offset=start_offset)
+    if offset + 1 >= len(data) or data[offset + 1] not in CLASS_DOT:
+        tokens.append(Tokens.DOT, offset, 1)
+        return offset + 1
 
     # handle range token with two dots
-    else:
-        lexer.advance(1)  # consume the second '.'
-        token = Token.range_token(offset=start_offset, length=2)
+    tokens.append(Tokens.RANGE, offset, 2)
+    return offset + 2
 
-    # success
-    tokens.append(token)
 
+def read_hex(data: SourceBuffer, offset: int, tokens: TokenStream) -> int:
+    size = len(data)
 
-def read_hex(lexer: Lexer, tokens: list[Token]) -> None:
-    start_offset = lexer.offset
-    lexer.advance(1)  # consume the '0'
+    # the '0' must be followed by 'x'
+    if offset + 1 >= size:
+        raise UnexpectedEndOfFile(offset + 1)
 
-    lexer.expect(b"x")
-    lexer.advance(1)  # consume the 'x'
+    if data[offset + 1] not in b"x":
+        raise UnexpectedValue(offset + 1, b"x")
 
     # be explicit about EOF
-    if lexer.is_eof():
-        raise UnexpectedEndOfFile(lexer.offset)
+    if offset + 2 >= size:
+        raise UnexpectedEndOfFile(offset + 2)
 
-    # accept subsequent hex digits
-    while not lexer.is_eof() and lexer.is_in(CLASS_HEX):
-        lexer.advance(1)  # consume hex digits
+    end = PATTERN_HEX.match(data, offset + 2).end()  # type: ignore
 
-        # literals larger than 16 hex digits are rejected, even with leading zeros
-        # it is design decision to limit hex literals to 64 bits to simplify the lexer
-        if lexer.offset - start_offset > 18:
-            raise TooLargeHex(start_offset, lexer.offset - start_offset)
+    # literals larger than 16 hex digits are rejected, even with leading zeros
+    # it is design decision to limit hex literals to 64 bits to simplify the lexer
+    if end - offset > 18:
+        raise TooLargeHex(offset, 19)
 
     # 0x alone is not valid hex
-    if lexer.offset - start_offset <= 2:
-        raise UnexpectedValue(lexer.offset, CLASS_HEX)
+    if end - offset <= 2:
+        raise UnexpectedValue(end, CLASS_HEX)
 
     # expect either EOF or valid character after hex
-    if not lexer.is_eof() and not lexer.is_in(SEPARATORS):
-        raise UnexpectedValue(lexer.offset, SEPARATORS)
+    if end < size and not TABLE_SEPARATORS[data[end]]:
+        raise UnexpectedValue(end, SEPARATORS)
 
-    length = lexer.offset - start_offset
-    tokens.append(Token.hex_token(offset=start_offset, length=length))
+    tokens.append(Tokens.HEX, offset, end - offset)
+    return end
 
 
-def read_ident(lexer: Lexer, tokens: list[Token]) -> None:
-    start_offset = lexer.offset
-    lexer.advance(1)  # consume first letter
-
-    # accept subsequent letters or digits
-    while not lexer.is_eof() and lexer.is_in(CLASS_ALPHANUM + CLASS_UNDERSCORE):
-        lexer.advance(1)  # consume letters and digits
+def read_ident(data: SourceBuffer, offset: int, tokens: TokenStream) -> int:
+    end = PATTERN_IDENT.match(data, offset + 1).end()  # type: ignore
 
     # expect either EOF or valid character after ident
-    if not lexer.is_eof() and not lexer.is_in(SEPARATORS):
-        raise UnexpectedValue(lexer.offset, SEPARATORS)
-
-    length = lexer.offset - start_offset
-    token = Token.ident_token(offset=start_offset, length=length)
+    if end < len(data) and not TABLE_SEPARATORS[data[end]]:
+        raise UnexpectedValue(end, SEPARATORS)
 
     # perhaps it's a keyword
-    if lexer.extract(token) in SET_KEYWORDS:
-        token = Token.keyword_token(offset=start_offset, length=length)
-
-    tokens.append(token)
-
-
-def emit_semicolon(lexer: Lexer, tokens: list[Token]) -> None:
-    tokens.append(Token.semicolon_token(offset=lexer.offset))
-    lexer.advance(1)  # consume semicolon
-
-
-def emit_comma(lexer: Lexer, tokens: list[Token]) -> None:
-    tokens.append(Token.comma_token(offset=lexer.offset))
-    lexer.advance(1)  # consume comma
-
-
-def emit_round_open(lexer: Lexer, tokens: list[Token]) -> None:
-    tokens.append(Token.round_open_token(offset=lexer.offset))
-    lexer.advance(1)  # consume '('
-
-
-def emit_round_close(lexer: Lexer, tokens: list[Token]) -> None:
-    tokens.append(Token.round_close_token(offset=lexer.offset))
-    lexer.advance(1)  # consume ')'
-
-
-def emit_curly_open(lexer: Lexer, tokens: list[Token]) -> None:
-    tokens.append(Token.curly_open_token(offset=lexer.offset))
-    lexer.advance(1)  # consume '{'
-
-
-def emit_curly_close(lexer: Lexer, tokens: list[Token]) -> None:
-    tokens.append(Token.curly_close_token(offset=lexer.offset))
-    lexer.advance(1)  # consume '}'
-
-
-def emit_square_open(lexer: Lexer, tokens: list[Token]) -> None:
-    tokens.append(Token.square_open_token(offset=lexer.offset))
-    lexer.advance(1)  # consume '['
-
-
-def emit_square_close(lexer: Lexer, tokens: list[Token]) -> None:
-    tokens.append(Token.square_close_token(offset=lexer.offset))
-    lexer.advance(1)  # consume ']'
-
-
-def emit_colon(lexer: Lexer, tokens: list[Token]) -> None:
-    tokens.append(Token.colon_token(offset=lexer.offset))
-    lexer.advance(1)  # consume ':'
-
-
-def emit_at(lexer: Lexer, tokens: list[Token]) -> None:
-    tokens.append(Token.at_token(offset=lexer.offset))
-    lexer.advance(1)  # consume '@'
-
-
-def emit_equals(lexer: Lexer, tokens: list[Token]) -> None:
-    tokens.append(Token.equals_token(offset=lexer.offset))
-    lexer.advance(1)  # consume '='
-
-
-def emit_plus(lexer: Lexer, tokens: list[Token]) -> None:
-    tokens.append(Token(code=Tokens.PLUS, offset=lexer.offset, length=1))
-    lexer.advance(1)  # consume '+'
-
+    if bytes(data[offset:end]) in SET_KEYWORDS:
+        tokens.append(Tokens.KEYWORD, offset, end - offset)
+    else:
+        tokens.append(Tokens.IDENT, offset, end - offset)
 
-def emit_minus(lexer: Lexer, tokens: list[Token]) -> None:
-    tokens.append(Token(code=Tokens.MINUS, offset=lexer.offset, length=1))
-    lexer.advance(1)  # consume '-'
+    return end
 
 
 def report_e1000_unrecognized_token(offset: int) -> Diagnostic:
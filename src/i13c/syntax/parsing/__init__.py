@@ -1,8 +1,7 @@
 from i13c.core import result
 from i13c.core.diagnostics import Diagnostic
 from i13c.syntax import tree
-from i13c.syntax.lexing import TOKEN_NAMES, Tokens
-from i13c.syntax.lexing import Token as LexingToken
+from i13c.syntax.lexing import TOKEN_NAMES, Tokens, TokenStream
 from i13c.syntax.parsing.core import (
     FlagAlreadySpecified,
     InvalidHexLiteral,
@@ -17,9 +16,9 @@ from i13c.syntax.source import SourceCode, Span, SpanLike
 
 
 def parse(
-    code: SourceCode, tokens: list[LexingToken]
+    code: SourceCode, tokens: TokenStream, base: int = 0
 ) -> result.Result[tree.Program, list[Diagnostic]]:
-    state = ParsingState(code=code, tokens=tokens, position=0)
+    state = ParsingState(code=code, tokens=tokens, position=0, base=base)
     diagnostics: list[Diagnostic] = []
 
     snippets: list[tree.snippet.Snippet] = []
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 from i13c.syntax.lexing import Token as LexingToken
-from i13c.syntax.lexing import Tokens
+from i13c.syntax.lexing import Tokens, TokenStream
 from i13c.syntax.source import SourceCode, Span
 
 
@@ -37,28 +37,30 @@ class InvalidHexLiteral(Exception):
         self.token = token
 
 
-
 @dataclass(kw_only=True)
 class ParsingState:
     code: SourceCode
-    tokens: list[LexingToken]
+    tokens: TokenStream
     position: int
 
+    # offset of the file within its compilation unit, applied to all spans
+    base: int = 0
+
     def is_eof(self) -> bool:
-        return self.tokens[self.position].code == Tokens.EOF
+        return self.tokens.codes[self.position] == Tokens.EOF
 
     def is_in(self, *codes: int) -> bool:
-        return self.tokens[self.position].code in codes
+        return self.tokens.codes[self.position] in codes
 
     def span(self, token: LexingToken) -> Span:
         return Span(
-            offset=token.offset,
+            offset=self.base + token.offset,
             length=token.length,
         )
 
     def between(self, left: LexingToken, right: LexingToken) -> Span:
         return Span(
-            offset=left.offset,
+            offset=self.base + left.offset,
             length=right.offset + right.length - left.offset,
         )
 
@@ -72,13 +74,13 @@ class ParsingState:
 
     def expect(self, *codes: int) -> LexingToken:
         if self.is_eof():
-            raise UnexpectedEndOfTokens(self.tokens[self.position].offset)
+            raise UnexpectedEndOfTokens(self.tokens.offsets[self.position])
 
-        if self.tokens[self.position].code not in codes:
+        if self.tokens.codes[self.position] not in codes:
             raise UnexpectedTokenCode(
                 self.tokens[self.position],
                 list(codes),
-                self.tokens[self.position].code,
+                self.tokens.codes[self.position],
             )
 
         # consume token
@@ -1,5 +1,11 @@
+import bisect
+import mmap
+import os
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Protocol, Self
+
+# mapped files are read in place without copying them into bytes
+SourceBuffer = bytes | mmap.mmap
 
 
 @dataclass
@@ -18,7 +24,7 @@ class SpanLike(Protocol):
 
 @dataclass(kw_only=True)
 class SourceCode:
-    data: bytes
+    data: SourceBuffer
 
     def is_eof(self, offset: int) -> bool:
         return offset >= len(self.data)
@@ -27,8 +33,65 @@ class SourceCode:
         return self.data[offset]
 
     def extract(self, span: SpanLike) -> bytes:
-        return self.data[span.offset : span.offset + span.length]
+        # only the span is copied, bytes are returned as they are
+        return bytes(self.data[span.offset : span.offset + span.length])
+
+    def line(self, offset: int) -> tuple[int, bytes]:
+        start = self.data.rfind(b"\n", 0, offset) + 1
+
+        if (end := self.data.find(b"\n", offset)) < 0:
+            end = len(self.data)
+
+        return start, bytes(self.data[start:end])
+
+    def close(self) -> None:
+        # only mapped files hold a resource, plain bytes are left alone
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+@dataclass(kw_only=True)
+class SourceFile:
+    path: str
+    code: SourceCode
+
+    # offset of the first byte within the compilation unit
+    base: int
+
+
+@dataclass(kw_only=True)
+class SourceMap:
+    files: list[SourceFile]
+
+    def locate(self, offset: int) -> SourceFile:
+        bases = [entry.base for entry in self.files]
+        return self.files[max(0, bisect.bisect_right(bases, offset) - 1)]
+
+    def close(self) -> None:
+        for entry in self.files:
+            entry.code.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
 
 
 def open_text(data: str) -> SourceCode:
     return SourceCode(data=data.encode("utf-8"))
+
+
+def open_file(path: str) -> SourceCode:
+    with open(path, "rb") as f:
+        # empty files cannot be mapped
+        if not (size := os.fstat(f.fileno()).st_size):
+            return SourceCode(data=b"")
+
+        return SourceCode(data=mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ))
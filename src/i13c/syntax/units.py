@@ -0,0 +1,109 @@
+import os
+from collections.abc import Iterable
+from concurrent.futures import Executor
+
+from i13c.core import result
+from i13c.core.diagnostics import Diagnostic
+from i13c.syntax import tree
+from i13c.syntax.lexing import tokenize
+from i13c.syntax.parsing import parse
+from i13c.syntax.source import SourceFile, SourceMap, Span, open_file
+
+SOURCE_EXTENSION = ".i13c"
+
+
+def find_sources(paths: Iterable[str]) -> list[str]:
+    sources: list[str] = []
+
+    for path in paths:
+        if not os.path.isdir(path):
+            sources.append(path)
+            continue
+
+        # directories contribute their sources in a stable order
+        for directory, _, files in sorted(os.walk(path)):
+            for name in sorted(files):
+                if name.endswith(SOURCE_EXTENSION):
+                    sources.append(os.path.join(directory, name))
+
+    return sources
+
+
+def open_sources(paths: Iterable[str]) -> SourceMap:
+    base, files = 0, []
+
+    for path in paths:
+        code = open_file(path)
+        files.append(SourceFile(path=path, code=code, base=base))
+
+        # one spare offset keeps the end of file within its own file
+        base += len(code.data) + 1
+
+    return SourceMap(files=files)
+
+
+def relocate(diagnostics: list[Diagnostic], base: int) -> list[Diagnostic]:
+    return [
+        Diagnostic(
+            ref=Span(offset=base + entry.ref.offset, length=entry.ref.length),
+            code=entry.code,
+            message=entry.message,
+        )
+        for entry in diagnostics
+    ]
+
+
+def parse_file(path: str, base: int) -> result.Result[tree.Program, list[Diagnostic]]:
+    # workers map the file on their own, mapped buffers cannot be sent
+    with open_file(path) as code:
+        match tokenize(code):
+            case result.Err(diagnostics):
+                return result.Err(relocate(diagnostics, base))
+            case result.Ok(tokens):
+                pass
+
+        match parse(code, tokens, base):
+            case result.Err(diagnostics):
+                return result.Err(relocate(diagnostics, base))
+            case result.Ok(program):
+                return result.Ok(program)
+
+
+def merge_programs(programs: Iterable[tree.Program]) -> tree.Program:
+    functions: list[tree.function.Function] = []
+    snippets: list[tree.snippet.Snippet] = []
+
+    for program in programs:
+        functions.extend(program.functions)
+        snippets.extend(program.snippets)
+
+    return tree.Program(functions=functions, snippets=snippets)
+
+
+def parse_files(
+    sources: SourceMap, executor: Executor | None = None
+) -> result.Result[tree.Program, list[Diagnostic]]:
+    paths = [entry.path for entry in sources.files]
+    bases = [entry.base for entry in sources.files]
+
+    if executor is None:
+        outcomes = list(map(parse_file, paths, bases))
+    else:
+        chunksize = max(1, len(paths) // 64)
+        outcomes = list(executor.map(parse_file, paths, bases, chunksize=chunksize))
+
+    programs: list[tree.Program] = []
+    diagnostics: list[Diagnostic] = []
+
+    # every file is reported, not only the first failing one
+    for outcome in outcomes:
+        match outcome:
+            case result.Ok(program):
+                programs.append(program)
+            case result.Err(errors):
+                diagnostics.extend(errors)
+
+    if diagnostics:
+        return result.Err(diagnostics)
+
+    return result.Ok(merge_programs(programs))
@@ -0,0 +1,30 @@
+from i13c.bench.phases import PHASES, compare_results, run_benchmark
+from i13c.bench.programs import ProgramShape
+
+
+def can_time_front_end_and_graph_phases():
+    result = run_benchmark(ProgramShape(functions=4, snippets=2), repeat=1)
+
+    assert list(result.phases) == PHASES
+    assert result.lines > 0
+
+    for phase in ["tokenize", "parse", "syntax", "semantic"]:
+        assert (result.phases[phase] or 0.0) > 0
+
+
+def can_serialize_result_to_json():
+    result = run_benchmark(ProgramShape(functions=2, snippets=1), repeat=1)
+    data = result.to_json()
+
+    assert data["shape"]["functions"] == 2
+    assert set(data["phases"]) == set(PHASES)
+
+
+def can_compare_with_baseline():
+    result = run_benchmark(ProgramShape(functions=2, snippets=1), repeat=1)
+    baseline = {"phases": {"tokenize": (result.phases["tokenize"] or 0.0) * 2}}
+
+    ratios = compare_results(result, baseline)
+
+    assert ratios["tokenize"] == 0.5
+    assert ratios["parse"] is None
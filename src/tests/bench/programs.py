@@ -0,0 +1,40 @@
+from i13c.bench.programs import ProgramShape, generate_program
+from i13c.graph.nodes import run
+from tests.semantic import prepare_program
+
+
+def compile_program(shape: ProgramShape) -> tuple[str, int]:
+    text = generate_program(shape)
+    _, program = prepare_program(text)
+
+    return text, run(program).rules().count()
+
+
+def can_generate_program_without_diagnostics():
+    _, count = compile_program(ProgramShape(functions=8, snippets=3, depth=3))
+
+    assert count == 0
+
+
+def can_generate_program_with_wide_snippets():
+    shape = ProgramShape(functions=4, arguments=5, labels=4, branching=3)
+    text, count = compile_program(shape)
+
+    assert count == 0
+    assert text.count("loop @label") == 4 * 3
+
+
+def can_generate_requested_number_of_functions():
+    text = generate_program(ProgramShape(functions=10, snippets=2))
+
+    assert text.count("\nfn function") == 10
+    assert text.count("\nasm snippet") == 2
+
+
+def can_chain_functions_by_depth():
+    text = generate_program(ProgramShape(functions=6, depth=3))
+
+    assert "  function0(" in text
+    assert "  function3(" in text
+    assert "  function1(p0, p1);" in text
+    assert "  function3(p0, p1);" not in text
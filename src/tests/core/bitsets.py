@@ -0,0 +1,24 @@
+from i13c.core.bitsets import BitSets, decode_bits, encode_bits
+
+
+def can_encode_and_decode_bits():
+    items = {0, 3, 7, 8, 63, 64, 1000}
+
+    assert encode_bits([]) == 0
+    assert encode_bits([0, 3]) == 0b1001
+
+    assert decode_bits(0) == set()
+    assert decode_bits(encode_bits(items)) == items
+
+
+def can_view_bits_as_sets():
+    sets = BitSets(bits=[0, 0b101, 1 << 70])
+
+    assert len(sets) == 3
+    assert list(sets) == [0, 1, 2]
+
+    assert sets[1] == {0, 2}
+    assert sets[2] == {70}
+    assert sets == {0: set(), 1: {0, 2}, 2: {70}}
+
+    assert sets.get(3) is None
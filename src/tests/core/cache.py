@@ -0,0 +1,163 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+from i13c.core.cache import ArtifactCache, ArtifactRegistry, CacheEntry
+from i13c.core.graph import GraphNode, evaluate
+
+
+@dataclass(kw_only=True, eq=False)
+class Entity:
+    value: int
+
+
+@dataclass(kw_only=True)
+class Counter:
+    value: int
+
+
+def can_skip_builder_on_cache_hit(tmp_path: Path):
+    calls: list[int] = []
+
+    def build(entities: list[Entity]) -> int:
+        calls.append(len(entities))
+        return sum(entity.value for entity in entities)
+
+    node = GraphNode(
+        builder=build,
+        constraint=None,
+        produces=("result",),
+        requires=frozenset({("entities", "entities")}),
+    )
+
+    for _ in range(2):
+        cache = ArtifactCache(path=str(tmp_path))
+        initial = {"entities": [Entity(value=1), Entity(value=2)]}
+        _, artifacts = evaluate([node], initial=initial, cache=cache)
+
+        assert artifacts["result"] == 3
+
+    assert calls == [2]
+
+
+def can_rebuild_when_inputs_change(tmp_path: Path):
+    calls: list[int] = []
+
+    def build(entities: list[Entity]) -> int:
+        calls.append(len(entities))
+        return sum(entity.value for entity in entities)
+
+    node = GraphNode(
+        builder=build,
+        constraint=None,
+        produces=("result",),
+        requires=frozenset({("entities", "entities")}),
+    )
+
+    cache = ArtifactCache(path=str(tmp_path))
+    evaluate([node], initial={"entities": [Entity(value=1)]}, cache=cache)
+
+    initial = {"entities": [Entity(value=1), Entity(value=5)]}
+    _, artifacts = evaluate([node], initial=initial, cache=cache)
+
+    assert artifacts["result"] == 6
+    assert calls == [1, 2]
+
+
+def can_preserve_identity_of_input_objects(tmp_path: Path):
+    def build(entities: list[Entity]) -> dict[int, Entity]:
+        return {idx: entity for idx, entity in enumerate(entities)}
+
+    node = GraphNode(
+        builder=build,
+        constraint=None,
+        produces=("index",),
+        requires=frozenset({("entities", "entities")}),
+    )
+
+    cache = ArtifactCache(path=str(tmp_path))
+    evaluate([node], initial={"entities": [Entity(value=1)]}, cache=cache)
+
+    entities = [Entity(value=1)]
+    _, artifacts = evaluate([node], initial={"entities": entities}, cache=cache)
+
+    assert artifacts["index"][0] is entities[0]
+
+
+def can_preserve_identity_across_cached_nodes(tmp_path: Path):
+    def wrap(entities: list[Entity]) -> list[Entity]:
+        return [Entity(value=entity.value * 2) for entity in entities]
+
+    def index(wrapped: list[Entity]) -> dict[int, Entity]:
+        return {idx: entity for idx, entity in enumerate(wrapped)}
+
+    nodes = [
+        GraphNode(
+            builder=wrap,
+            constraint=None,
+            produces=("wrapped",),
+            requires=frozenset({("entities", "entities")}),
+        ),
+        GraphNode(
+            builder=index,
+            constraint=None,
+            produces=("index",),
+            requires=frozenset({("wrapped", "wrapped")}),
+        ),
+    ]
+
+    for _ in range(2):
+        cache = ArtifactCache(path=str(tmp_path))
+        initial = {"entities": [Entity(value=1)]}
+        _, artifacts = evaluate(nodes, initial=initial, cache=cache)
+
+        assert artifacts["index"][0] is artifacts["wrapped"][0]
+        assert artifacts["index"][0].value == 2
+
+
+def can_restore_state_of_serial_artifacts(tmp_path: Path):
+    def build(counter: Counter) -> int:
+        counter.value += 10
+        return counter.value
+
+    node = GraphNode(
+        builder=build,
+        constraint=None,
+        produces=("result",),
+        requires=frozenset({("counter", "core/counter")}),
+    )
+
+    serial = frozenset({"core/counter"})
+
+    for _ in range(2):
+        cache = ArtifactCache(path=str(tmp_path))
+        initial = {"core/counter": Counter(value=1)}
+        _, artifacts = evaluate([node], initial=initial, serial=serial, cache=cache)
+
+        assert artifacts["result"] == 11
+        assert artifacts["core/counter"].value == 11
+
+
+def can_treat_corrupted_entry_as_miss(tmp_path: Path):
+    cache = ArtifactCache(path=str(tmp_path))
+    registry = ArtifactRegistry()
+
+    cache.save("abcdef", registry, CacheEntry(dataset=[1, 2], states={}))
+
+    with open(cache.locate("abcdef"), "wb") as f:
+        f.write(b"garbage")
+
+    assert cache.load("abcdef", registry) is None
+    assert cache.load("missing", registry) is None
+
+
+def can_treat_unknown_reference_as_miss(tmp_path: Path):
+    cache = ArtifactCache(path=str(tmp_path))
+    entity = Entity(value=1)
+
+    registry = ArtifactRegistry()
+    registry.survey([entity])
+
+    cache.save("abcdef", registry, CacheEntry(dataset={0: entity}, states={}))
+
+    assert cache.load("abcdef", ArtifactRegistry()) is None
+    assert cache.load("abcdef", registry) is not None
@@ -0,0 +1,91 @@
+from i13c.core.dataflow import (
+    DataflowGraph,
+    DataflowProblem,
+    find_components,
+    order_reachable,
+    propagate,
+    solve,
+)
+
+
+def loop_graph() -> DataflowGraph:
+    # 0 -> 1 -> 2 -> 3, with 2 looping back to 1 and 4 unreachable
+    return DataflowGraph.instance(
+        size=5,
+        roots=[0],
+        forward={0: [1], 1: [2], 2: [1, 3], 3: [], 4: [3]},
+    )
+
+
+def can_solve_backward_union_problem():
+    graph = loop_graph()
+
+    # value 0 is defined at node 0 and used at node 2
+    problem = DataflowProblem(
+        direction="backward",
+        meet="union",
+        gen=[0, 0, 0b01, 0b10, 0],
+        kill=[0b01, 0, 0, 0, 0],
+    )
+
+    result = solve(graph, problem)
+
+    assert result.after == [0b10, 0b11, 0b11, 0b10, 0b10]
+    assert result.before == [0b11, 0b11, 0b11, 0, 0b10]
+
+
+def can_solve_forward_intersection_problem():
+    graph = loop_graph()
+
+    # facts available on every path from the entry
+    problem = DataflowProblem(
+        direction="forward",
+        meet="intersection",
+        gen=[0b001, 0b010, 0b100, 0, 0],
+        kill=[0, 0, 0b001, 0, 0],
+        universe=0b111,
+    )
+
+    result = solve(graph, problem)
+
+    # the loop kills fact 0 before it reaches node 1 again
+    assert result.after == [0b001, 0b010, 0b110, 0, 0]
+    assert result.before == [0, 0, 0b010, 0, 0]
+
+
+def can_order_reachable_nodes():
+    assert order_reachable(loop_graph()) == [0, 1, 2, 3]
+
+
+def can_propagate_changes_to_dependents():
+    values = {"a": 1, "b": 0, "c": 0}
+    calls: list[str] = []
+
+    # b follows a, c follows b
+    def update(node: str) -> bool:
+        calls.append(node)
+        source = {"a": None, "b": "a", "c": "b"}[node]
+
+        if source is None or values[node] == values[source]:
+            return False
+
+        values[node] = values[source]
+        return True
+
+    propagate(["c", "b", "a"], {"a": ["b"], "b": ["c"]}, update)
+
+    assert values == {"a": 1, "b": 1, "c": 1}
+    assert calls == ["c", "b", "a", "c"]
+
+
+def can_find_components_in_reverse_topological_order():
+    edges = {"a": ["b"], "b": ["c", "d"], "c": ["b"], "d": [], "e": ["e", "a"]}
+    components = find_components(edges.keys(), lambda node: edges[node])
+
+    # every component follows all components it depends on
+    assert [sorted(component) for component in components] == [
+        ["d"],
+        ["b", "c"],
+        ["a"],
+        ["e"],
+    ]
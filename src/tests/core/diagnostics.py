@@ -1,5 +1,7 @@
+from pathlib import Path
+
 from i13c.core.diagnostics import Diagnostic, show
-from i13c.syntax.source import Span, open_text
+from i13c.syntax.source import Span, open_file, open_text
 
 
 def left(text: str) -> str:
@@ -63,3 +65,25 @@ def can_show_caret_with_multiline_span():
                       |-> multiline diagnostic
         """
     )
+
+
+def can_show_caret_for_mapped_source(tmp_path: Path):
+    path = tmp_path / "main.i13c"
+    path.write_bytes(b"fn main() {\nexit(0x1);\n}\n")
+
+    diagnostic = Diagnostic(
+        ref=Span(offset=17, length=3),
+        code="EXXXX",
+        message="invalid immediate",
+    )
+
+    with open_file(str(path)) as source:
+        shown = show(source, diagnostic)
+
+    assert shown == left(
+        """
+            exit(0x1);
+                 ^^^
+                 |-> invalid immediate
+        """
+    )
@@ -1,17 +1,27 @@
 
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from threading import get_ident
+from typing import Any
+
 from pytest import raises
 
+from i13c.core.generator import Generator
 from i13c.core.graph import (
     CyclicDependencyError,
     DuplicateArtifactError,
     GraphGroup,
     GraphNode,
+    GraphSession,
     InvalidDatasetArityError,
     MissingArtifactProducerError,
     MissingPrefixProducerError,
     Prefix,
     evaluate,
+    find_closure,
+    schedule_waves,
 )
+from i13c.core.mapping import OneToOne
 
 
 def can_evaluate_one_node_without_dependencies():
@@ -367,3 +377,332 @@ def can_reject_multi_artifact_node_returning_wrong_tuple_arity():
     assert error.value.node is node
     assert error.value.expected == 2
     assert error.value.actual == 1
+
+
+def can_schedule_independent_nodes_into_same_wave():
+    node1: GraphNode = GraphNode(
+        builder=lambda: 1,
+        constraint=None,
+        produces=("abc",),
+        requires=frozenset(),
+    )
+
+    node2: GraphNode = GraphNode(
+        builder=lambda x: x + 1,
+        constraint=None,
+        produces=("cde",),
+        requires=frozenset({("x", "abc")}),
+    )
+
+    node3: GraphNode = GraphNode(
+        builder=lambda x: x + 2,
+        constraint=None,
+        produces=("efg",),
+        requires=frozenset({("x", "abc")}),
+    )
+
+    node4: GraphNode = GraphNode(
+        builder=lambda x, y: x + y,
+        constraint=None,
+        produces=("ghi",),
+        requires=frozenset({("x", "cde"), ("y", "efg")}),
+    )
+
+    waves = schedule_waves([node4, node3, node2, node1])
+
+    assert len(waves) == 3
+    assert waves[0] == [node1]
+    assert set(waves[1]) == {node2, node3}
+    assert waves[2] == [node4]
+
+
+def can_evaluate_waves_with_executor():
+    def produce_entities() -> tuple[int, int]:
+        return 1, 2
+
+    producer = GraphNode(
+        builder=produce_entities,
+        constraint=None,
+        produces=("entities/a", "entities/b"),
+        requires=frozenset(),
+    )
+
+    consumers = [
+        GraphNode(
+            builder=lambda entities, offset=idx: sum(entities.values()) + offset,
+            constraint=None,
+            produces=(f"result/{idx}",),
+            requires=frozenset({("entities", Prefix(value="entities/"))}),
+        )
+        for idx in range(8)
+    ]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        _, artifacts = evaluate([producer, *consumers], initial={}, executor=executor)
+
+    assert artifacts["entities/a"] == 1
+    assert artifacts["entities/b"] == 2
+
+    for idx in range(8):
+        assert artifacts[f"result/{idx}"] == 3 + idx
+
+
+def can_keep_serial_nodes_on_calling_thread():
+    threads: dict[str, int] = {}
+
+    def build(name: str) -> Callable[[int], int]:
+        def builder(counter: int) -> int:
+            threads[name] = get_ident()
+            return counter + 1
+
+        return builder
+
+    nodes = [
+        GraphNode(
+            builder=build(name),
+            constraint=None,
+            produces=(name,),
+            requires=frozenset({("counter", "core/counter")}),
+        )
+        for name in ("abc", "cde", "efg")
+    ]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        _, artifacts = evaluate(
+            nodes,
+            initial={"core/counter": 41},
+            executor=executor,
+            serial=frozenset({"core/counter"}),
+        )
+
+    assert artifacts["abc"] == 42
+    assert artifacts["cde"] == 42
+    assert artifacts["efg"] == 42
+    assert set(threads.values()) == {get_ident()}
+
+
+def can_reject_wrong_arity_with_executor():
+    node1: GraphNode = GraphNode(
+        builder=lambda x: x,
+        constraint=None,
+        produces=("abc", "cde"),
+        requires=frozenset({("x", "x")}),
+    )
+
+    node2: GraphNode = GraphNode(
+        builder=lambda x: x,
+        constraint=None,
+        produces=("efg",),
+        requires=frozenset({("x", "x")}),
+    )
+
+    with (
+        ThreadPoolExecutor(max_workers=2) as executor,
+        raises(InvalidDatasetArityError) as error,
+    ):
+        evaluate([node1, node2], initial={"x": 1}, executor=executor)
+
+    assert error.value.node is node1
+    assert error.value.expected == 2
+    assert error.value.actual == 1
+
+
+def can_evaluate_only_nodes_required_by_targets():
+    calls: list[str] = []
+
+    def build(name: str) -> Callable[..., str]:
+        def builder(**kwargs: Any) -> str:
+            calls.append(name)
+            return name
+
+        return builder
+
+    node1: GraphNode = GraphNode(
+        builder=build("abc"),
+        constraint=None,
+        produces=("abc",),
+        requires=frozenset(),
+    )
+
+    node2: GraphNode = GraphNode(
+        builder=build("cde"),
+        constraint=None,
+        produces=("cde",),
+        requires=frozenset(),
+    )
+
+    node3: GraphNode = GraphNode(
+        builder=build("efg"),
+        constraint=None,
+        produces=("efg",),
+        requires=frozenset({("x", "abc")}),
+    )
+
+    _, artifacts = evaluate([node1, node2, node3], initial={}, targets={"efg"})
+
+    assert artifacts == {"abc": "abc", "efg": "efg"}
+    assert calls == ["abc", "efg"]
+
+
+def can_find_closure_through_prefix_requirements():
+    producer = GraphNode(
+        builder=lambda: (1, 2),
+        constraint=None,
+        produces=("entities/a", "entities/b"),
+        requires=frozenset(),
+    )
+
+    unrelated = GraphNode(
+        builder=lambda: 3,
+        constraint=None,
+        produces=("others/c",),
+        requires=frozenset(),
+    )
+
+    consumer = GraphNode(
+        builder=lambda entities: len(entities),
+        constraint=None,
+        produces=("result",),
+        requires=frozenset({("entities", Prefix(value="entities/"))}),
+    )
+
+    closure = find_closure([producer, unrelated, consumer], {"result"})
+
+    assert closure == [producer, consumer]
+
+
+def can_find_empty_closure_for_unknown_target():
+    node: GraphNode = GraphNode(
+        builder=lambda: 42,
+        constraint=None,
+        produces=("abc",),
+        requires=frozenset(),
+    )
+
+    assert find_closure([node], {"xyz"}) == []
+
+
+def can_reuse_unchanged_nodes_in_session():
+    calls: list[str] = []
+
+    def double(source: int) -> int:
+        calls.append("double")
+        return source * 2
+
+    def negate(source: int) -> int:
+        calls.append("negate")
+        return -source
+
+    nodes = [
+        GraphNode(
+            builder=double,
+            constraint=None,
+            produces=("double",),
+            requires=frozenset({("source", "source/a")}),
+        ),
+        GraphNode(
+            builder=negate,
+            constraint=None,
+            produces=("negate",),
+            requires=frozenset({("source", "source/b")}),
+        ),
+    ]
+
+    session = GraphSession()
+
+    evaluate(nodes, initial={"source/a": 1, "source/b": 2}, session=session)
+    _, artifacts = evaluate(
+        nodes, initial={"source/a": 1, "source/b": 3}, session=session
+    )
+
+    assert sorted(calls) == ["double", "negate", "negate"]
+    assert artifacts["double"] == 2
+    assert artifacts["negate"] == -3
+
+
+def can_cut_off_downstream_nodes_when_result_is_equal():
+    calls: list[str] = []
+
+    def parity(source: int) -> int:
+        calls.append("parity")
+        return source % 2
+
+    def describe(parity: int) -> str:
+        calls.append("describe")
+        return "odd" if parity else "even"
+
+    nodes = [
+        GraphNode(
+            builder=parity,
+            constraint=None,
+            produces=("parity",),
+            requires=frozenset({("source", "source")}),
+        ),
+        GraphNode(
+            builder=describe,
+            constraint=None,
+            produces=("describe",),
+            requires=frozenset({("parity", "parity")}),
+        ),
+    ]
+
+    session = GraphSession()
+
+    evaluate(nodes, initial={"source": 1}, session=session)
+    _, artifacts = evaluate(nodes, initial={"source": 3}, session=session)
+
+    assert calls == ["parity", "describe", "parity"]
+    assert artifacts["describe"] == "odd"
+
+
+def can_rebuild_only_changed_keys_of_partitioned_node():
+    calls: list[set[str]] = []
+
+    def square(values: OneToOne[str, int]) -> OneToOne[str, int]:
+        calls.append(set(values.keys()))
+        return OneToOne[str, int].instance({k: v * v for k, v in values.items()})
+
+    node = GraphNode(
+        builder=square,
+        constraint=None,
+        produces=("squares",),
+        requires=frozenset({("values", "values")}),
+        partition="values",
+    )
+
+    session = GraphSession()
+    first = OneToOne[str, int].instance({"a": 1, "b": 2, "c": 3})
+    second = OneToOne[str, int].instance({"a": 1, "c": 4, "d": 5})
+
+    evaluate([node], initial={"values": first}, session=session)
+    _, artifacts = evaluate([node], initial={"values": second}, session=session)
+
+    assert calls == [{"a", "b", "c"}, {"c", "d"}]
+    assert list(artifacts["squares"].items()) == [("a", 1), ("c", 16), ("d", 25)]
+
+
+def can_restore_serial_state_of_reused_nodes():
+    calls: list[int] = []
+
+    def allocate(generator: Generator, source: int) -> int:
+        calls.append(source)
+        return generator.next() + source
+
+    node = GraphNode(
+        builder=allocate,
+        constraint=None,
+        produces=("allocated",),
+        requires=frozenset({("generator", "core/generator"), ("source", "source")}),
+    )
+
+    session = GraphSession()
+    serial = frozenset({"core/generator"})
+
+    for _ in range(2):
+        initial = {"core/generator": Generator(), "source": 10}
+        _, artifacts = evaluate([node], initial=initial, serial=serial, session=session)
+
+        assert artifacts["allocated"] == 11
+        assert artifacts["core/generator"].id == 1
+
+    assert calls == [10]
@@ -0,0 +1,64 @@
+import copy
+import pickle
+
+from pytest import raises
+
+from i13c.core.identifiers import Identifier
+
+
+class LeftId(Identifier):
+    __slots__ = ()
+
+
+class RightId(Identifier):
+    __slots__ = ()
+
+
+def can_create_identifiers():
+    assert LeftId(value=7) == LeftId(value=7)
+    assert LeftId(value=7).value == 7
+    assert repr(LeftId(value=7)) == "LeftId(value=7)"
+
+
+def can_distinguish_identifiers_of_different_kinds():
+    data = {LeftId(value=1): "left", RightId(value=1): "right"}
+
+    assert LeftId(value=1) != RightId(value=1)
+    assert data[RightId(value=1)] == "right"
+    assert len(data) == 2
+
+
+def can_keep_identifiers_across_copies():
+    value = LeftId(value=3)
+
+    assert pickle.loads(pickle.dumps(value)) == value
+    assert type(copy.deepcopy(value)) is LeftId
+    assert copy.deepcopy(value) == value
+
+
+def can_order_identifiers_of_same_kind():
+    assert LeftId(value=1) < LeftId(value=2)
+    assert sorted([LeftId(value=5), LeftId(value=3)]) == [
+        LeftId(value=3),
+        LeftId(value=5),
+    ]
+
+
+def can_reject_ordering_identifiers_of_different_kinds():
+    with raises(TypeError):
+        assert LeftId(value=1) < RightId(value=2)
+
+    with raises(TypeError):
+        assert LeftId(value=1) >= RightId(value=2)
+
+
+def can_reject_arithmetic_on_identifiers_of_different_kinds():
+    with raises(TypeError):
+        _ = LeftId(value=1) + RightId(value=2)
+
+    assert LeftId(value=1) + 2 == 3
+
+
+def can_treat_zero_identifier_as_present():
+    assert LeftId(value=0)
+    assert not hasattr(LeftId(value=0), "__dict__")
@@ -0,0 +1,115 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from i13c.core.graph import GraphNode, evaluate
+from i13c.core.profile import GraphProfiler, GraphSample, measure, tracing
+
+
+def can_measure_builder():
+    with tracing(GraphProfiler()):
+        dataset, sample = measure(("abc",), True, lambda value: [value] * 1000, value=7)
+
+    assert dataset == [7] * 1000
+    assert sample.produces == ("abc",)
+    assert sample.wall >= 0
+    assert sample.cpu >= 0
+    assert sample.peak > 0
+
+
+def can_measure_builder_without_memory():
+    dataset, sample = measure(("abc",), False, lambda value: [value] * 1000, value=7)
+
+    assert dataset == [7] * 1000
+    assert sample.peak == -1
+
+
+def can_profile_every_built_node():
+    nodes = [
+        GraphNode(
+            builder=lambda value: value + 1,
+            constraint=None,
+            produces=("next",),
+            requires=frozenset({("value", "value")}),
+        ),
+        GraphNode(
+            builder=lambda value: (value * 2, value * 3),
+            constraint=None,
+            produces=("double", "triple"),
+            requires=frozenset({("value", "next")}),
+        ),
+    ]
+
+    profiler = GraphProfiler()
+    _, artifacts = evaluate(nodes, initial={"value": 1}, profiler=profiler)
+
+    assert artifacts["triple"] == 6
+    assert [sample.produces for sample in profiler.samples] == [
+        ("next",),
+        ("double", "triple"),
+    ]
+
+    assert all(sample.size > 0 for sample in profiler.samples)
+
+
+def can_profile_nodes_evaluated_by_executor():
+    nodes = [
+        GraphNode(
+            builder=lambda value, offset=idx: value + offset,
+            constraint=None,
+            produces=(f"result/{idx}",),
+            requires=frozenset({("value", "value")}),
+        )
+        for idx in range(4)
+    ]
+
+    profiler = GraphProfiler()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        evaluate(nodes, initial={"value": 1}, executor=executor, profiler=profiler)
+
+    assert len(profiler.samples) == 4
+
+
+def can_export_chrome_trace():
+    profiler = GraphProfiler()
+
+    for idx, start in enumerate([10.0, 10.5]):
+        profiler.samples.append(
+            GraphSample(
+                produces=(f"node/{idx}",),
+                start=start,
+                wall=0.25,
+                cpu=0.125,
+                peak=64,
+                size=32,
+                pid=1,
+                tid=2,
+            )
+        )
+
+    events = profiler.to_chrome()["traceEvents"]
+
+    assert [event["name"] for event in events] == ["node/0", "node/1"]
+    assert [event["ts"] for event in events] == [0.0, 500000.0]
+    assert events[0]["dur"] == 250000.0
+    assert events[0]["args"] == {"cpu": 0.125, "peak": 64, "size": 32}
+
+
+def can_export_json():
+    profiler = GraphProfiler()
+    evaluate(
+        [
+            GraphNode(
+                builder=lambda value: value,
+                constraint=None,
+                produces=("copy",),
+                requires=frozenset({("value", "value")}),
+            )
+        ],
+        initial={"value": 1},
+        profiler=profiler,
+    )
+
+    nodes = profiler.to_json()["nodes"]
+
+    assert len(nodes) == 1
+    assert nodes[0]["produces"] == ("copy",)
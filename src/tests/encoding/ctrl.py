@@ -1,10 +1,10 @@
-
 from pytest import raises
 
 from i13c.encoding import DuplicateLabelError, MissingLabelError, encode
 from i13c.llvm.typing.flows import BlockId
 from i13c.llvm.typing.instructions import Instruction
 from i13c.llvm.typing.instructions.ctrl import Call, Jump, Label, Nop, Return, SysCall
+from i13c.llvm.typing.instructions.move import MovRegReg
 
 
 def can_encode_instructions_nop_twice():
@@ -18,6 +18,7 @@ def can_encode_instructions_nop_twice():
 
     assert bytecode == expected
 
+
 def can_encode_instructions_syscall():
     flow: list[Instruction] = [
         SysCall(),
@@ -37,11 +38,55 @@ def can_encode_instructions_jump_forward():
     ]
 
     bytecode = encode(flow)
-    expected = bytes([0xE9, 0x01, 0x00, 0x00, 0x00, 0x90])
+    expected = bytes([0xEB, 0x01, 0x90])
+
+    assert bytecode == expected
+
+
+def can_encode_instructions_jump_backward():
+    flow: list[Instruction] = [
+        Label(id=BlockId(value=1)),
+        Nop(),
+        Jump(target=BlockId(value=1)),
+    ]
+
+    bytecode = encode(flow)
+    expected = bytes([0x90, 0xEB, 0xFD])
 
     assert bytecode == expected
 
 
+def can_encode_instructions_jump_beyond_short_range():
+    flow: list[Instruction] = [
+        Jump(target=BlockId(value=1)),
+        *[Nop() for _ in range(128)],
+        Label(id=BlockId(value=1)),
+    ]
+
+    bytecode = encode(flow)
+    expected = bytes([0xE9, 0x80, 0x00, 0x00, 0x00] + [0x90] * 128)
+
+    assert bytecode == expected
+
+
+def can_encode_instructions_jump_growing_with_inner_jump():
+    # the outer jump fits only while the inner jump stays short
+    flow: list[Instruction] = [
+        Jump(target=BlockId(value=1)),
+        Jump(target=BlockId(value=2)),
+        *[Nop() for _ in range(124)],
+        Label(id=BlockId(value=1)),
+        *[Nop() for _ in range(130)],
+        Label(id=BlockId(value=2)),
+    ]
+
+    bytecode = encode(flow)
+
+    assert bytecode[:5] == bytes([0xE9, 0x81, 0x00, 0x00, 0x00])
+    assert bytecode[5:10] == bytes([0xE9, 0xFE, 0x00, 0x00, 0x00])
+    assert len(bytecode) == 10 + 124 + 130
+
+
 def can_encode_call_with_forward_relocation():
     flow: list[Instruction] = [
         Call(target=BlockId(value=1)),
@@ -66,7 +111,6 @@ def can_reject_call_to_missing_label():
     assert error.value.target > 0
 
 
-
 def can_reject_duplicate_labels():
     flow: list[Instruction] = [
         Label(id=BlockId(value=1)),
@@ -79,3 +123,18 @@ def can_reject_duplicate_labels():
 
     assert isinstance(error.value, DuplicateLabelError)
     assert error.value.target == 1
+
+
+def can_encode_repeated_instructions_between_labels():
+    flow: list[Instruction] = [
+        MovRegReg(dst=0, src=1),
+        Label(id=BlockId(value=1)),
+        MovRegReg(dst=0, src=1),
+        MovRegReg(dst=1, src=0),
+        Jump(target=BlockId(value=1)),
+    ]
+
+    bytecode = encode(flow)
+    expected = bytes([0x48, 0x89, 0xC8, 0x48, 0x89, 0xC8, 0x48, 0x89, 0xC1, 0xEB, 0xF8])
+
+    assert bytecode == expected
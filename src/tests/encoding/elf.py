@@ -1,14 +1,224 @@
-from i13c.encoding import elf
+from pytest import raises
+
+from i13c.encoding import assemble, elf
+from i13c.llvm.typing.flows import BlockId
+from i13c.llvm.typing.instructions.ctrl import Call, Label, Nop, Return
 
 
 def can_emit_elf():
     code = bytes([0x90, 0x90, 0x90])
     elf_binary = elf.emit(code)
 
+    # the code is the first and only segment
+    placement = elf.place_segments(elf.build_segments(code, b"", b"", 0))[0]
+
     assert elf_binary[0:4] == b"\x7fELF"
     assert elf_binary[4] == elf.ELFCLASS64
     assert elf_binary[5] == elf.ELFDATA2LSB
-    assert int.from_bytes(elf_binary[24:32], "little") == elf.ENTRY_POINT
+    assert int.from_bytes(elf_binary[24:32], "little") == placement.address
 
-    code_offset = elf.ELF_HEADER_SIZE + elf.PROGRAM_HEADER_SIZE
+    code_offset = placement.offset
     assert elf_binary[code_offset : code_offset + len(code)] == code
+
+
+def read_segments(binary: bytes) -> list[tuple[int, ...]]:
+    phnum = int.from_bytes(binary[56:58], "little")
+    segments: list[tuple[int, ...]] = []
+
+    for idx in range(phnum):
+        start = elf.ELF_HEADER_SIZE + idx * elf.PROGRAM_HEADER_SIZE
+        header = binary[start : start + elf.PROGRAM_HEADER_SIZE]
+
+        # flags, offset, vaddr, filesz, memsz, align
+        segments.append(
+            (
+                int.from_bytes(header[4:8], "little"),
+                *(
+                    int.from_bytes(header[at : at + 8], "little")
+                    for at in (8, 16, 32, 40, 48)
+                ),
+            )
+        )
+
+    return segments
+
+
+def can_emit_elf_single_page_aligned_segment():
+    binary = elf.emit(bytes([0x90, 0xC3]))
+    size = elf.ELF_HEADER_SIZE + elf.PROGRAM_HEADER_SIZE + 2
+
+    assert read_segments(binary) == [
+        (elf.PF_R | elf.PF_X, 0, elf.ELF_BASE_ADDR, size, size, elf.PAGE_SIZE)
+    ]
+
+
+def can_emit_elf_with_rodata_and_data_segments():
+    code, rodata, data = bytes([0x90, 0xC3]), b"0123456789abcdef", b"\x01\x02"
+    binary = elf.emit(code, 1, rodata=rodata, data=data, bss=0x20)
+
+    # text maps the headers, the rest starts on fresh pages
+    text = elf.ELF_HEADER_SIZE + 3 * elf.PROGRAM_HEADER_SIZE + len(code)
+
+    assert read_segments(binary) == [
+        (elf.PF_R | elf.PF_X, 0x0000, 0x400000, text, text, 0x1000),
+        (elf.PF_R, 0x1000, 0x401000, 16, 16, 0x1000),
+        (elf.PF_R | elf.PF_W, 0x2000, 0x402000, 2, 0x22, 0x1000),
+    ]
+
+    entry = elf.ELF_BASE_ADDR + text - len(code) + 1
+    assert int.from_bytes(binary[24:32], "little") == entry
+
+    assert binary[0x1000:0x1010] == rodata
+    assert binary[0x2000:] == data
+
+
+def can_place_segments_for_addressing_data():
+    segments = elf.build_segments(bytes(0x1000), b"", b"\x00", 0)
+    placements = elf.place_segments(segments)
+
+    # the data segment follows right after the pages of the code
+    assert [entry.address for entry in placements] == [0x4000B0, 0x402000]
+
+
+def read_sections(binary: bytes) -> dict[bytes, tuple[int, bytes]]:
+    shoff = int.from_bytes(binary[40:48], "little")
+    shnum = int.from_bytes(binary[60:62], "little")
+    shstrndx = int.from_bytes(binary[62:64], "little")
+
+    headers = [
+        binary[shoff + idx * 64 : shoff + (idx + 1) * 64] for idx in range(shnum)
+    ]
+
+    def content(header: bytes) -> bytes:
+        offset = int.from_bytes(header[24:32], "little")
+        size = int.from_bytes(header[32:40], "little")
+        return binary[offset : offset + size]
+
+    names = content(headers[shstrndx])
+    sections: dict[bytes, tuple[int, bytes]] = {}
+
+    for header in headers[1:]:
+        start = int.from_bytes(header[0:4], "little")
+        name = names[start : names.index(b"\x00", start)]
+        sections[name] = (int.from_bytes(header[4:8], "little"), content(header))
+
+    return sections
+
+
+def can_emit_object_sections():
+    module = assemble([Label(id=BlockId(value=1)), Nop(), Return()])
+    binary = elf.emit_object(module, {1: b"_start"})
+
+    assert binary[0:4] == b"\x7fELF"
+    assert int.from_bytes(binary[16:18], "little") == elf.ET_REL
+    assert int.from_bytes(binary[56:58], "little") == 0
+
+    sections = read_sections(binary)
+
+    assert list(sections) == [
+        b".text",
+        b".symtab",
+        b".strtab",
+        b".rela.text",
+        b".shstrtab",
+    ]
+
+    assert sections[b".text"] == (elf.SHT_PROGBITS, bytes([0x90, 0xC3]))
+    assert sections[b".strtab"] == (elf.SHT_STRTAB, b"\x00_start\x00")
+    assert sections[b".rela.text"] == (elf.SHT_RELA, b"")
+
+
+def can_emit_object_symbols_and_relocations():
+    module = assemble(
+        [
+            Label(id=BlockId(value=1)),
+            Call(target=BlockId(value=9)),
+            Label(id=BlockId(value=2)),
+            Return(),
+        ]
+    )
+
+    binary = elf.emit_object(module, {1: b"_start", 9: b"exit"})
+    sections = read_sections(binary)
+
+    _, symtab = sections[b".symtab"]
+    _, rela = sections[b".rela.text"]
+
+    # null, section, _start and the undefined exit
+    assert len(symtab) == 4 * elf.SYMBOL_SIZE
+
+    exit = symtab[3 * elf.SYMBOL_SIZE : 4 * elf.SYMBOL_SIZE]
+    assert exit[4] == elf.STB_GLOBAL << 4
+    assert int.from_bytes(exit[6:8], "little") == elf.SHN_UNDEF
+
+    assert int.from_bytes(rela[0:8], "little") == 1
+    assert int.from_bytes(rela[8:16], "little") == 3 << 32 | elf.R_X86_64_PLT32
+    assert int.from_bytes(rela[16:24], "little", signed=True) == -4
+
+
+def can_emit_object_with_local_symbols():
+    module = assemble(
+        [
+            Label(id=BlockId(value=1)),
+            Call(target=BlockId(value=9)),
+            Label(id=BlockId(value=2)),
+            Return(),
+        ]
+    )
+
+    binary = elf.emit_object(module, {1: b"main", 2: b"helper", 9: b"exit"}, {1})
+    sections = read_sections(binary)
+
+    _, symtab = sections[b".symtab"]
+    symbols = [
+        symtab[idx : idx + elf.SYMBOL_SIZE]
+        for idx in range(0, len(symtab), elf.SYMBOL_SIZE)
+    ]
+
+    # null, section and helper are local, main and the undefined exit global
+    assert [symbol[4] >> 4 for symbol in symbols] == [
+        elf.STB_LOCAL,
+        elf.STB_LOCAL,
+        elf.STB_LOCAL,
+        elf.STB_GLOBAL,
+        elf.STB_GLOBAL,
+    ]
+
+    # locals are not visible to other modules
+    _, names = elf.read_object(binary)
+    assert sorted(names.values()) == [b"exit", b"main"]
+
+
+def can_detect_object_relocation_without_symbol():
+    module = assemble([Call(target=BlockId(value=9)), Return()])
+
+    with raises(elf.MissingSymbolError) as error:
+        elf.emit_object(module, {})
+
+    assert error.value.target == 9
+
+
+def can_read_emitted_object():
+    module = assemble(
+        [
+            Label(id=BlockId(value=1)),
+            Call(target=BlockId(value=9)),
+            Label(id=BlockId(value=2)),
+            Return(),
+        ]
+    )
+
+    binary = elf.emit_object(module, {1: b"_start", 9: b"exit"})
+    loaded, symbols = elf.read_object(binary)
+
+    assert loaded.code == module.code
+    assert symbols == {2: b"_start", 3: b"exit"}
+    assert [(label.target, label.offset) for label in loaded.labels.values()] == [
+        (2, 0)
+    ]
+    assert [(entry.target, entry.offset) for entry in loaded.relocations] == [(3, 1)]
+
+
+def can_detect_reading_executable_as_object():
+    with raises(elf.UnsupportedObjectError):
+        elf.read_object(elf.emit(bytes([0x90])))
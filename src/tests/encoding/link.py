@@ -0,0 +1,72 @@
+from pytest import raises
+
+from i13c.encoding import assemble, elf
+from i13c.encoding.link import DuplicateSymbolError, UndefinedSymbolError, link
+from i13c.llvm.typing.flows import BlockId
+from i13c.llvm.typing.instructions.ctrl import Call, Label, Nop, Return
+
+
+def can_link_call_across_modules():
+    main = assemble(
+        [
+            Label(id=BlockId(value=1)),
+            Call(target=BlockId(value=9)),
+            Return(),
+        ]
+    )
+
+    helper = assemble([Label(id=BlockId(value=4)), Nop(), Return()])
+    image = link(
+        [(main, {1: b"_start", 9: b"helper"}), (helper, {4: b"helper"})], b"_start"
+    )
+
+    # helper starts aligned at 16, the call ends at 5
+    expected = bytes([0xE8, 0x0B, 0x00, 0x00, 0x00, 0xC3] + [0xCC] * 10 + [0x90, 0xC3])
+
+    assert image.code == expected
+    assert image.entry == 0
+
+
+def can_link_entry_in_later_module():
+    helper = assemble([Label(id=BlockId(value=4)), Return()])
+    main = assemble([Label(id=BlockId(value=1)), Call(target=BlockId(value=4))])
+
+    image = link(
+        [(helper, {4: b"helper"}), (main, {1: b"_start", 4: b"helper"})], b"_start"
+    )
+
+    # backward call from 16 + 5 to 0
+    assert image.entry == 16
+    assert image.code[16:] == bytes([0xE8, 0xEB, 0xFF, 0xFF, 0xFF])
+
+
+def can_link_objects_read_back():
+    main = assemble([Label(id=BlockId(value=1)), Call(target=BlockId(value=9))])
+    helper = assemble([Label(id=BlockId(value=4)), Return()])
+
+    objects = [
+        elf.read_object(elf.emit_object(main, {1: b"_start", 9: b"helper"})),
+        elf.read_object(elf.emit_object(helper, {4: b"helper"})),
+    ]
+
+    image = link(objects, b"_start")
+    assert image.code[0:5] == bytes([0xE8, 0x0B, 0x00, 0x00, 0x00])
+
+
+def can_detect_undefined_symbol():
+    main = assemble([Label(id=BlockId(value=1)), Call(target=BlockId(value=9))])
+
+    with raises(UndefinedSymbolError) as error:
+        link([(main, {1: b"_start", 9: b"helper"})], b"_start")
+
+    assert error.value.name == b"helper"
+
+
+def can_detect_duplicate_symbol():
+    first = assemble([Label(id=BlockId(value=1)), Return()])
+    second = assemble([Label(id=BlockId(value=2)), Return()])
+
+    with raises(DuplicateSymbolError) as error:
+        link([(first, {1: b"_start"}), (second, {2: b"_start"})], b"_start")
+
+    assert error.value.name == b"_start"
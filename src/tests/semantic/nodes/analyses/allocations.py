@@ -357,6 +357,32 @@ def can_detect_allocations_with_forced_spill_all_clobbered():
     assert isinstance(allocations.values[1], ParameterAcceptance)
 
 
+def can_detect_allocations_with_forced_spill_of_cheaper_value():
+    _, analyses = prepare_analyses("""
+        asm foo(a@rax: u8, b@rbx: u8, c@rcx: u8)
+            clobbers rdi, rsi, rdx, rcx, r8, r9, r10, r11, r12, r13, r14, r15, rbx, rax
+        {
+        }
+
+        fn main(a: u8, b: u8) {
+            foo(a, a, 0x13);
+            foo(a, a, 0x14);
+            foo(a, b, 0x15);
+        }
+    """)
+
+    assert analyses.allocations is not None
+    assert analyses.allocations.size() == 1
+    _, allocations = analyses.allocations.peek()
+
+    # the frequently used value keeps the only free register
+    assert allocations.colors == {0: 10}
+    assert allocations.spills == {1: 0}
+
+    assert isinstance(allocations.values[0], ParameterAcceptance)
+    assert isinstance(allocations.values[1], ParameterAcceptance)
+
+
 def can_detect_allocations_with_value_surviving_a_call():
     _, analyses = prepare_analyses("""
         asm foo() clobbers rdi { }
@@ -437,3 +463,51 @@ def can_detect_allocations_with_value_surviving_a_call_of_regular_function():
         # colors are assigned backwards
         assert allocations.colors[0] == 0
         assert allocations.colors[1] == 9
+
+
+def can_detect_linear_allocations_with_value_surviving_a_call():
+    _, analyses = prepare_analyses(
+        """
+        asm foo() clobbers rdi { }
+        fn main(abc: u8) { val x: u8 = abc; foo(); val y: u8 = x; }
+    """,
+        allocator="linear",
+    )
+
+    assert analyses.allocations is not None
+    assert analyses.allocations.size() == 1
+    _, allocations = analyses.allocations.peek()
+
+    assert len(allocations.values) == 5
+    assert len(allocations.spills) == 0
+
+    # the clobbered register is avoided while the value stays alive
+    assert allocations.colors[0] == 0
+    assert allocations.colors[1] == 1
+
+
+def can_detect_linear_allocations_with_forced_spill():
+    _, analyses = prepare_analyses(
+        """
+        asm foo(a@rax: u8, b@rbx: u8, c@rcx: u8)
+            clobbers rdi, rsi, rdx, rcx, r8, r9, r10, r11, r12, r13, r14, r15, rbx, rax
+        {
+        }
+
+        fn main(a: u8, b: u8) {
+            foo(a,b, 0x13);
+            val c: u8 = 0x14;
+            val d: u8 = 0x15;
+            foo(a,c,d);
+        }
+    """,
+        allocator="linear",
+    )
+
+    assert analyses.allocations is not None
+    assert analyses.allocations.size() == 1
+    _, allocations = analyses.allocations.peek()
+
+    # only rbp survives the calls, values arriving later are spilled
+    assert allocations.colors == {1: 10, 17: 10}
+    assert allocations.spills == {0: 0, 19: 1}
@@ -1,4 +1,3 @@
-
 from tests.semantic.nodes.analyses import prepare_analyses
 
 
@@ -29,6 +28,7 @@ def can_detect_calls_with_asm_callsite_using_literal():
         f"call {asmlet.identify(1)}",
     ]
 
+
 def can_detect_calls_with_asm_callsite_using_parameter():
     _, analyses = prepare_analyses("""
         asm foo(x@rax: u8) { }
@@ -103,7 +103,9 @@ def can_detect_calls_with_asm_callsite_with_inverted_params():
     asmlet, _ = analyses.asmlets.peek()
 
     assert call.listing() == [
-        "xchg rsi, rdi",
+        "mov r11, rsi",
+        "mov rsi, rdi",
+        "mov rdi, r11",
         f"call {asmlet.identify(1)}",
     ]
 
@@ -144,8 +146,31 @@ def can_detect_calls_with_asm_callsite_with_three_params():
     asmlet, _ = analyses.asmlets.peek()
 
     assert call.listing() == [
-        "xchg rdi, rdx",
-        "xchg rsi, rdx",
+        "mov r11, rdi",
+        "mov rdi, rdx",
+        "mov rdx, rsi",
+        "mov rsi, r11",
+        f"call {asmlet.identify(1)}",
+    ]
+
+
+def can_detect_calls_with_asm_callsite_exchanging_without_scratch():
+    _, analyses = prepare_analyses("""
+        asm foo(x@rsi: u8, y@rdi: u8, z@r11: u8) { }
+        fn main(x: u8, y: u8, z: u8) { foo(z, y, x); }
+    """)
+
+    assert analyses.calls is not None
+    assert analyses.calls.size() == 1
+    _, call = analyses.calls.peek()
+
+    assert analyses.asmlets is not None
+    assert analyses.asmlets.size() == 1
+    asmlet, _ = analyses.asmlets.peek()
+
+    assert call.listing() == [
+        "mov r11, rdx",
+        "xchg rsi, rdi",
         f"call {asmlet.identify(1)}",
     ]
 
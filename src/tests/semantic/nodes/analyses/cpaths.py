@@ -1,3 +1,12 @@
+from i13c.semantic.typing.analyses.cflows import (
+    ControlFlows,
+    FlowEntry,
+    FlowExit,
+    FlowMember,
+)
+from i13c.semantic.typing.analyses.cpaths import ControlPathView
+from i13c.semantic.typing.entities.functions import FunctionId
+from i13c.syntax.source import Span
 from tests.semantic.nodes.analyses import prepare_analyses
 
 
@@ -62,3 +71,36 @@ def can_detect_cpath_with_two_callsites():
         cpaths.flows.source.entry,
         cpaths.flows.source.exit,
     )
+
+
+def can_bound_cpaths_of_many_branches():
+    # a chain of 20 diamonds has over a million paths
+    forward: dict[int, list[int]] = {}
+
+    for idx in range(0, 60, 3):
+        forward[idx] = [idx + 1, idx + 2]
+        forward[idx + 1] = [idx + 3]
+        forward[idx + 2] = [idx + 3]
+
+    nodes: list[FlowMember] = [FlowEntry(value=idx) for idx in range(60)]
+    nodes.append(FlowExit(value=60))
+
+    flows = ControlFlows(
+        ref=Span(offset=0, length=0),
+        entry=0,
+        exit=60,
+        target=FunctionId(value=1),
+        nodes=nodes,
+        forward=forward,
+        backward={},
+    )
+
+    view = ControlPathView(flows=flows, limit=10)
+
+    assert view.cache is None
+    assert len(view) == 10
+    assert view.truncated()
+
+    assert view[0][0] == 0
+    assert view[0][-1] == 60
+    assert len(view[0]) == 41
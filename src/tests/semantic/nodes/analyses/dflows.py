@@ -42,9 +42,10 @@ def can_detect_dflow_with_unused_parameter():
     assert len(dflows.forward) == 1
     assert len(dflows.backward) == 1
 
-    assert isinstance(dflows.values[0], ParameterAcceptance)
-    assert dflows.values[0].name == b"x"
-    assert dflows.values[0].type.name == b"u8"
+    value = dflows.values[0]
+    assert isinstance(value, ParameterAcceptance)
+    assert value.name == b"x"
+    assert value.type.name == b"u8"
 
     assert len(dflows.nodes) == 2
     assert len(dflows.defs) == 2
@@ -71,8 +72,9 @@ def can_detect_dflow_with_a_callsite_using_literal():
     assert len(dflows.forward) == 1
     assert len(dflows.backward) == 1
 
-    assert isinstance(dflows.values[0], Calling)
-    assert dflows.values[0].signature.name == b"foo"
+    value = dflows.values[0]
+    assert isinstance(value, Calling)
+    assert value.signature.name == b"foo"
 
     assert dflows.forward[0] == []
     assert dflows.backward[0] == []
@@ -226,12 +228,14 @@ def can_detect_dflow_with_an_assignment_using_literal():
     assert len(dflows.forward) == 2
     assert len(dflows.backward) == 2
 
-    assert isinstance(dflows.values[0], ValueAcceptance)
-    assert dflows.values[0].name == b"x"
-    assert dflows.values[0].type.name == b"u8"
+    variable = dflows.values[0]
+    assert isinstance(variable, ValueAcceptance)
+    assert variable.name == b"x"
+    assert variable.type.name == b"u8"
 
-    assert isinstance(dflows.values[1], LiteralAcceptance)
-    assert str(dflows.values[1].target) == "0x42"
+    literal = dflows.values[1]
+    assert isinstance(literal, LiteralAcceptance)
+    assert str(literal.target) == "0x42"
 
     assert dflows.forward[0] == []
     assert dflows.backward[0] == [1]
@@ -419,3 +423,24 @@ def can_detect_dflow_with_an_assignment_using_value():
 
     assert dflows.defs[2] == [2]
     assert dflows.uses[2] == [0]
+
+
+def can_lookup_dflow_values_by_id():
+    _, analyses = prepare_analyses("""
+        asm foo(x@rbx: u8) { }
+        fn bar(x: u8) { val y: u8 = x; foo(y); foo(x); }
+    """)
+
+    assert analyses.dflows is not None
+    _, dflows = analyses.dflows.peek()
+
+    for idx, node in enumerate(dflows.values):
+        if isinstance(node, (ParameterAcceptance, ValueAcceptance)):
+            assert dflows.values.get(node.id) == idx
+            assert dflows.values.find(node.id) == idx
+
+    callings = [
+        idx for idx, node in enumerate(dflows.values) if isinstance(node, Calling)
+    ]
+
+    assert [dflows.backward[idx] for idx in callings] == [[1], [0]]
@@ -1,10 +1,18 @@
+from pathlib import Path
+
+from i13c.core.graph import GraphSession, expand, narrow
+from i13c.graph.nodes import run
+from i13c.semantic.nodes.analyses.liveness import configure_liveness
 from i13c.semantic.typing.analyses.callings import Calling, CallingClobber
 from i13c.semantic.typing.analyses.cflows import FlowNode
 from i13c.semantic.typing.resolutions.literals import LiteralAcceptance
 from i13c.semantic.typing.resolutions.parameters import ParameterAcceptance
 from i13c.semantic.typing.resolutions.values import ValueAcceptance
+from tests.semantic import prepare_program
 from tests.semantic.nodes.analyses import prepare_analyses
 
+HELLO = Path(__file__).parents[5] / "data" / "hello.i13c"
+
 
 def can_detect_liveness_in_empty_function():
     _, analyses = prepare_analyses("""
@@ -350,3 +358,30 @@ def can_detect_liveness_with_of_assigned_value():
 
     assert liveness.live_in[3] == set()
     assert liveness.live_out[3] == set()
+
+
+def can_rebuild_liveness_only_of_function_calling_changed_snippet():
+    code = HELLO.read_text()
+    session = GraphSession()
+
+    _, program = prepare_program(code)
+    run(program, session=session)
+
+    # liveness of the first build, the edit below records a new one
+    record = session.find(configure_liveness())
+    assert record is not None
+
+    _, program = prepare_program(code.replace("mov rdx, 0x11", "mov rdx, 0x12"))
+    artifacts = run(program, session=session).data
+
+    node = configure_liveness()
+    args = {name: expand(req, artifacts) for name, req in node.requires}
+    narrowed = narrow(node, record, args)
+
+    assert narrowed is not None
+    changed, _ = narrowed
+
+    functions = artifacts["resolutions/functions/accepted"]
+    names = {functions.get(fid).signature.name for fid in changed}
+
+    assert names == {b"print"}
@@ -165,3 +165,28 @@ def can_handle_a_missing_callsite():
     """)
 
     assert analyses.noreturns is None
+
+
+def can_detect_a_function_noreturn_true_in_recursive_group():
+    _, analyses = prepare_analyses("""
+        asm exit() noreturn { }
+        fn main() { ping(); }
+        fn ping() { exit(); pong(); }
+        fn pong() { ping(); }
+    """)
+
+    assert analyses.noreturns is not None
+    assert analyses.noreturns.size() == 4
+
+    paths = {
+        entry.signature.name: [item.name for item in entry.path]
+        for entry in analyses.noreturns.values()
+        if entry.outcome
+    }
+
+    assert paths == {
+        b"exit": [],
+        b"main": [b"ping", b"exit"],
+        b"ping": [b"exit"],
+        b"pong": [b"ping", b"exit"],
+    }
@@ -94,11 +94,19 @@ def can_detect_shuffles_with_asm_callsite_with_inverted_params():
     _, shuffles = analyses.shuffles.peek()
 
     assert len(shuffles.callsites) == 1
-    assert len(shuffles.callsites[0].moves) == 1
+    assert len(shuffles.callsites[0].moves) == 3
 
-    assert isinstance(shuffles.callsites[0].moves[0], ShuffleExchange)
-    assert shuffles.callsites[0].moves[0].src == b"rdi"
-    assert shuffles.callsites[0].moves[0].dst == b"rsi"
+    assert isinstance(shuffles.callsites[0].moves[0], ShuffleMove)
+    assert shuffles.callsites[0].moves[0].src == b"rsi"
+    assert shuffles.callsites[0].moves[0].dst == b"r11"
+
+    assert isinstance(shuffles.callsites[0].moves[1], ShuffleMove)
+    assert shuffles.callsites[0].moves[1].src == b"rdi"
+    assert shuffles.callsites[0].moves[1].dst == b"rsi"
+
+    assert isinstance(shuffles.callsites[0].moves[2], ShuffleMove)
+    assert shuffles.callsites[0].moves[2].src == b"r11"
+    assert shuffles.callsites[0].moves[2].dst == b"rdi"
 
 
 def can_detect_shuffles_with_asm_callsite_with_shifted_params():
@@ -133,18 +141,64 @@ def can_detect_shuffles_with_asm_callsite_with_three_params():
     assert analyses.shuffles.size() == 1
     _, shuffles = analyses.shuffles.peek()
 
+    assert len(shuffles.callsites) == 1
+    assert len(shuffles.callsites[0].moves) == 4
+
+    assert [
+        (move.src, move.dst)
+        for move in shuffles.callsites[0].moves
+        if isinstance(move, ShuffleMove)
+    ] == [
+        (b"rdi", b"r11"),
+        (b"rdx", b"rdi"),
+        (b"rsi", b"rdx"),
+        (b"r11", b"rsi"),
+    ]
+
+
+def can_detect_shuffles_with_asm_callsite_exchanging_without_scratch():
+    _, analyses = prepare_analyses("""
+        asm foo(x@rsi: u8, y@rdi: u8, z@r11: u8) { }
+        fn main(x: u8, y: u8, z: u8) { foo(z, y, x); }
+    """)
+
+    assert analyses.shuffles is not None
+    assert analyses.shuffles.size() == 1
+    _, shuffles = analyses.shuffles.peek()
+
     assert len(shuffles.callsites) == 1
     assert len(shuffles.callsites[0].moves) == 2
 
-    assert isinstance(shuffles.callsites[0].moves[0], ShuffleExchange)
+    assert isinstance(shuffles.callsites[0].moves[0], ShuffleMove)
     assert shuffles.callsites[0].moves[0].src == b"rdx"
-    assert shuffles.callsites[0].moves[0].dst == b"rdi"
+    assert shuffles.callsites[0].moves[0].dst == b"r11"
 
     assert isinstance(shuffles.callsites[0].moves[1], ShuffleExchange)
-    assert shuffles.callsites[0].moves[1].src == b"rdx"
+    assert shuffles.callsites[0].moves[1].src == b"rdi"
     assert shuffles.callsites[0].moves[1].dst == b"rsi"
 
 
+def can_detect_shuffles_with_asm_callsite_with_literal_overwriting_source():
+    _, analyses = prepare_analyses("""
+        asm foo(x@rsi: u8, y@rdi: u8) { }
+        fn main(x: u8) { foo(x, 0x01); }
+    """)
+
+    assert analyses.shuffles is not None
+    assert analyses.shuffles.size() == 1
+    _, shuffles = analyses.shuffles.peek()
+
+    assert len(shuffles.callsites) == 1
+    assert len(shuffles.callsites[0].moves) == 2
+
+    assert isinstance(shuffles.callsites[0].moves[0], ShuffleMove)
+    assert shuffles.callsites[0].moves[0].src == b"rdi"
+    assert shuffles.callsites[0].moves[0].dst == b"rsi"
+
+    assert isinstance(shuffles.callsites[0].moves[1], ShuffleImmediate)
+    assert shuffles.callsites[0].moves[1].dst == b"rdi"
+
+
 def can_detect_shuffles_with_asm_callsite_with_same_params():
     _, analyses = prepare_analyses("""
         asm foo(x@rdi: u8, y@rsi: u8, z@rdx: u8) { }
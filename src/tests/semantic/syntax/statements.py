@@ -9,3 +9,39 @@ def can_visit_statements() -> None:
     )
 
     assert len(list(visitor.graph.function.statements.items())) == 1
+
+
+def can_keep_statement_ids_of_other_functions() -> None:
+    before = parse_syntax_graph(
+        """
+            fn foo() { val x: u8 = 0x12; }
+            fn main() { val y: u8 = 0x34; }
+        """
+    )
+
+    after = parse_syntax_graph(
+        """
+            fn foo() { val x: u8 = 0x12; val z: u8 = 0x56; }
+            fn main() { val y: u8 = 0x34; }
+        """
+    )
+
+    ids = [nid for nid, _ in before.graph.function.statements.items()]
+    changed = [nid for nid, _ in after.graph.function.statements.items()]
+
+    assert len(changed) == 3
+    assert changed[0] == ids[0]
+    assert changed[2] == ids[1]
+
+
+def can_separate_statement_ids_of_duplicate_functions() -> None:
+    visitor = parse_syntax_graph(
+        """
+            fn main() { val x: u8 = 0x12; }
+            fn main() { val x: u8 = 0x12; }
+        """
+    )
+
+    ids = [nid for nid, _ in visitor.graph.function.statements.items()]
+
+    assert len(set(ids)) == 2
@@ -1,6 +1,8 @@
+from pathlib import Path
+
 from i13c.core import result
-from i13c.syntax.lexing import Token, Tokens, tokenize
-from i13c.syntax.source import open_text
+from i13c.syntax.lexing import Token, Tokens, TokenStream, tokenize
+from i13c.syntax.source import open_file, open_text
 
 
 def can_tokenize_few_tokens():
@@ -394,3 +396,106 @@ def can_reject_ident_followed_by_invalid_character():
     assert diagnostic.ref.offset == 5
     assert diagnostic.ref.length == 1
     assert diagnostic.code == "E1002"
+
+
+def can_tokenize_dot_at_end_of_file():
+    code = open_text("abc.")
+    tokens = tokenize(code)
+
+    assert isinstance(tokens, result.Ok)
+    assert len(tokens.value) == 3
+
+    assert tokens.value[0] == Token(code=Tokens.IDENT, offset=0, length=3)
+    assert tokens.value[1] == Token(code=Tokens.DOT, offset=3, length=1)
+    assert tokens.value[2] == Token(code=Tokens.EOF, offset=4, length=0)
+
+
+def can_distinguish_keywords_from_identifiers_with_same_prefix():
+    code = open_text("asm asmx fn fn_1")
+    tokens = tokenize(code)
+
+    assert isinstance(tokens, result.Ok)
+    assert [token.code for token in tokens.value] == [
+        Tokens.KEYWORD,
+        Tokens.IDENT,
+        Tokens.KEYWORD,
+        Tokens.IDENT,
+        Tokens.EOF,
+    ]
+
+
+def can_reject_hex_followed_by_uppercase_digit():
+    code = open_text("0x12AB")
+    tokens = tokenize(code)
+
+    assert isinstance(tokens, result.Err)
+    diagnostics = tokens.error
+
+    assert len(diagnostics) == 1
+    diagnostic = diagnostics[0]
+
+    assert diagnostic.ref.offset == 4
+    assert diagnostic.code == "E1002"
+
+
+def can_store_tokens_in_columns():
+    code = open_text("fn abc;")
+    tokens = tokenize(code)
+
+    assert isinstance(tokens, result.Ok)
+    stream = tokens.value
+
+    assert list(stream.codes) == [
+        Tokens.KEYWORD,
+        Tokens.IDENT,
+        Tokens.SEMICOLON,
+        Tokens.EOF,
+    ]
+
+    assert list(stream.offsets) == [0, 3, 6, 7]
+    assert list(stream.lengths) == [2, 3, 1, 0]
+
+
+def can_materialize_token_views():
+    tokens = [
+        Token(code=Tokens.IDENT, offset=0, length=3),
+        Token(code=Tokens.EOF, offset=3, length=0),
+    ]
+
+    stream = TokenStream.of(tokens)
+
+    assert len(stream) == 2
+    assert stream[0] == tokens[0]
+    assert stream[-1] == tokens[1]
+    assert list(stream) == tokens
+
+
+def can_tokenize_mapped_file(tmp_path: Path):
+    path = tmp_path / "main.i13c"
+    path.write_bytes(b"fn main() {}")
+
+    code = open_file(str(path))
+    tokens = tokenize(code)
+
+    assert isinstance(tokens, result.Ok)
+    assert [token.code for token in tokens.value] == [
+        Tokens.KEYWORD,
+        Tokens.IDENT,
+        Tokens.ROUND_OPEN,
+        Tokens.ROUND_CLOSE,
+        Tokens.CURLY_OPEN,
+        Tokens.CURLY_CLOSE,
+        Tokens.EOF,
+    ]
+
+    assert code.extract(tokens.value[1]) == b"main"
+
+
+def can_tokenize_empty_file(tmp_path: Path):
+    path = tmp_path / "empty.i13c"
+    path.write_bytes(b"")
+
+    tokens = tokenize(open_file(str(path)))
+
+    assert isinstance(tokens, result.Ok)
+    assert [token.code for token in tokens.value] == [Tokens.EOF]
@@ -0,0 +1,84 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from i13c.core import result
+from i13c.syntax.units import find_sources, open_sources, parse_files
+
+
+def write_sources(root: Path, files: dict[str, str]) -> list[str]:
+    paths: list[str] = []
+
+    for name, text in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+        paths.append(str(path))
+
+    return paths
+
+
+def can_merge_programs_of_all_files(tmp_path: Path):
+    paths = write_sources(
+        tmp_path,
+        {
+            "a.i13c": "fn main() noreturn { exit(0x2a); }",
+            "b.i13c": "asm exit(code@rdi: u64) noreturn { mov rax, 0x3c; syscall; }",
+        },
+    )
+
+    sources = open_sources(paths)
+    program = parse_files(sources)
+
+    assert isinstance(program, result.Ok)
+    assert [entry.signature.name for entry in program.value.functions] == [b"main"]
+    assert [entry.signature.name for entry in program.value.snippets] == [b"exit"]
+
+    # spans of the second file are placed after the first one
+    snippet = program.value.snippets[0]
+    assert sources.locate(snippet.ref.offset).path == paths[1]
+    assert snippet.ref.offset == sources.files[1].base + 4
+
+
+def can_attribute_diagnostics_to_files(tmp_path: Path):
+    paths = write_sources(
+        tmp_path,
+        {
+            "a.i13c": "fn main() noreturn { exit(0x2a); }",
+            "b.i13c": "fn broken(",
+            "c.i13c": "fn other() { ? }",
+        },
+    )
+
+    sources = open_sources(paths)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        outcome = parse_files(sources, executor)
+
+    assert isinstance(outcome, result.Err)
+    assert [entry.code for entry in outcome.error] == ["E2000", "E1000"]
+
+    located = [sources.locate(entry.ref.offset) for entry in outcome.error]
+    assert [entry.path for entry in located] == paths[1:]
+
+    # the end of file remains within the file it belongs to
+    assert outcome.error[0].ref.offset - located[0].base == len(b"fn broken(")
+
+
+def can_find_sources_in_directories(tmp_path: Path):
+    write_sources(
+        tmp_path,
+        {
+            "lib/b.i13c": "",
+            "lib/a.i13c": "",
+            "lib/notes.txt": "",
+            "main.i13c": "",
+        },
+    )
+
+    paths = find_sources([str(tmp_path / "main.i13c"), str(tmp_path / "lib")])
+
+    assert paths == [
+        str(tmp_path / "main.i13c"),
+        str(tmp_path / "lib" / "a.i13c"),
+        str(tmp_path / "lib" / "b.i13c"),
+    ]